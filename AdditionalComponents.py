@@ -1,5 +1,11 @@
+import multiprocessing
 import queue
 import math
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
 
 
 class Polygon:
@@ -96,3 +102,136 @@ class QueueSet:
 
     def __len__(self):
         return len(self.set)
+
+
+def timed_call(function, *args, **kwargs):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Zavolá funkciu a zmeria čas jej behu. Funkcia je definovaná na úrovni modulu, aby ju bolo možné použiť aj v procese.
+
+    :return: dvojica (výsledok funkcie, čas behu v sekundách)
+    """
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def call_with_shared_array(function, memory_name, shape, dtype, *args):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vykonávaná v procese. Pripojí sa k zdieľanej pamäti s poľom a zavolá funkciu s týmto poľom ako prvým argumentom.
+    Pole nie je kopírované, funkcia preto nesmie vrátiť jeho pohľad.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param function:    funkcia definovaná na úrovni modulu
+    :param memory_name: názov zdieľanej pamäte
+    :param shape:       tvar poľa
+    :param dtype:       typ prvkov poľa
+    :param args:        ďalšie argumenty funkcie
+    :return: výsledok funkcie
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        return function(np.ndarray(shape, dtype=dtype, buffer=memory.buf), *args)
+    finally:
+        memory.close()
+
+
+class WorkerPool:
+    def __init__(self, kind='thread', max_workers=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Dlhodobo bežiaca skupina vlákien alebo procesov, ktorým sú zadávané úlohy. Vlákna nie sú vytvárané pri každom
+        prepočítaní, ale sú použité opakovane. Počet súčasne bežiacich úloh je obmedzený počtom pracovníkov. Pre každú
+        úlohu je zaznamenaný čas jej behu.
+        Procesy môžu vykonávať len funkcie a argumenty, ktoré je možné serializovať (nie tkinter objekty). Procesy sú
+        spúšťané cez spawn, každý pri štarte znova načíta hlavný modul programu (GraphApp ako __mp_main__) a moduly
+        komponentov. Tieto moduly importujú keras až vo funkciách, ktoré ho používajú, procesy preto TensorFlow
+        nenačítavajú. Veľké polia je vhodné odovzdať cez run_with_shared_array namiesto serializácie.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__kind:       'thread' alebo 'process'
+        :var self.__executor:   executor z concurrent.futures, ktorý vykonáva úlohy
+        :var self.__task_times: dict, ku každému názvu úlohy je priradený čas jej posledného behu v sekundách
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param kind:        typ pracovníkov, 'thread' alebo 'process'
+        :param max_workers: maximálny počet pracovníkov, None znamená predvolený počet podľa počtu procesorov
+        """
+        self.__kind = kind
+        if kind == 'thread':
+            self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='worker')
+        elif kind == 'process':
+            # Hlavný proces má načítaný TensorFlow a bežia v ňom vlákna, fork by mohol skončiť uviaznutím. Procesy sú
+            # preto spúšťané cez spawn.
+            self.__executor = ProcessPoolExecutor(max_workers=max_workers,
+                                                  mp_context=multiprocessing.get_context('spawn'))
+        else:
+            raise Exception("Worker pool: unknown kind '{}'".format(kind))
+        self.__task_times = dict()
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zadanie úlohy. Výsledkom future je dvojica (výsledok funkcie, čas behu).
+        """
+        return self.__executor.submit(timed_call, function, *args, **kwargs)
+
+    def run_with_shared_array(self, function, array, *args):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vykoná funkciu s poľom ako prvým argumentom a počká na výsledok. Pole je jedným kopírovaním presunuté do
+        zdieľanej pamäte, proces dostane len jej názov, tvar a typ poľa. Pole sa tak neserializuje a neposiela cez
+        rúru procesu. Po skončení úlohy je zdieľaná pamäť uvoľnená.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param function: funkcia definovaná na úrovni modulu, prvým argumentom je pole
+        :param array:    NumPy pole, nemusí byť súvislé v pamäti
+        :param args:     ďalšie argumenty funkcie
+        :return: dvojica (výsledok funkcie, čas behu)
+        """
+        memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        try:
+            np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[...] = array
+            return self.submit(call_with_shared_array, function, memory.name, array.shape, array.dtype.str,
+                               *args).result()
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def run_tasks(self, tasks: list):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zadá všetky úlohy naraz a počká na ich dokončenie. Zaznamená čas behu každej úlohy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param tasks: list trojíc (názov úlohy, funkcia, tuple argumentov)
+        :return: dict, v ktorom je ku každému názvu úlohy priradený jej výsledok
+        """
+        futures = [(task_name, self.submit(function, *args)) for task_name, function, args in tasks]
+        results = dict()
+        for task_name, future in futures:
+            results[task_name], self.__task_times[task_name] = future.result()
+        return results
+
+    def shutdown(self, wait=False):
+        self.__executor.shutdown(wait=wait)
+
+    @property
+    def kind(self):
+        return self.__kind
+
+    @property
+    def task_times(self):
+        return self.__task_times
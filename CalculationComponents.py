@@ -0,0 +1,983 @@
+import hashlib
+import multiprocessing
+import queue
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from AdditionalComponents import QueueSet
+from DimensionReductionComponents import t_SNE_worker
+
+
+def linear(x):
+    return x
+
+
+def relu(x):
+    return np.maximum(x, 0)
+
+
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def softmax(x):
+    exponent = np.exp(x - np.max(x, axis=-1, keepdims=True))
+    return exponent / np.sum(exponent, axis=-1, keepdims=True)
+
+
+def softplus(x):
+    return np.logaddexp(0, x)
+
+
+def softsign(x):
+    return x / (1 + np.abs(x))
+
+
+def elu(x):
+    return np.where(x > 0, x, np.expm1(np.minimum(x, 0)))
+
+
+def selu(x):
+    return 1.0507009873554805 * np.where(x > 0, x, 1.6732632423543772 * np.expm1(np.minimum(x, 0)))
+
+
+def swish(x):
+    return x * sigmoid(x)
+
+
+# Aktivačné funkcie, ktoré dokáže NumPy engine vypočítať bez keras modelu. Kľúčom je názov funkcie v configu vrstvy.
+NUMPY_ACTIVATIONS = {'linear': linear, 'relu': relu, 'sigmoid': sigmoid, 'tanh': np.tanh, 'softmax': softmax,
+                     'softplus': softplus, 'softsign': softsign, 'elu': elu, 'selu': selu, 'exponential': np.exp,
+                     'swish': swish}
+
+
+class NumpyDenseLayer:
+    def __init__(self, weights, biases, activation):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vrstva Dense počítaná v NumPy. Výstup je počítaný z kópie váh, aby pri zmene váh posuvníkom počas výpočtu
+        zodpovedal výsledok presne váham, ktoré sú uložené ako použité.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__weights:    referencia na pole váh vrstvy, menené posuvníkmi
+        :var self.__biases:     referencia na pole biasov vrstvy, alebo None ak vrstva bias nemá
+        :var self.__activation: aktivačná funkcia vrstvy
+        """
+        self.__weights = weights
+        self.__biases = biases
+        self.__activation = activation
+
+    def get_parameters_copy(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti kópiu aktuálnych váh a biasov vrstvy.
+        """
+        biases = None if self.__biases is None else self.__biases.copy()
+        return self.__weights.copy(), biases
+
+    def pre_activation(self, layer_input, weights, biases):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Výpočet vnútorného potenciálu neurónov vrstvy. Počíta sa v presnosti float64, aby sa pri postupnom pripočítavaní
+        zmien nehromadila chyba.
+        """
+        output = np.matmul(layer_input, weights, dtype=np.float64)
+        if biases is not None:
+            output += biases
+        return output
+
+    def __call__(self, layer_input):
+        return self.__activation(self.pre_activation(layer_input, self.__weights, self.__biases))
+
+    @property
+    def weights(self):
+        return self.__weights
+
+    @property
+    def biases(self):
+        return self.__biases
+
+    @property
+    def activation(self):
+        return self.__activation
+
+    @property
+    def is_elementwise(self):
+        # Softmax závisí od všetkých neurónov vrstvy, zmena jedného neurónu preto mení výstup celej vrstvy.
+        return self.__activation is not softmax
+
+
+class ActivationEngine:
+    def __init__(self, use_numpy=True, check_parity=False):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Počíta aktivácie jednotlivých vrstiev neurónovej siete. Pre každú vrstvu si pamätá naposledy vypočítaný výstup.
+        Pri zmene váh na vrstve tak nie je potrebné počítať celú sieť od vstupu, ale výpočet začne od zmenenej vrstvy
+        a ako jej vstup použije už vypočítaný výstup predchádzajúcej vrstvy. Predpokladá sa sekvenčný model, kde je
+        vstupom vrstvy výstup vrstvy s o jedna menším poradovým číslom.
+        Ak nie je k dispozícií žiadna uložená aktivácia, sú všetky potrebné vrstvy vypočítané jedným prechodom
+        viacvýstupového modelu.
+
+        Vrstvy typu Dense, Activation, Dropout a InputLayer môžu byť počítané priamo v NumPy z polí váh, ktoré menia
+        posuvníky. Tým sa obíde réžia TensorFlow pri každom volaní. Váhy sú do keras modelu zapísané až vtedy, keď ich
+        keras potrebuje (výpočet nepodporovanej vrstvy, uloženie modelu).
+
+        Pri vrstvách Dense je uložený aj vnútorný potenciál neurónov a váhy, z ktorých bol vypočítaný. Posuvník oznámi,
+        ktorú váhu alebo bias zmenil. Zmena váhy w_ij mení potenciál len neurónu j, ktorý je upravený pripočítaním
+        zmeny v čase O(N) namiesto prepočítania celej vrstvy. Výstup vrstvy je upravený na mieste len v stĺpci
+        neurónu j, o zmene informuje verzia aktivácie.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__keras_model:       načítaný keras model
+        :var self.__keras_layers:      vrstvy načítaného keras modelu
+        :var self.__number_of_layers:  počet vrstiev modelu
+        :var self.__layer_parameters:  list dvojíc (váhy, biasy) pre každú vrstvu. Ide o referencie na polia, ktoré
+                                       menia posuvníky v NeuralLayer.
+        :var self.__numpy_layers:      list funkcií, ktoré vypočítajú výstup vrstvy v NumPy. Pre vrstvy, ktoré NumPy
+                                       engine nepodporuje, je hodnota None a je použitý keras.
+        :var self.__use_numpy:         určuje, či sa má NumPy engine používať
+        :var self.__check_parity:      ak je True, sú pri načítaní modelu NumPy vrstvy porovnané s keras vrstvami
+        :var self.__stale_keras_layers: poradové čísla vrstiev, ktorých váhy ešte neboli zapísané do keras modelu
+        :var self.__input_batches:     dict vstupných dát, kľúčom je názov dávky (napr. vstupné body, body mriežky)
+        :var self.__layer_activations: dict, v ktorom je ku každej dávke priradený list aktivácií. Na indexe i je vstup
+                                       do vrstvy i, teda výstup vrstvy i - 1. Na indexe 0 sú vstupné dáta. Neplatná
+                                       alebo ešte nevypočítaná aktivácia má hodnotu None.
+        :var self.__pre_activations:   dict, v ktorom je ku každej dávke priradený list vnútorných potenciálov vrstiev
+                                       Dense počítaných v NumPy. Na indexe i je potenciál vrstvy i.
+        :var self.__used_parameters:   dict, v ktorom je ku každej dávke priradený list kópií váh a biasov, z ktorých
+                                       bol vypočítaný uložený potenciál vrstvy. Pri úprave jedného neurónu je v kópii
+                                       zmenená len upravená hodnota.
+        :var self.__activation_versions: dict, v ktorom je ku každej dávke priradený list verzií aktivácií. Verzia sa
+                                         mení pri každom výpočte aj pri každej úprave aktivácie na mieste.
+        :var self.__last_version:      naposledy pridelená verzia, verzie sú jedinečné pre všetky dávky aj modely
+        :var self.__multi_output_model: model, ktorého výstupmi sú výstupy všetkých vrstiev až po najvyššiu aktívnu
+                                        vrstvu. Vytvára sa len pri zmene aktívnych vrstiev.
+        :var self.__highest_active_layer: najvyššie poradové číslo aktívnej vrstvy, pre ktoré bol vytvorený
+                                          viacvýstupový model
+        :var self.__lock:              zámok, aktivácie sú počítané z monitorovacieho aj z hlavného vlákna
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param use_numpy:    ak je True, podporované vrstvy sú počítané v NumPy
+        :param check_parity: ak je True, NumPy vrstvy sú pri načítaní modelu porovnané s keras vrstvami
+        """
+        self.__keras_model = None
+        self.__keras_layers = list()
+        self.__number_of_layers = 0
+        self.__layer_parameters = list()
+        self.__numpy_layers = list()
+        self.__use_numpy = use_numpy
+        self.__check_parity = check_parity
+        self.__stale_keras_layers = set()
+        self.__input_batches = dict()
+        self.__layer_activations = dict()
+        self.__pre_activations = dict()
+        self.__used_parameters = dict()
+        self.__activation_versions = dict()
+        self.__last_version = 0
+        self.__multi_output_model = None
+        self.__highest_active_layer = 0
+        self.__lock = threading.RLock()
+
+    def initialize(self, model: 'keras.Model', layer_parameters: list):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Nastavenie nového modelu. Všetky vstupné dáta a uložené aktivácie sú zahodené. Pre každú vrstvu je zistené, či
+        ju dokáže vypočítať NumPy engine.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param model:            načítaný keras model
+        :param layer_parameters: list dvojíc (váhy, biasy) pre každú vrstvu modelu
+        :return: názvy vrstiev, ktorých NumPy výpočet sa nezhodoval s keras a sú počítané pomocou keras
+        """
+        with self.__lock:
+            self.__keras_model = model
+            self.__keras_layers = list(model.layers)
+            self.__number_of_layers = len(self.__keras_layers)
+            self.__layer_parameters = layer_parameters
+            self.__stale_keras_layers = set()
+            self.__input_batches = dict()
+            self.__layer_activations = dict()
+            self.__pre_activations = dict()
+            self.__used_parameters = dict()
+            self.__activation_versions = dict()
+            self.__multi_output_model = None
+            self.__highest_active_layer = 0
+            self.__numpy_layers = [self.create_numpy_layer(i) for i in range(self.__number_of_layers)]
+            if self.__check_parity:
+                return self.check_numpy_parity()
+            return []
+
+    def create_numpy_layer(self, layer_number: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vytvorí funkciu, ktorá vypočíta výstup vrstvy v NumPy. Ak vrstvu nie je možné vypočítať v NumPy, vráti None.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy v keras modeli
+        """
+        # keras je importovaný až tu a pri vytváraní viacvýstupového modelu. Modul je načítaný aj v procesoch
+        # spúšťaných cez spawn, ktoré TensorFlow nepotrebujú.
+        from tensorflow import keras
+
+        keras_layer = self.__keras_layers[layer_number]
+        if isinstance(keras_layer, (keras.layers.InputLayer, keras.layers.Dropout)):
+            return linear
+
+        # Vlastné aktivačné funkcie nie sú v configu uložené ako reťazec, takú vrstvu musí počítať keras.
+        activation_name = keras_layer.get_config().get('activation')
+        if not isinstance(activation_name, str) or activation_name not in NUMPY_ACTIVATIONS:
+            return None
+        activation = NUMPY_ACTIVATIONS[activation_name]
+        if isinstance(keras_layer, keras.layers.Activation):
+            return activation
+        if isinstance(keras_layer, keras.layers.Dense):
+            weights, biases = self.__layer_parameters[layer_number]
+            if weights is None:
+                return None
+            return NumpyDenseLayer(weights, biases, activation)
+        return None
+
+    def check_numpy_parity(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Porovná výstupy vrstiev počítaných v NumPy s výstupmi keras vrstiev na náhodných vstupoch. Vrstvy, pri ktorých
+        sa výsledky líšia, sú ďalej počítané pomocou keras.
+
+        :return: názvy vrstiev, pri ktorých sa výsledky líšili
+        """
+        random_generator = np.random.default_rng(0)
+        mismatched_layers = []
+        for i, numpy_layer in enumerate(self.__numpy_layers):
+            if numpy_layer is None or numpy_layer is linear:
+                continue
+            probe = random_generator.standard_normal((16, self.__keras_layers[i].input_shape[-1])).astype(np.float32)
+            keras_output = self.__keras_layers[i](probe).numpy()
+            if not np.allclose(numpy_layer(probe), keras_output, rtol=1e-4, atol=1e-5):
+                mismatched_layers.append(self.__keras_layers[i].name)
+                self.__numpy_layers[i] = None
+        return mismatched_layers
+
+    def set_active_layers(self, active_layers: list):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Nastavenie aktívnych vrstiev. Ak sa zmenila najvyššia aktívna vrstva, je vytvorený nový viacvýstupový model,
+        ktorý jedným prechodom vypočíta výstupy všetkých vrstiev až po ňu. Výstupy vrstiev medzi aktívnymi vrstvami sú
+        vypočítané aj tak, preto sú tiež súčasťou výstupu a sú uložené pre neskorší výpočet od zmenenej vrstvy.
+        Ak sú všetky tieto vrstvy počítané v NumPy, model nie je potrebný.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param active_layers: poradové čísla zobrazovaných vrstiev
+        """
+        with self.__lock:
+            highest_active_layer = max(active_layers, default=0)
+            if highest_active_layer == self.__highest_active_layer:
+                return
+            self.__highest_active_layer = highest_active_layer
+            if highest_active_layer > 0 and not self.is_numpy_prefix(highest_active_layer):
+                from tensorflow import keras
+
+                outputs = [self.__keras_layers[i].output for i in range(highest_active_layer)]
+                self.__multi_output_model = keras.Model(inputs=self.__keras_model.input, outputs=outputs)
+            else:
+                self.__multi_output_model = None
+
+    def is_numpy_prefix(self, layer_number: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zistí, či sú všetky vrstvy pod zadanou vrstvou počítané v NumPy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy
+        """
+        return self.__use_numpy and all(layer is not None for layer in self.__numpy_layers[:layer_number])
+
+    def set_input(self, batch_name: str, input_data):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Nastavenie vstupných dát pre dávku. Uložené aktivácie dávky sú zahodené. Ak sú vstupné dáta None, dávka je
+        odstránená.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param batch_name: názov dávky
+        :param input_data: vstupné dáta v tvare (počet bodov, počet vstupov)
+        """
+        with self.__lock:
+            if input_data is None:
+                self.__input_batches.pop(batch_name, None)
+                self.__layer_activations.pop(batch_name, None)
+                self.__pre_activations.pop(batch_name, None)
+                self.__used_parameters.pop(batch_name, None)
+                self.__activation_versions.pop(batch_name, None)
+                return
+            input_data = np.asarray(input_data, dtype=np.float32)
+            self.__input_batches[batch_name] = input_data
+            activations = [None] * max(self.__number_of_layers, 1)
+            activations[0] = input_data
+            self.__layer_activations[batch_name] = activations
+            self.__pre_activations[batch_name] = [None] * self.__number_of_layers
+            self.__used_parameters[batch_name] = [None] * self.__number_of_layers
+            self.__activation_versions[batch_name] = [self.next_version() for _ in activations]
+
+    def next_version(self):
+        self.__last_version += 1
+        return self.__last_version
+
+    def weights_changed(self, layer_number: int, changed_parameters=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Spracovanie zmeny váh na vrstve. Ak je vrstva počítaná v NumPy, zápis váh do keras modelu je odložený, inak sú
+        váhy zapísané hneď. Ak je známe, ktoré váhy a biasy sa zmenili, je výstup vrstvy upravený len pre ich neuróny.
+        Inak sú zneplatnené všetky aktivácie, ktoré od vrstvy závisia.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number:       poradové číslo vrstvy, na ktorej došlo k zmene váh
+        :param changed_parameters: množina zmenených parametrov ('weight', i, j) a ('bias', j), None ak nie je známe,
+                                   čo sa zmenilo
+        """
+        with self.__lock:
+            numpy_layer = self.__numpy_layers[layer_number]
+            if self.__use_numpy and numpy_layer is not None:
+                self.__stale_keras_layers.add(layer_number)
+            else:
+                self.set_layer_weights_and_biases(layer_number)
+                self.invalidate_from(layer_number)
+                return
+
+            for batch_name in self.__layer_activations:
+                if changed_parameters is None or \
+                        not self.update_changed_neurons(batch_name, layer_number, changed_parameters):
+                    self.invalidate_batch_from(batch_name, layer_number)
+
+    def update_changed_neurons(self, batch_name: str, layer_number: int, changed_parameters):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zmena váhy w_ij mení na vrstve Dense len potenciál neurónu j. K nemu je pripočítaná zmena váhy vynásobená
+        vstupom i, pri zmene biasu b_j samotná zmena biasu. Každá zmena je teda úprava jedného stĺpca v čase O(N).
+        Výstup vrstvy je prepočítaný na mieste len pre zmenené neuróny a aktivácie vyšších vrstiev sú zneplatnené.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param batch_name:         názov dávky
+        :param layer_number:       poradové číslo vrstvy, na ktorej došlo k zmene váh
+        :param changed_parameters: množina zmenených parametrov ('weight', i, j) a ('bias', j)
+        :return: True ak boli zmeny aplikované, False ak je potrebné vrstvu prepočítať celú
+        """
+        numpy_layer = self.__numpy_layers[layer_number]
+        activations = self.__layer_activations[batch_name]
+        pre_activation = self.__pre_activations[batch_name][layer_number]
+        used_parameters = self.__used_parameters[batch_name][layer_number]
+        if not isinstance(numpy_layer, NumpyDenseLayer) or not numpy_layer.is_elementwise or \
+                pre_activation is None or layer_number + 1 >= len(activations) or \
+                activations[layer_number] is None or activations[layer_number + 1] is None:
+            return False
+        used_weights, used_biases = used_parameters
+        if used_biases is None and any(parameter[0] == 'bias' for parameter in changed_parameters):
+            return False
+
+        layer_input = activations[layer_number]
+        changed_neurons = set()
+        for parameter in changed_parameters:
+            # Hodnota je prečítaná raz, posuvník ju môže medzitým znova zmeniť. Ďalšia zmena príde ako nový signál.
+            if parameter[0] == 'weight':
+                _, start_neuron, end_neuron = parameter
+                value = numpy_layer.weights[start_neuron, end_neuron]
+                delta = np.float64(value) - np.float64(used_weights[start_neuron, end_neuron])
+                used_weights[start_neuron, end_neuron] = value
+                if delta != 0:
+                    pre_activation[:, end_neuron] += delta * layer_input[:, start_neuron]
+            else:
+                _, end_neuron = parameter
+                value = numpy_layer.biases[end_neuron]
+                delta = np.float64(value) - np.float64(used_biases[end_neuron])
+                used_biases[end_neuron] = value
+                if delta != 0:
+                    pre_activation[:, end_neuron] += delta
+            if delta != 0:
+                changed_neurons.add(end_neuron)
+        if len(changed_neurons) == 0:
+            return True
+
+        changed_neurons = sorted(changed_neurons)
+        activations[layer_number + 1][:, changed_neurons] = numpy_layer.activation(pre_activation[:, changed_neurons])
+        self.__activation_versions[batch_name][layer_number + 1] = self.next_version()
+        self.invalidate_batch_from(batch_name, layer_number + 1)
+        return True
+
+    def set_layer_weights_and_biases(self, layer_number: int):
+        # Nastvaenie hodnôt a biasu priamo do keras modelu.
+        layer_weights, layer_biases = self.__layer_parameters[layer_number]
+        self.__keras_layers[layer_number].set_weights([np.array(layer_weights), np.array(layer_biases)])
+        self.__stale_keras_layers.discard(layer_number)
+
+    def synchronize_keras_weights(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zapíše do keras modelu váhy všetkých vrstiev, pri ktorých bol zápis odložený.
+        """
+        with self.__lock:
+            for layer_number in list(self.__stale_keras_layers):
+                self.set_layer_weights_and_biases(layer_number)
+
+    def invalidate_from(self, layer_number: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zneplatní aktivácie, ktoré závisia od váh zadanej vrstvy. Ide o aktivácie všetkých vrstiev s vyšším poradovým
+        číslom.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy, na ktorej došlo k zmene váh
+        """
+        with self.__lock:
+            for batch_name in self.__layer_activations:
+                self.invalidate_batch_from(batch_name, layer_number)
+
+    def invalidate_batch_from(self, batch_name: str, layer_number: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zneplatní aktivácie jednej dávky, ktoré závisia od váh zadanej vrstvy, spolu s uloženými potenciálmi vrstiev.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param batch_name:   názov dávky
+        :param layer_number: poradové číslo vrstvy, na ktorej došlo k zmene váh
+        """
+        activations = self.__layer_activations[batch_name]
+        for i in range(max(layer_number + 1, 1), len(activations)):
+            activations[i] = None
+        for i in range(max(layer_number, 0), self.__number_of_layers):
+            self.__pre_activations[batch_name][i] = None
+            self.__used_parameters[batch_name][i] = None
+
+    def get_activation(self, batch_name: str, layer_number: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti aktiváciu dávky pre zadanú vrstvu. Výpočet začne od najbližšej nižšej vrstvy, ktorej aktivácia je ešte
+        platná. Každá vypočítaná aktivácia je uložená pre ďalšie použitie.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param batch_name:   názov dávky
+        :param layer_number: poradové číslo vrstvy, ktorej vstup chceme získať
+        :return: aktivácie v tvare (počet bodov, počet neurónov), alebo None ak dávka neexistuje
+        """
+        with self.__lock:
+            activations = self.__layer_activations.get(batch_name)
+            if activations is None:
+                return None
+
+            # Nájdenie najbližšej nižšej vrstvy s platnou aktiváciou. Vstupná vrstva je platná vždy.
+            valid_layer = layer_number
+            while activations[valid_layer] is None:
+                valid_layer -= 1
+
+            # Ak nie je uložená žiadna aktivácia, sú všetky vrstvy po najvyššiu aktívnu vypočítané naraz.
+            if valid_layer == 0 and 0 < layer_number <= self.__highest_active_layer and \
+                    self.__multi_output_model is not None:
+                self.calculate_all_layers(batch_name)
+                valid_layer = layer_number
+
+            # Postupný výpočet ďalších vrstiev, výstup jednej vrstvy je vstupom ďalšej.
+            for i in range(valid_layer + 1, layer_number + 1):
+                activations[i] = self.forward_layer(i - 1, activations[i - 1], batch_name)
+                self.__activation_versions[batch_name][i] = self.next_version()
+            return activations[layer_number]
+
+    def get_activation_version(self, batch_name: str, layer_number: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti verziu naposledy vrátenej aktivácie dávky pre zadanú vrstvu. Rovnaká verzia znamená rovnaké hodnoty.
+        """
+        with self.__lock:
+            versions = self.__activation_versions.get(batch_name)
+            return None if versions is None else versions[layer_number]
+
+    def calculate_all_layers(self, batch_name: str):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Výpočet výstupov všetkých vrstiev až po najvyššiu aktívnu vrstvu jedným prechodom viacvýstupového modelu.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param batch_name: názov dávky
+        """
+        with self.__lock:
+            self.synchronize_keras_weights()
+            activations = self.__layer_activations[batch_name]
+            outputs = self.__multi_output_model.predict(activations[0])
+            # Pri jednom výstupe vracia keras priamo pole, nie list.
+            if self.__highest_active_layer == 1:
+                outputs = [outputs]
+            for i, output in enumerate(outputs):
+                activations[i + 1] = output
+                self.__activation_versions[batch_name][i + 1] = self.next_version()
+
+    def forward_layer(self, keras_layer_number: int, layer_input, batch_name=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Výpočet výstupu jednej vrstvy. Ak je to možné, je použitý NumPy engine, inak keras vrstva. Pri vrstve Dense
+        počítanej v NumPy je pre dávku uložený aj potenciál neurónov a použité váhy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param keras_layer_number: poradové číslo vrstvy v keras modeli
+        :param layer_input:        vstup vrstvy
+        :param batch_name:         názov dávky, pre ktorú sa má uložiť potenciál neurónov
+        """
+        numpy_layer = self.__numpy_layers[keras_layer_number]
+        if self.__use_numpy and isinstance(numpy_layer, NumpyDenseLayer) and batch_name is not None:
+            weights, biases = numpy_layer.get_parameters_copy()
+            pre_activation = numpy_layer.pre_activation(layer_input, weights, biases)
+            self.__pre_activations[batch_name][keras_layer_number] = pre_activation
+            self.__used_parameters[batch_name][keras_layer_number] = (weights, biases)
+            output = numpy_layer.activation(pre_activation)
+            # Lineárna aktivácia vracia priamo potenciál. Výstup je upravovaný na mieste, preto musí byť samostatné pole.
+            if output is pre_activation:
+                output = pre_activation.copy()
+            return output
+        if self.__use_numpy and numpy_layer is not None:
+            return numpy_layer(layer_input)
+        if keras_layer_number in self.__stale_keras_layers:
+            self.set_layer_weights_and_biases(keras_layer_number)
+        return self.__keras_layers[keras_layer_number](layer_input).numpy()
+
+    @property
+    def number_of_layers(self):
+        return self.__number_of_layers
+
+    @property
+    def use_numpy(self):
+        return self.__use_numpy
+
+    @use_numpy.setter
+    def use_numpy(self, value):
+        with self.__lock:
+            self.__use_numpy = value
+            # Pri vypnutí NumPy enginu musí mať keras model aktuálne váhy a môže byť potrebný viacvýstupový model.
+            if not value:
+                self.synchronize_keras_weights()
+            highest_active_layer = self.__highest_active_layer
+            self.__highest_active_layer = -1
+            self.set_active_layers([highest_active_layer])
+
+
+class ChangeScheduler:
+    def __init__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zhromažďuje zmeny váh na vrstvách a odovzdáva ich monitorovaciemu vláknu. Každá zmena zvýši generáciu. Výpočet
+        začatý pre staršiu generáciu je zastaraný, pretože medzitým prišla novšia zmena, a jeho výsledky už nemá zmysel
+        zobrazovať. Výpočty preto priebežne testujú, či ich generácia ešte platí, a ak nie, skončia.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__changed_layer_q: zásobnik s unikátnymi id zmenených vrstiev. ID predstavuje poradové číslo vrstvy
+        :var self.__changed_parameters: dict, ku každej zmenenej vrstve je priradená množina zmenených váh a biasov,
+                                        alebo None ak nie je známe, čo sa na vrstve zmenilo
+        :var self.__condition_var:   podmienková premenná, signalizujúca zmenu a potrebu preopočítania súradníc
+        :var self.__generation:      poradové číslo poslednej zmeny
+        :var self.__processed_generation: generácia, ktorej spracovanie monitorovacie vlákno naposledy dokončilo
+        :var self.__is_running:      značí, či ešte program beží
+        """
+        self.__changed_layer_q = QueueSet()
+        self.__changed_parameters = dict()
+        self.__condition_var = threading.Condition()
+        self.__generation = 0
+        self.__processed_generation = 0
+        self.__is_running = True
+
+    def signal_change(self, layer_number: int, changed_parameter=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Pridá do zásobníku zmien poradové číslo vrstvy a zvýši generáciu, čím sú prebiehajúce výpočty zastarané.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number:      poradové číslo vrstvy, na ktorej došlo k zmene váh
+        :param changed_parameter: zmenená váha ('weight', i, j) alebo bias ('bias', j), None ak nie je známe, čo sa
+                                  zmenilo
+        """
+        with self.__condition_var:
+            if layer_number not in self.__changed_parameters:
+                self.__changed_parameters[layer_number] = set()
+            if changed_parameter is None:
+                self.__changed_parameters[layer_number] = None
+            elif self.__changed_parameters[layer_number] is not None:
+                self.__changed_parameters[layer_number].add(changed_parameter)
+            self.__changed_layer_q.add(layer_number)
+            self.__generation += 1
+            self.__condition_var.notify()
+
+    def wait_for_changes(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Čaká, kým sa neobjaví zmena. Potom vyprázdni zásobník a vráti zmenené vrstvy spolu s aktuálnou generáciou.
+
+        :return: trojica (zoradený list zmenených vrstiev, generácia, dict zmenených parametrov pre každú vrstvu), alebo
+                 None ak beh programu skončil
+        """
+        with self.__condition_var:
+            while self.__is_running and len(self.__changed_layer_q) == 0:
+                self.__condition_var.wait()
+            if not self.__is_running:
+                return None
+            changed_layers = sorted(self.__changed_layer_q)
+            changed_parameters = self.__changed_parameters
+            self.__changed_layer_q.clear()
+            self.__changed_parameters = dict()
+            return changed_layers, self.__generation, changed_parameters
+
+    def is_stale(self, generation: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zistí, či od začatia výpočtu pre zadanú generáciu prišla novšia zmena.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation: generácia, pre ktorú bol výpočet začatý
+        """
+        return generation != self.__generation
+
+    def mark_processed(self, generation: int):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Označí generáciu ako spracovanú, výsledky zmien po nej vrátane sú zobrazené alebo bežia na pozadí.
+        """
+        self.__processed_generation = generation
+
+    def stop(self):
+        with self.__condition_var:
+            self.__is_running = False
+            self.__condition_var.notify_all()
+
+    @property
+    def is_running(self):
+        return self.__is_running
+
+    @property
+    def has_pending_changes(self):
+        return self.__processed_generation != self.__generation
+
+
+class EmbeddingCache:
+    def __init__(self, max_size=16):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Cache výsledkov redukcie priestoru adresovaná obsahom. Kľúčom je hash aktivácií a parametrov metódy, rovnaké
+        aktivácie s rovnakými parametrami (napr. návrat k predchádzajúcim váham) tak nemusia byť počítané znova.
+        Pri prekročení veľkosti je odstránený najdlhšie nepoužitý záznam.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__max_size: maximálny počet uložených výsledkov
+        :var self.__entries:  OrderedDict, v ktorom sú záznamy zoradené od najdlhšie nepoužitého
+        :var self.__lock:     zámok, cache je používaná z viacerých vlákien
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param max_size: maximálny počet uložených výsledkov
+        """
+        self.__max_size = max_size
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def make_key(data, parameters: dict):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vytvorí kľúč z tvaru, typu a obsahu dát a zo zoradených parametrov.
+        """
+        data = np.ascontiguousarray(data)
+        key_hash = hashlib.blake2b(digest_size=20)
+        key_hash.update(repr((data.shape, data.dtype.str, sorted(parameters.items()))).encode())
+        key_hash.update(data.data)
+        return key_hash.hexdigest()
+
+    def get(self, key):
+        with self.__lock:
+            result = self.__entries.get(key)
+            if result is not None:
+                self.__entries.move_to_end(key)
+            return result
+
+    def put(self, key, value):
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+
+class BackgroundTSNE:
+    def __init__(self, report_iterations=25, max_workers=2, listen_timeout=0.5):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Počíta t-SNE v procesoch, ktoré bežia počas celého behu programu, aby výpočet neblokoval aplikáciu. Procesy sú
+        spúšťané cez spawn podľa potreby, najviac max_workers, a vykonávajú funkciu t_SNE_worker
+        z DimensionReductionComponents. Úlohy sú rozlíšené kľúčom (napr. vrstvou). Úlohy rôznych kľúčov bežia súčasne
+        v rôznych procesoch, pre každý kľúč beží alebo čaká najviac jedna úloha a nová úloha zruší predchádzajúcu.
+        Ak sú všetky procesy obsadené, úloha čaká, kým niektorý proces neskončí svoju úlohu. Výsledky zo všetkých
+        procesov prijíma jedno vlákno, ktoré po uvoľnení zámku zavolá funkcie zadané pri spustení úlohy.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__report_iterations: počet iterácií, po ktorých je odoslané priebežné rozloženie
+        :var self.__max_workers:       najväčší počet procesov, ktoré počítajú t-SNE súčasne
+        :var self.__listen_timeout:    čas v sekundách, po ktorom vlákno prijímajúce výsledky overí, či procesy bežia
+        :var self.__workers:           list spustených procesov, ku každému je priradený slovník s procesom, jeho
+                                       frontou úloh, frontou zrušení a id práve počítanej úlohy (None ak je voľný)
+        :var self.__result_queue:      spoločná fronta výsledkov zo všetkých procesov, None ak nebol spustený žiaden
+        :var self.__jobs:              ku každému kľúču je priradený slovník s id, funkciami, kontextom, priebehom
+                                       a procesom bežiacej úlohy. Čakajúca úloha má namiesto procesu svoje argumenty.
+        :var self.__job_keys:          ku každému id bežiacej alebo čakajúcej úlohy je priradený jej kľúč
+        :var self.__last_job_id:       id naposledy spustenej úlohy
+        :var self.__delivering:        počet skončených úloh, ktorých výsledok ešte odovzdáva vlákno prijímajúce výsledky
+        :var self.__lock:              zámok, chráni procesy a slovníky úloh pred súčasným prístupom z viacerých
+                                       vlákien
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param report_iterations: počet iterácií, po ktorých je odoslané priebežné rozloženie
+        :param max_workers:       najväčší počet procesov, ktoré počítajú t-SNE súčasne
+        :param listen_timeout:    čas v sekundách, po ktorom vlákno prijímajúce výsledky overí, či procesy bežia
+        """
+        self.__report_iterations = report_iterations
+        self.__max_workers = max(1, max_workers)
+        self.__listen_timeout = listen_timeout
+        self.__workers = []
+        self.__result_queue = None
+        self.__jobs = dict()
+        self.__job_keys = dict()
+        self.__last_job_id = 0
+        self.__delivering = 0
+        self.__lock = threading.Lock()
+
+    def start(self, key, data, parameters: dict, initial_cords, on_embedding, on_error, context=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zruší prebiehajúcu alebo čakajúcu úlohu s rovnakým kľúčom a zaradí novú úlohu.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param key:           kľúč úlohy
+        :param data:          vstupné dáta v tvare (počet vzoriek, počet neurónov)
+        :param parameters:    parametre TSNE
+        :param initial_cords: počiatočné rozloženie alebo None
+        :param on_embedding:  funkcia volaná s argumentmi (rozloženie, je výpočet dokončený, kontext úlohy)
+        :param on_error:      funkcia volaná s argumentmi (text chyby, kontext úlohy)
+        :param context:       ľubovoľný objekt, ktorý je odovzdaný funkciám on_embedding a on_error
+        """
+        with self.__lock:
+            self.cancel_job(key)
+            self.__last_job_id += 1
+            job_id = self.__last_job_id
+            self.__jobs[key] = {'id': job_id, 'on_embedding': on_embedding, 'on_error': on_error, 'context': context,
+                                'progress': (0, parameters['n_iter']), 'worker': None,
+                                'arguments': (data, parameters, initial_cords)}
+            self.__job_keys[job_id] = key
+            self.dispatch_jobs()
+
+    def dispatch_jobs(self):
+        # Volané so zámkom. Čakajúce úlohy sú v poradí spustenia odovzdané voľným procesom, kým je voľný proces alebo
+        # je možné spustiť ďalší.
+        waiting_jobs = sorted((job for job in self.__jobs.values() if job['worker'] is None), key=lambda job: job['id'])
+        for job in waiting_jobs:
+            worker = next((worker for worker in self.__workers if worker['job_id'] is None), None)
+            if worker is None:
+                if len(self.__workers) >= self.__max_workers:
+                    return
+                worker = self.start_worker()
+            worker['job_id'] = job['id']
+            job['worker'] = worker
+            worker['job_queue'].put((job['id'], *job.pop('arguments')))
+
+    def start_worker(self):
+        # Volané so zámkom. Spoločná fronta výsledkov a vlákno, ktoré ju prijíma, sú vytvorené s prvým procesom.
+        context = multiprocessing.get_context('spawn')
+        if self.__result_queue is None:
+            self.__result_queue = context.Queue()
+            listener = threading.Thread(target=self.listen, args=(self.__result_queue,), daemon=True)
+            listener.start()
+        worker = {'job_queue': context.Queue(), 'cancel_queue': context.Queue(), 'job_id': None}
+        worker['process'] = context.Process(target=t_SNE_worker,
+                                            args=(worker['job_queue'], self.__result_queue, worker['cancel_queue'],
+                                                  self.__report_iterations),
+                                            daemon=True)
+        worker['process'].start()
+        self.__workers.append(worker)
+        return worker
+
+    def listen(self, result_queue):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Prijíma výsledky zo všetkých procesov. Funkcie úloh sú volané až po uvoľnení zámku. Ak proces neočakávane
+        skončí, je jeho úlohe oznámená chyba a čakajúce úlohy sú odovzdané ostatným alebo novým procesom.
+        """
+        while True:
+            try:
+                message = result_queue.get(timeout=self.__listen_timeout)
+            except queue.Empty:
+                failed_jobs = self.remove_dead_workers()
+                for job in failed_jobs:
+                    job['on_error']('t-SNE process ended unexpectedly', job['context'])
+                self.finish_delivery(len(failed_jobs))
+                continue
+            if message is None:
+                return
+            job_id, kind, done, total, result = message
+            with self.__lock:
+                if kind != 'progress':
+                    # Proces je voľný aj po zrušenej úlohe, ktorej kľúč už má novú úlohu.
+                    for worker in self.__workers:
+                        if worker['job_id'] == job_id:
+                            worker['job_id'] = None
+                key = self.__job_keys.get(job_id)
+                job = self.__jobs[key] if key is not None else None
+                if job is not None and kind == 'progress':
+                    job['progress'] = (done, total)
+                elif job is not None:
+                    del self.__jobs[key]
+                    del self.__job_keys[job_id]
+                    if kind != 'cancelled':
+                        self.__delivering += 1
+                if kind != 'progress':
+                    self.dispatch_jobs()
+            if job is None or kind == 'cancelled':
+                continue
+            if kind == 'error':
+                job['on_error'](result, job['context'])
+            else:
+                job['on_embedding'](result.transpose(), kind == 'done', job['context'])
+            if kind != 'progress':
+                self.finish_delivery(1)
+
+    def finish_delivery(self, number_of_jobs):
+        # Úloha je považovaná za bežiacu, kým nie je odovzdaný jej posledný výsledok, aby bol zaznamenaný aj graf,
+        # ktorý bol označený na prekreslenie až pri odovzdaní.
+        if number_of_jobs > 0:
+            with self.__lock:
+                self.__delivering -= number_of_jobs
+
+    def remove_dead_workers(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Odstráni procesy, ktoré neočakávane skončili, a ich úlohy. Čakajúce úlohy sú odovzdané ďalším procesom.
+
+        :return: list úloh, ktoré boli počítané v skončených procesoch
+        """
+        with self.__lock:
+            dead_workers = [worker for worker in self.__workers if not worker['process'].is_alive()]
+            failed_jobs = []
+            for worker in dead_workers:
+                self.__workers.remove(worker)
+                key = self.__job_keys.pop(worker['job_id'], None)
+                if key is not None:
+                    failed_jobs.append(self.__jobs.pop(key))
+            self.__delivering += len(failed_jobs)
+            if dead_workers:
+                self.dispatch_jobs()
+            return failed_jobs
+
+    def cancel(self, key):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zruší úlohu s daným kľúčom, jej ďalšie výsledky už nebudú odovzdané. Úlohy ostatných kľúčov bežia ďalej.
+        """
+        with self.__lock:
+            self.cancel_job(key)
+
+    def cancel_job(self, key):
+        # Volané so zámkom. Čakajúca úloha je len zahodená, bežiacu úlohu proces ukončí pri najbližšej iterácii.
+        job = self.__jobs.pop(key, None)
+        if job is not None:
+            del self.__job_keys[job['id']]
+            if job['worker'] is not None:
+                job['worker']['cancel_queue'].put(job['id'])
+
+    def progress(self, key):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti dvojicu (vykonané iterácie, celkový počet iterácií) úlohy s daným kľúčom, alebo None ak úloha nebeží ani
+        nečaká.
+        """
+        with self.__lock:
+            job = self.__jobs.get(key)
+            return job['progress'] if job is not None else None
+
+    def shutdown(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zruší všetky úlohy a ukončí procesy aj vlákno prijímajúce výsledky.
+        """
+        with self.__lock:
+            for key in list(self.__jobs):
+                self.cancel_job(key)
+            workers = self.__workers
+            self.__workers = []
+            for worker in workers:
+                worker['job_queue'].put(None)
+            if self.__result_queue is not None:
+                self.__result_queue.put(None)
+                self.__result_queue = None
+        for worker in workers:
+            worker['process'].join(self.__listen_timeout)
+            if worker['process'].is_alive():
+                worker['process'].terminate()
+
+    @property
+    def is_running(self):
+        # Úloha beží, čaká, alebo jej posledný výsledok ešte nebol odovzdaný.
+        with self.__lock:
+            return len(self.__jobs) > 0 or self.__delivering > 0
@@ -0,0 +1,744 @@
+import abc
+import queue
+from collections import OrderedDict
+
+import numpy as np
+from sklearn import preprocessing
+from sklearn.decomposition import PCA, IncrementalPCA, TruncatedSVD
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+from sklearn.manifold import TSNE, _t_sne
+from sklearn.neighbors import NearestNeighbors
+from sklearn.random_projection import GaussianRandomProjection
+
+# Modul nenačítava keras ani TensorFlow. Funkcie z neho sú vykonávané v procesoch spúšťaných cez spawn, v ktorých
+# TensorFlow nie je potrebný.
+
+# Náročnosť metódy: fit trvá zlomok sekundy aj pri veľkých vrstvách, metóda je vhodná pri každej zmene váh.
+COST_CHEAP = 'cheap'
+# Náročnosť metódy: fit rozkladá celú maticu aktivácií, pri veľkých vrstvách trvá rádovo sekundy.
+COST_MODERATE = 'moderate'
+# Náročnosť metódy: iteratívny výpočet, ktorý trvá rádovo sekundy až minúty a beží na pozadí.
+COST_EXPENSIVE = 'expensive'
+
+
+def iterate_chunks(number_of_samples, chunk_size, min_chunk_size=1):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Rozdelí indexy vzoriek na súvislé úseky dĺžky chunk_size. Posledný úsek kratší ako min_chunk_size je pripojený
+    k predchádzajúcemu, pretože niektoré inkrementálne metódy vyžadujú v každom úseku minimálny počet vzoriek.
+
+    :return: generátor dvojíc (začiatok, koniec) jednotlivých úsekov
+    """
+    chunk_size = max(chunk_size, min_chunk_size)
+    start = 0
+    while start < number_of_samples:
+        end = start + chunk_size
+        if number_of_samples - end < min_chunk_size:
+            end = number_of_samples
+        yield start, end
+        start = end
+
+
+def fit_PCA(points_cords, solver, number_of_components, chunk_size):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Fit škálovania a PCA a premietnutie aktivácií do hlavných komponentov. Funkcia je definovaná na úrovni modulu, aby
+    ju bolo možné vykonať v procese.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points_cords:         matica aktivácií v tvare (počet vzoriek, počet neurónov)
+    :param solver:               'full', 'randomized' alebo 'incremental'
+    :param number_of_components: počet počítaných komponentov pri randomizovanom a inkrementálnom PCA
+    :param chunk_size:           počet vzoriek v jednom úseku pri inkrementálnom fite a pri premietaní
+    :return: trojica (fitnutý StandardScaler, fitnuté PCA, projekcia v tvare (počet komponentov, počet vzoriek))
+    """
+    if solver == 'incremental':
+        scaler, pca = fit_incremental_PCA(points_cords, number_of_components, chunk_size)
+    else:
+        scaler = preprocessing.StandardScaler().fit(points_cords)
+        if solver == 'randomized':
+            pca = PCA(n_components=number_of_components, svd_solver='randomized', random_state=0)
+        else:
+            pca = PCA()
+        pca.fit(scaler.transform(points_cords))
+    return scaler, pca, transform_PCA(points_cords, scaler, pca, chunk_size)
+
+
+def fit_incremental_PCA(points_cords, number_of_components, chunk_size):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Fit škálovania a PCA postupne po úsekoch vzoriek. Úseky sú pohľady do matice aktivácií, ktorá už je celá
+    v pamäti. Pri fite a premietaní sa teda nevytvára škálovaná kópia celej matice, samotné aktivácie však v pamäti
+    byť musia.
+
+    :return: dvojica (fitnutý StandardScaler, fitnutý IncrementalPCA)
+    """
+    number_of_samples = points_cords.shape[0]
+    scaler = preprocessing.StandardScaler()
+    for start, end in iterate_chunks(number_of_samples, chunk_size):
+        scaler.partial_fit(points_cords[start:end])
+    pca = IncrementalPCA(n_components=number_of_components)
+    # IncrementalPCA vyžaduje v každom úseku aspoň toľko vzoriek, koľko je počítaných komponentov.
+    for start, end in iterate_chunks(number_of_samples, chunk_size, number_of_components):
+        pca.partial_fit(scaler.transform(points_cords[start:end]))
+    return scaler, pca
+
+
+def transform_PCA(points_cords, scaler, pca, chunk_size):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Premietnutie aktivácií do hlavných komponentov po úsekoch vzoriek, aby nebola vytváraná škálovaná kópia celej
+    matice aktivácií.
+
+    :return: súradnice v hlavných komponentoch v tvare (počet komponentov, počet vzoriek)
+    """
+    number_of_samples = points_cords.shape[0]
+    projection = np.empty((pca.n_components_, number_of_samples))
+    for start, end in iterate_chunks(number_of_samples, chunk_size):
+        projection[:, start:end] = pca.transform(scaler.transform(points_cords[start:end])).transpose()
+    return projection
+
+
+def stratified_sample(labels, number_of_samples, random_state=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Výber podmnožiny vzoriek, v ktorej je každý label zastúpený v rovnakom pomere ako vo všetkých vzorkách. Počet
+    vybraných vzoriek je presne number_of_samples (najviac počet všetkých vzoriek). Ak je labels menej ako vzoriek, je
+    z každého labelu vybraná aspoň jedna vzorka, inak je náhodne vybraných number_of_samples labels po jednej vzorke.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param labels:            labels všetkých vzoriek
+    :param number_of_samples: požadovaný počet vybraných vzoriek
+    :param random_state:      seed generátora náhodných čísel
+    :return: zoradené indexy vybraných vzoriek
+    """
+    generator = np.random.default_rng(random_state)
+    classes, inverse, counts = np.unique(np.asarray(labels), return_inverse=True, return_counts=True)
+    number_of_samples = min(number_of_samples, len(labels))
+    if classes.size >= number_of_samples:
+        allocation = np.zeros(classes.size, dtype=int)
+        allocation[generator.choice(classes.size, number_of_samples, replace=False)] = 1
+    else:
+        quota = counts * number_of_samples / len(labels)
+        allocation = np.minimum(np.maximum(np.floor(quota).astype(int), 1), counts)
+        # Minimum jednej vzorky môže rozpočet prekročiť a zaokrúhlenie nadol ho nedočerpať. Rozdiel je vyrovnaný po
+        # jednej vzorke pri labels, ktorých pridelenie sa od pomerného podielu líši najviac.
+        while allocation.sum() > number_of_samples:
+            reducible = np.flatnonzero(allocation > 1)
+            allocation[reducible[np.argmax((allocation - quota)[reducible])]] -= 1
+        while allocation.sum() < number_of_samples:
+            expandable = np.flatnonzero(allocation < counts)
+            allocation[expandable[np.argmax((quota - allocation)[expandable])]] += 1
+    # Indexy vzoriek zoskupené podľa labels, vzorky labelu i sú v úseku medzi class_ends[i - 1] a class_ends[i].
+    class_members = np.argsort(inverse, kind='stable')
+    class_ends = np.cumsum(counts)
+    selected = []
+    for class_index in np.flatnonzero(allocation):
+        members = class_members[class_ends[class_index] - counts[class_index]:class_ends[class_index]]
+        selected.append(generator.choice(members, allocation[class_index], replace=False))
+    return np.sort(np.concatenate(selected))
+
+
+def knn_interpolation_weights(landmarks, points, number_of_neighbors):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Pre každý bod nájde najbližšie landmarky v priestore aktivácií a vypočíta ich váhy nepriamo úmerné vzdialenosti.
+    Bod, ktorý je sám landmarkom, dostane prakticky celú váhu svojho landmarku.
+
+    :return: dvojica (indexy susedných landmarkov, váhy susedov), obe v tvare (počet bodov, počet susedov)
+    """
+    number_of_neighbors = min(number_of_neighbors, len(landmarks))
+    distances, indexes = NearestNeighbors(n_neighbors=number_of_neighbors).fit(landmarks).kneighbors(points)
+    weights = 1 / np.maximum(distances, 1e-12)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return indexes, weights
+
+
+def interpolate_embedding(landmarks_embedding, neighbor_indexes, neighbor_weights):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Umiestnenie všetkých bodov ako váženého priemeru rozloženia ich susedných landmarkov.
+
+    :param landmarks_embedding: rozloženie landmarkov v tvare (počet landmarkov, počet komponentov)
+    :return: rozloženie všetkých bodov v tvare (počet bodov, počet komponentov)
+    """
+    return np.einsum('nk,nkc->nc', neighbor_weights, landmarks_embedding[neighbor_indexes])
+
+
+class TSNECancelled(Exception):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Výnimka, ktorou je prerušený výpočet t-SNE zrušenej úlohy.
+    """
+    pass
+
+
+def run_t_SNE(data, parameters: dict, initial_cords=None, on_iteration=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Jeden beh TSNE zo sklearn. TSNE nemá verejný callback, preto je počas behu nahradená funkcia _gradient_descent,
+    ktorej účelová funkcia je volaná raz za iteráciu. Funkcia on_iteration tak dostáva číslo iterácie a aktuálne
+    rozloženie, výnimkou môže výpočet prerušiť.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param data:          vstupné dáta v tvare (počet vzoriek, počet neurónov)
+    :param parameters:    parametre TSNE
+    :param initial_cords: počiatočné rozloženie, ak je zadané, výpočet nepoužíva zveličenie
+    :param on_iteration:  funkcia volaná s argumentmi (číslo iterácie, rozloženie v tvare (počet vzoriek, počet
+                          komponentov)), alebo None
+    :return: rozloženie v tvare (počet vzoriek, počet komponentov)
+    """
+    parameters = dict(parameters)
+    if initial_cords is not None:
+        parameters.update(init=initial_cords, early_exaggeration=1)
+    if on_iteration is None:
+        return TSNE(**parameters).fit_transform(data)
+    number_of_components = parameters.get('n_components', 2)
+    original_gradient_descent = _t_sne._gradient_descent
+
+    def gradient_descent(objective, p0, it=0, **kwargs):
+        # Číslovanie iterácií pokračuje od it, TSNE volá gradientný zostup raz so zveličením a raz bez neho.
+        iteration = it
+
+        def counted_objective(p, *args, **objective_kwargs):
+            nonlocal iteration
+            iteration += 1
+            on_iteration(iteration, p.reshape(-1, number_of_components))
+            return objective(p, *args, **objective_kwargs)
+
+        return original_gradient_descent(counted_objective, p0, it=it, **kwargs)
+
+    _t_sne._gradient_descent = gradient_descent
+    try:
+        return TSNE(**parameters).fit_transform(data)
+    finally:
+        _t_sne._gradient_descent = original_gradient_descent
+
+
+def receive_cancelled(cancel_queue, cancelled: set):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Presunie id zrušených úloh z fronty do množiny bez čakania.
+    """
+    while True:
+        try:
+            cancelled.add(cancel_queue.get_nowait())
+        except queue.Empty:
+            return
+
+
+def t_SNE_worker(job_queue, result_queue, cancel_queue, report_iterations):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Hlavná funkcia procesu, ktorý počas celého behu programu počíta t-SNE. Takých procesov môže bežať viac, každý má
+    vlastnú frontu úloh a zrušení a spoločnú frontu výsledkov. Úlohy sú spracované postupne, každá jedným behom TSNE.
+    Každých report_iterations iterácií je do fronty výsledkov vložené priebežné rozloženie. Zrušenie úlohy je
+    kontrolované v každej iterácii. Do fronty výsledkov sú vkladané pätice (id úlohy, druh správy, počet vykonaných
+    iterácií, celkový počet iterácií, rozloženie alebo text chyby), druh správy je 'progress', 'done', 'error' alebo
+    'cancelled'. Každá úloha skončí práve jednou správou 'done', 'error' alebo 'cancelled', podľa nej je proces
+    znova voľný. Proces skončí, keď namiesto úlohy dostane None.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param job_queue:         fronta úloh procesu (id úlohy, dáta, parametre TSNE, počiatočné rozloženie alebo None)
+    :param result_queue:      fronta, do ktorej sú vkladané priebežné a konečné výsledky
+    :param cancel_queue:      fronta s id zrušených úloh procesu
+    :param report_iterations: počet iterácií, po ktorých je odoslané priebežné rozloženie
+    """
+    cancelled = set()
+    while True:
+        job = job_queue.get()
+        if job is None:
+            return
+        job_id, data, parameters, initial_cords = job
+        # Id úloh rastú a úlohy sú spracované v poradí, zrušenia starších úloh už nie sú potrebné.
+        receive_cancelled(cancel_queue, cancelled)
+        cancelled = {cancelled_id for cancelled_id in cancelled if cancelled_id >= job_id}
+        total_iterations = parameters['n_iter']
+        if job_id in cancelled:
+            result_queue.put((job_id, 'cancelled', 0, total_iterations, None))
+            continue
+
+        def on_iteration(iteration, cords):
+            receive_cancelled(cancel_queue, cancelled)
+            if job_id in cancelled:
+                raise TSNECancelled()
+            if iteration % report_iterations == 0 and iteration < total_iterations:
+                result_queue.put((job_id, 'progress', iteration, total_iterations, cords.copy()))
+
+        try:
+            _, embedding = get_method('t-SNE').fit_transform(data, parameters, initial_cords=initial_cords,
+                                                             on_iteration=on_iteration)
+            result_queue.put((job_id, 'done', total_iterations, total_iterations, embedding))
+        except TSNECancelled:
+            result_queue.put((job_id, 'cancelled', 0, total_iterations, None))
+        except Exception as error:
+            result_queue.put((job_id, 'error', 0, total_iterations, str(error)))
+
+
+class DimensionReductionMethod(abc.ABC):
+    def __init__(self, name, parameter_labels=None, cost_class=COST_CHEAP, supports_transform=True, builtin=False,
+                 needs_labels=False, data_independent_fit=False, axis_name='Component', config_key=None,
+                 cord_offset=0, identity=False, runs_in_background=False):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Popis metódy redukcie priestoru, ktorý je uložený v registri metód. Metóda deklaruje svoje parametre, náročnosť
+        výpočtu a to, či je možné nové aktivácie iba premietnuť už fitnutým modelom.
+        Všetky metódy sú počítané cez fit_transform a transform a vrstva aj možnosti vrstvy sa rozhodujú len podľa
+        atribútov metódy z registra. Vstavané metódy (No method, PCA, t-SNE) majú config uložený pod vlastným kľúčom
+        v configu vrstvy, ostatné metódy v slovníku methods_config.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__name:                 názov metódy, zobrazuje sa v možnostiach a slúži ako jej identifikátor
+        :var self.__parameter_labels:     list dvojíc (id parametra, popis parametra), podľa neho sú vytvorené vstupy
+        :var self.__cost_class:           náročnosť výpočtu, COST_CHEAP, COST_MODERATE alebo COST_EXPENSIVE
+        :var self.__supports_transform:   či je možné fitnutým modelom premietnuť nové dáta
+        :var self.__builtin:              či ide o vstavanú metódu s vlastnými nastaveniami v možnostiach vrstvy
+        :var self.__needs_labels:         či metóda pri fite potrebuje labels bodov
+        :var self.__data_independent_fit: model nezávisí od hodnôt dát, len od ich rozmeru. Pri zmene aktivácií stačí
+                                          nové aktivácie premietnuť, zobrazenie sa tak pri zmene váh nemení skokovo.
+        :var self.__axis_name:            názov osí grafu pri použití metódy
+        :var self.__config_key:           kľúč configu metódy v configu vrstvy, pri None je config v methods_config
+        :var self.__cord_offset:          číslo prvého komponentu pri zadávaní zobrazovaných súradníc (PC sú od 1)
+        :var self.__identity:             projekciou sú samotné aktivácie. Výpočet nie je spúšťaný v procese a je
+                                          možné zobraziť mriežku vstupov.
+        :var self.__runs_in_background:   výpočet beží v procese na pozadí a výsledok je zobrazovaný priebežne
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param name:                 názov metódy
+        :param parameter_labels:     list dvojíc (id parametra, popis parametra)
+        :param cost_class:           náročnosť výpočtu
+        :param supports_transform:   či je možné fitnutým modelom premietnuť nové dáta
+        :param builtin:              či ide o vstavanú metódu
+        :param needs_labels:         či metóda potrebuje labels bodov
+        :param data_independent_fit: či model nezávisí od hodnôt dát
+        :param axis_name:            názov osí grafu
+        :param config_key:           kľúč configu metódy v configu vrstvy
+        :param cord_offset:          číslo prvého komponentu pri zadávaní zobrazovaných súradníc
+        :param identity:             či sú projekciou samotné aktivácie
+        :param runs_in_background:   či výpočet beží v procese na pozadí
+        """
+        self.__name = name
+        self.__parameter_labels = parameter_labels if parameter_labels is not None else []
+        self.__cost_class = cost_class
+        self.__supports_transform = supports_transform
+        self.__builtin = builtin
+        self.__needs_labels = needs_labels
+        self.__data_independent_fit = data_independent_fit
+        self.__axis_name = axis_name
+        self.__config_key = config_key
+        self.__cord_offset = cord_offset
+        self.__identity = identity
+        self.__runs_in_background = runs_in_background
+
+    def create_parameters(self, number_of_dimensions):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Predvolené hodnoty parametrov a ich hranice pre vrstvu so zadaným počtom neurónov.
+
+        :return: dvojica (predvolené hodnoty, hranice hodnôt)
+        """
+        return dict(), dict()
+
+    def create_config(self, number_of_dimensions):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vytvorí config metódy pre vrstvu. Naposledy zadané hodnoty parametrov sú v options_config a použité až po
+        stlačení tlačidla na použitie metódy. Počet komponentov, ktoré je možné zobraziť, je v n_possible_components.
+        """
+        used_config, parameter_borders = self.create_parameters(number_of_dimensions)
+        number_of_components = used_config.get('n_components', number_of_dimensions)
+        return {'used_config': used_config,
+                'options_config': used_config.copy(),
+                'parameter_borders': parameter_borders,
+                'displayed_cords': list(range(min(3, number_of_components))),
+                'n_possible_components': number_of_components}
+
+    def get_layer_config(self, layer_config: dict):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Config metódy uložený v configu vrstvy.
+        """
+        if self.__config_key is not None:
+            return layer_config[self.__config_key]
+        return layer_config['methods_config'][self.__name]
+
+    def get_fit_parameters(self, method_config: dict):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Parametre fitu podľa configu metódy. Podľa nich je aj určené, či je uložený model ešte platný.
+        """
+        return dict(method_config['used_config'])
+
+    def check_parameters(self, parameters: dict, number_of_samples):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Overenie parametrov pred spustením výpočtu.
+
+        :return: text chyby alebo None, ak je možné metódu s parametrami použiť
+        """
+        return None
+
+    def accepts_model(self, model, data):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Či je možné fitnutým modelom premietnuť dáta, teda či bol fitnutý na rovnakom počte neurónov.
+        """
+        return model is not None and model.n_features_in_ == data.shape[1]
+
+    def get_variance_information(self, model):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Informácie o fitnutom modeli zobrazované v možnostiach vrstvy.
+
+        :return: dvojica (pomer vysvetlenej variability komponentov, váhy neurónov v prvom komponente) alebo None
+        """
+        return None
+
+    @abc.abstractmethod
+    def fit(self, data, used_config: dict, labels=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Fit modelu na dátach v tvare (počet vzoriek, počet neurónov).
+
+        :return: fitnutý model
+        """
+
+    def transform(self, model, data):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Premietnutie dát fitnutým modelom.
+
+        :return: súradnice v tvare (počet vzoriek, počet komponentov)
+        """
+        return model.transform(data)
+
+    def fit_transform(self, data, used_config: dict, labels=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Fit modelu a premietnutie dát, na ktorých bol fitnutý. Metódy, ktoré projekciu získajú už pri fite, ju môžu
+        vrátiť bez ďalšieho premietnutia.
+
+        :return: dvojica (fitnutý model, súradnice v tvare (počet vzoriek, počet komponentov))
+        """
+        model = self.fit(data, used_config, labels)
+        return model, self.transform(model, data)
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def parameter_labels(self):
+        return self.__parameter_labels
+
+    @property
+    def cost_class(self):
+        return self.__cost_class
+
+    @property
+    def supports_transform(self):
+        return self.__supports_transform
+
+    @property
+    def builtin(self):
+        return self.__builtin
+
+    @property
+    def needs_labels(self):
+        return self.__needs_labels
+
+    @property
+    def data_independent_fit(self):
+        return self.__data_independent_fit
+
+    @property
+    def axis_name(self):
+        return self.__axis_name
+
+    @property
+    def config_key(self):
+        return self.__config_key
+
+    @property
+    def cord_offset(self):
+        return self.__cord_offset
+
+    @property
+    def identity(self):
+        return self.__identity
+
+    @property
+    def runs_in_background(self):
+        return self.__runs_in_background
+
+
+class NoMethod(DimensionReductionMethod):
+    def __init__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Bez redukcie priestoru, projekciou sú samotné aktivácie.
+        """
+        super().__init__('No method', cost_class=COST_CHEAP, builtin=True, data_independent_fit=True, axis_name='Axis',
+                         config_key='no_method_config', identity=True)
+
+    def fit(self, data, used_config: dict, labels=None):
+        return None
+
+    def transform(self, model, data):
+        return data
+
+
+class PCAMethod(DimensionReductionMethod):
+    def __init__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Analýza hlavných komponentov nad škálovanými aktiváciami. Modelom je slovník s fitnutým StandardScaler, PCA
+        a počtom vzoriek v jednom úseku pri premietaní. Parametre sú solver, n_components (pri úplnom PCA None)
+        a chunk_size, ich význam je rovnaký ako pri fit_PCA. Hlavné komponenty sú pri zobrazení číslované od 1.
+        """
+        super().__init__('PCA', cost_class=COST_MODERATE, builtin=True, axis_name='PC axis', config_key='PCA_config',
+                         cord_offset=1)
+
+    def create_config(self, number_of_dimensions):
+        # Pri randomizovanom a inkrementálnom PCA je počítaných len n_computed_components hlavných komponentov. Počet
+        # vypočítaných komponentov je známy až po fite.
+        return {'displayed_cords': list(range(min(3, number_of_dimensions))),
+                'n_possible_components': 0,
+                'percentage_variance': None,
+                'largest_influence': None,
+                'solver': 'full',
+                'freeze_basis': False,
+                'n_computed_components': min(number_of_dimensions, 10),
+                'chunk_size': None,
+                'parameter_borders': {'n_computed_components': (1, int, number_of_dimensions)}}
+
+    def get_fit_parameters(self, method_config: dict):
+        solver = method_config['solver']
+        return {'solver': solver,
+                'n_components': method_config['n_computed_components'] if solver != 'full' else None,
+                'chunk_size': method_config['chunk_size']}
+
+    def accepts_model(self, model, data):
+        return model is not None and model['scaler'].n_features_in_ == data.shape[1]
+
+    def get_variance_information(self, model):
+        return model['pca'].explained_variance_ratio_, model['pca'].components_[0]
+
+    def fit(self, data, used_config: dict, labels=None):
+        return self.fit_transform(data, used_config, labels)[0]
+
+    def transform(self, model, data):
+        return transform_PCA(data, model['scaler'], model['pca'], model['chunk_size']).transpose()
+
+    def fit_transform(self, data, used_config: dict, labels=None):
+        # Pri randomizovanom a inkrementálnom PCA je možné vypočítať najviac toľko komponentov, koľko je vzoriek
+        # a neurónov.
+        number_of_components = used_config['n_components']
+        if number_of_components is not None:
+            number_of_components = min(number_of_components, min(data.shape))
+        scaler, pca, projection = fit_PCA(data, used_config['solver'], number_of_components,
+                                          used_config['chunk_size'])
+        return {'scaler': scaler, 'pca': pca, 'chunk_size': used_config['chunk_size']}, projection.transpose()
+
+
+class TSNEMethod(DimensionReductionMethod):
+    def __init__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda t-SNE. Nové dáta nie je možné premietnuť, každá zmena aktivácií vyžaduje nový výpočet, ktorý beží
+        v procese na pozadí. Okrem parametrov TSNE prijíma fit_transform počiatočné rozloženie a funkciu volanú po
+        každej iterácii, pozri run_t_SNE.
+        """
+        parameter_labels = [('n_components', 'Number of components:'), ('perplexity', 'Perplexity:'),
+                            ('early_exaggeration', 'Early exaggeration:'), ('learning_rate', 'Learning rate:'),
+                            ('n_iter', 'Number of iteration:'), ('random_state', 'Random state:')]
+        super().__init__('t-SNE', parameter_labels, COST_EXPENSIVE, supports_transform=False, builtin=True,
+                         axis_name='t-SNE', config_key='t_SNE_config', runs_in_background=True)
+
+    def create_parameters(self, number_of_dimensions):
+        number_of_components = min(number_of_dimensions, 3)
+        used_config = {'n_components': number_of_components, 'perplexity': 30, 'early_exaggeration': 12.0,
+                       'learning_rate': 200, 'n_iter': 1000, 'random_state': 0}
+        parameter_borders = {'n_components': (1, int, number_of_components),
+                             'perplexity': (0, float, float("inf")),
+                             'early_exaggeration': (0, float, 1000),
+                             'learning_rate': (float("-inf"), float, float("inf")),
+                             'n_iter': (250, int, float("inf")),
+                             'random_state': (0, int, 2 ** 32 - 1)}
+        return used_config, parameter_borders
+
+    def check_parameters(self, parameters: dict, number_of_samples):
+        # TSNE vyžaduje perplexitu menšiu ako počet vzoriek, pri landmark režime ako počet landmarkov.
+        if number_of_samples == 0 or parameters['perplexity'] < number_of_samples:
+            return None
+        return 'Perplexity must be less than number of samples ({})'.format(number_of_samples)
+
+    def fit(self, data, used_config: dict, labels=None):
+        return TSNE(**used_config).fit(data)
+
+    def transform(self, model, data):
+        raise ValueError('t-SNE cannot project new data')
+
+    def fit_transform(self, data, used_config: dict, labels=None, initial_cords=None, on_iteration=None):
+        return None, run_t_SNE(data, used_config, initial_cords, on_iteration)
+
+
+class GaussianRandomProjectionMethod(DimensionReductionMethod):
+    def __init__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Náhodná projekcia do menšieho priestoru. Projekčná matica závisí len od počtu neurónov, pri zmene váh sú teda
+        nové aktivácie len premietnuté jedným maticovým násobením.
+        """
+        parameter_labels = [('n_components', 'Number of components:'), ('random_state', 'Random state:')]
+        super().__init__('Random projection', parameter_labels, COST_CHEAP, True, data_independent_fit=True,
+                         axis_name='RP')
+
+    def create_parameters(self, number_of_dimensions):
+        used_config = {'n_components': min(3, number_of_dimensions), 'random_state': 0}
+        parameter_borders = {'n_components': (1, int, number_of_dimensions),
+                             'random_state': (0, int, 2 ** 32 - 1)}
+        return used_config, parameter_borders
+
+    def fit(self, data, used_config: dict, labels=None):
+        return GaussianRandomProjection(**used_config).fit(data)
+
+
+class TruncatedSVDMethod(DimensionReductionMethod):
+    def __init__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Randomizovaný rozklad na singulárne hodnoty, počíta len zvolený počet komponentov. Dáta nie sú centrované, preto
+        je výpočet lacnejší ako PCA.
+        """
+        parameter_labels = [('n_components', 'Number of components:'), ('n_iter', 'Number of iteration:'),
+                            ('random_state', 'Random state:')]
+        super().__init__('Truncated SVD', parameter_labels, COST_CHEAP, True, axis_name='SV')
+
+    def create_parameters(self, number_of_dimensions):
+        used_config = {'n_components': min(3, number_of_dimensions), 'n_iter': 5, 'random_state': 0}
+        parameter_borders = {'n_components': (1, int, number_of_dimensions),
+                             'n_iter': (1, int, 100),
+                             'random_state': (0, int, 2 ** 32 - 1)}
+        return used_config, parameter_borders
+
+    def fit(self, data, used_config: dict, labels=None):
+        config = dict(used_config)
+        config['n_components'] = min(config['n_components'], min(data.shape))
+        return TruncatedSVD(algorithm='randomized', **config).fit(data)
+
+
+class LinearDiscriminantMethod(DimensionReductionMethod):
+    def __init__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Lineárna diskriminačná analýza, premieta body do smerov, ktoré najlepšie oddeľujú jednotlivé labels. Počet
+        komponentov je najviac počet labels - 1.
+        """
+        super().__init__('LDA', [('n_components', 'Number of components:')], COST_CHEAP, True, needs_labels=True,
+                         axis_name='LD')
+
+    def create_parameters(self, number_of_dimensions):
+        used_config = {'n_components': min(3, number_of_dimensions)}
+        parameter_borders = {'n_components': (1, int, number_of_dimensions)}
+        return used_config, parameter_borders
+
+    def fit(self, data, used_config: dict, labels=None):
+        number_of_classes = np.unique(np.asarray(labels)).size
+        if number_of_classes < 2:
+            raise ValueError('LDA needs at least two different labels')
+        number_of_components = min(used_config['n_components'], number_of_classes - 1, data.shape[1])
+        return LinearDiscriminantAnalysis(n_components=number_of_components).fit(data, labels)
+
+
+# Register metód redukcie priestoru, ku každému názvu metódy je priradená jej inštancia v poradí registrácie.
+DIMENSION_REDUCTION_METHODS = OrderedDict()
+
+
+def register_method(method: DimensionReductionMethod):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Pridanie metódy do registra. Metódy sú v možnostiach zobrazené v poradí registrácie.
+    """
+    DIMENSION_REDUCTION_METHODS[method.name] = method
+    return method
+
+
+def get_method(name) -> DimensionReductionMethod:
+    return DIMENSION_REDUCTION_METHODS[name]
+
+
+def fit_reduction_method(data, method_name, parameters: dict, labels=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Fit metódy z registra a premietnutie dát. Funkcia je definovaná na úrovni modulu a metódu dostáva podľa názvu, aby
+    ju bolo možné vykonať v procese.
+
+    :return: dvojica (fitnutý model, projekcia v tvare (počet komponentov, počet vzoriek))
+    """
+    model, projection = get_method(method_name).fit_transform(data, parameters, labels)
+    return model, projection.transpose()
+
+
+def transform_reduction_method(data, method_name, model):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Premietnutie dát už fitnutým modelom metódy z registra.
+
+    :return: projekcia v tvare (počet komponentov, počet vzoriek)
+    """
+    return get_method(method_name).transform(model, data).transpose()
+
+
+def get_registered_methods(builtin=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Zoznam registrovaných metód. Ak je zadaný parameter builtin, sú vrátené len vstavané alebo len ostatné metódy.
+    """
+    return [method for method in DIMENSION_REDUCTION_METHODS.values() if builtin is None or method.builtin == builtin]
+
+
+register_method(NoMethod())
+register_method(PCAMethod())
+register_method(TSNEMethod())
+register_method(GaussianRandomProjectionMethod())
+register_method(TruncatedSVDMethod())
+register_method(LinearDiscriminantMethod())
@@ -1,4 +1,5 @@
 import ntpath
+import os
 import threading
 import time
 import tkinter as tk
@@ -6,15 +7,43 @@ from tkinter import Widget
 
 import matplotlib.colors as mcolors
 import pandas as pd
-from sklearn import preprocessing
-from sklearn.decomposition import PCA
-from sklearn.manifold import TSNE
-from tensorflow import keras
 
 from AdditionalComponents import *
+from CalculationComponents import *
+from DimensionReductionComponents import *
 from PlottingAndControlComponents import *
 
 LARGE_FONT = ('Verdana', 12)
+
+# Počet dielov mriežky v každej osi podľa počtu vstupov. Mriežka je vykreslená jednou kolekciou čiar, preto môže byť
+# hustejšia.
+POLYGON_DIVISIONS = {2: [20, 20], 3: [8, 8, 8]}
+# Vrstvy typu Dense sú pri zmene váh počítané v NumPy namiesto keras modelu.
+USE_NUMPY_ENGINE = True
+# Pri načítaní modelu sú vrstvy počítané v NumPy porovnané s keras vrstvami, nezhodné vrstvy počíta keras.
+CHECK_NUMPY_PARITY = False
+# Názov dávky v ActivationEngine, ktorá obsahuje vstupné body spolu s bodmi mriežky.
+INPUT_BATCH = 'input'
+# Maximálny počet vlákien, ktoré súčasne aplikujú zmeny na vrstvách. None znamená počet podľa počtu procesorov.
+WORKER_POOL_SIZE = None
+# Maximálny počet procesov, ktoré počítajú redukciu priestoru. Každý proces pri štarte načíta moduly programu.
+PROCESS_POOL_SIZE = min(4, os.cpu_count() or 1)
+# Najmenší počet hodnôt aktivácií (vzorky * neuróny), od ktorého je redukcia priestoru počítaná v procese.
+PROCESS_POOL_MIN_SIZE = 100000
+# Počet vzoriek v jednom úseku pri inkrementálnom fite PCA a pri premietaní do hlavných komponentov.
+PCA_CHUNK_SIZE = 10000
+# Najväčší počet výsledkov t-SNE uložených v spoločnej cache všetkých vrstiev.
+T_SNE_CACHE_SIZE = 16
+# Najväčšia relatívna zmena aktivácií (pomer noriem), pri ktorej t-SNE pokračuje z predchádzajúceho rozloženia.
+T_SNE_WARM_START_THRESHOLD = 0.1
+# Najväčší počet iterácií t-SNE spusteného z predchádzajúceho rozloženia.
+T_SNE_WARM_START_ITERATIONS = 250
+# Počet iterácií t-SNE, po ktorých proces odošle priebežné rozloženie na zobrazenie.
+T_SNE_REPORT_ITERATIONS = 25
+# Najväčší počet procesov, ktoré súčasne počítajú t-SNE rôznych vrstiev. Ďalšie vrstvy čakajú na voľný proces.
+T_SNE_MAX_WORKERS = min(4, os.cpu_count() or 1)
+# Interval v milisekundách, v ktorom je zobrazovaný stav výpočtu (priebeh t-SNE, chyba metódy), kým výpočet beží.
+T_SNE_PROGRESS_INTERVAL = 200
 np.seterr(divide='ignore', invalid='ignore')
 
 
@@ -144,10 +173,18 @@ class GraphPage(tk.Frame):
         ----------------------------------------------------------------------------------------------------------------
         :param filepath: aboslutná cesta k súboru.
         """
+        # keras je načítaný až pri načítaní modelu. Procesy spúšťané cez spawn načítavajú tento modul znova ako
+        # __mp_main__, TensorFlow tak v nich nie je načítaný.
+        from tensorflow import keras
+
         self.__file_path, self.__file_name = ntpath.split(filepath)
         self.__keras_model = keras.models.load_model(filepath)
-        self.__logic_layer.initialize(self.__keras_model)
-        self.__info_label.pack_forget()
+        error_message = self.__logic_layer.initialize(self.__keras_model)
+        if error_message is not None:
+            self.__info_label.configure(text=error_message, fg='red')
+            self.__info_label.pack(side='left')
+        else:
+            self.__info_label.pack_forget()
 
     def try_load_points(self):
         """
@@ -192,6 +229,7 @@ class GraphPage(tk.Frame):
             file_path = save_model(self.__file_path, self.__file_name)
             if file_path != '':
                 self.__file_path, self.__file_name = ntpath.split(file_path)
+                self.__logic_layer.synchronize_model_weights()
                 self.__keras_model.save(file_path)
             self.__info_label.pack_forget()
         else:
@@ -212,18 +250,31 @@ class GraphLogicLayer:
         :var self.__graph_page:        odkaz na nadradený tkinter widget
         :var self.__main_graph_frame:  odkaz na hlavné okno, v ktorom sú vykresľované grafy pre jednotlivé vrstvy
         :var self.__input_data:        vstupné dáta, načítané zo súboru
+        :var self.__number_of_points:  počet vstupných bodov, podľa neho je rozdelená spoločná dávka bodov a mriežky
         :var self.__points_config:     informácie o jednotlivých bodoch
-        :var self.__polygon_cords:     súradnice vrcholov zobrazovanej mriežky
+        :var self.__polygon_cords:     súradnice vrcholov zobrazovanej mriežky v tvare (počet vrcholov, počet vstupov).
+                                       Každý vrchol je počítaný len raz, aj keď patrí viacerým hranám.
+        :var self.__polygon_edges:     hrany mriežky v tvare (počet hrán, 2), obsahujú indexy začiatočného a koncového
+                                       vrcholu
         :var self.__number_of_layers:  počet vrstiev neurónovej siete
         :var self.__keras_model:       načítaný zo súboru, stará sa o výpočty. Sú v ňom menené váhy. Model so zmenenými
                                        váhami je možné uložiť.
         :var self.__active_layers:     obsahuje poradové čísla jednotlivých vrstiev, neurónovej siete,
                                        ktoré sú zobrazované
         :var self.__neural_layers:     list obsahujúci všetky vrstvy siete podľa ich poradia v rámci štruktúry NN
+        :var self.__activation_engine: počíta aktivácie vrstiev a pamätá si ich, aby bolo možné pri zmene začať výpočet
+                                       od zmenenej vrstvy
         :var self.__monitoring_thread: vlákno sledijúce zmenu váh a následne prepočítanie a prekreslenie grafov
-        :var self.__is_running:        premmenná pre monitorovacie vlákno, ktorá značí, či ešte program beží
-        :var self.__changed_layer_q:   zásobnik s unikátnymi id zmenených vrstiev. ID predstavuje poradové číslo vrstvy
-        :var self.__condition_var:     podmienková premenná, signalizujúca zmenu a potrebu preopočítania súradníc
+        :var self.__change_scheduler:  zhromažďuje zmenené vrstvy a pomocou generácií určuje, či je prebiehajúci výpočet
+                                       ešte aktuálny
+        :var self.__worker_pool:       vlákna, ktoré počas celého behu programu aplikujú zmeny na jednotlivých vrstvách.
+                                       Úlohy pracujú s tkinter objektmi, preto ide o vlákna a nie procesy.
+        :var self.__process_pool:      procesy, v ktorých je počítaná redukcia priestoru (PCA, metódy z registra)
+                                       väčších vrstiev. Vlákna z worker_pool na ich výsledok čakajú, projekcie všetkých
+                                       zmenených vrstiev tak bežia súčasne na všetkých jadrách. Procesy sú spúšťané
+                                       cez spawn a vykonávajú funkcie z DimensionReductionComponents.
+        :var self.__t_SNE_cache:       spoločná cache výsledkov t-SNE pre všetky vrstvy
+        :var self.__background_t_SNE:  procesy, v ktorých je t-SNE vrstiev počítané súčasne, najviac T_SNE_MAX_WORKERS
 
         Parametre
         ----------------------------------------------------------------------------------------------------------------
@@ -236,8 +287,10 @@ class GraphLogicLayer:
 
         # Zobrazované dáta
         self.__input_data = None
+        self.__number_of_points = 0
         self.__points_config = None
         self.__polygon_cords = None
+        self.__polygon_edges = None
 
         # Štruktúra siete, jednotlivé vrstvy, aktívne vrstvy pre zrýchlenie výpočtu
         self.__number_of_layers = 0
@@ -245,20 +298,25 @@ class GraphLogicLayer:
         self.__active_layers = None
         self.__neural_layers = list()
         self.__keras_layers = list()
+        self.__activation_engine = ActivationEngine(USE_NUMPY_ENGINE, CHECK_NUMPY_PARITY)
+        self.__t_SNE_cache = EmbeddingCache(T_SNE_CACHE_SIZE)
+        self.__background_t_SNE = BackgroundTSNE(T_SNE_REPORT_ITERATIONS, T_SNE_MAX_WORKERS)
+        # Slučka snímkov beží, kým výpočet môže označiť grafy na prekreslenie z iného vlákna.
+        render_scheduler.set_busy_check(lambda: self.is_calculating)
 
         # Vlákno sledujúce zmeny, aby sa zlepšil pocit s používania - menej sekajúce ovládanie
-        self.__changed_layer_q = QueueSet()
-        self.__condition_var = threading.Condition()
+        self.__change_scheduler = ChangeScheduler()
+        self.__worker_pool = WorkerPool('thread', WORKER_POOL_SIZE)
+        self.__process_pool = WorkerPool('process', PROCESS_POOL_SIZE)
         self.__monitoring_thread = threading.Thread(target=self.monitor_change)
 
         # Spustenie monitorovacieho vlákna.
-        self.__is_running = True
         self.__monitoring_thread.setDaemon(True)
         self.__monitoring_thread.start()
 
         # self.initialize(keras.models.load_model('modelik.h5'))
 
-    def initialize(self, model: keras.Model):
+    def initialize(self, model: 'keras.Model'):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
@@ -269,6 +327,7 @@ class GraphLogicLayer:
         Parametre
         ----------------------------------------------------------------------------------------------------------------
         :param model: načítaný keras model
+        :return: upozornenie na vrstvy, ktoré NumPy engine nepočíta zhodne s keras, alebo None
         """
         for layer in self.__neural_layers:
             layer.clear()
@@ -280,7 +339,9 @@ class GraphLogicLayer:
         self.__active_layers = list()
 
         self.__polygon_cords = None
+        self.__polygon_edges = None
         self.__input_data = None
+        self.__number_of_points = 0
 
         # Nastavenie inicializácia konfigu pre vstupné body.
         self.__points_config = dict()
@@ -299,88 +360,104 @@ class GraphLogicLayer:
             self.__neural_layers.append(neural_layer)
             i += 1
 
+        layer_parameters = [(layer.layer_weights, layer.layer_biases) for layer in self.__neural_layers]
+        mismatched_layers = self.__activation_engine.initialize(self.__keras_model, layer_parameters)
+        self.__activation_engine.set_active_layers(self.__active_layers)
+
         self.__main_graph_frame.initialize(self.__neural_layers, self.__active_layers)
+        if len(mismatched_layers) > 0:
+            return 'NumPy engine differs from keras on: {}'.format(', '.join(mismatched_layers))
+        return None
 
-    def recalculate_cords(self, starting_layer=0):
+    def recalculate_cords(self, starting_layer=0, generation=None):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Prepočíta súradnice bodov na jednotlivých vrstvách na základe nastavených váh.
-        Nie je možné použiť výstup jednej vrstvy ako vstup ďalšej vrstvy pre zrýchlenie výpočtu, aby sa nepočítali viac
-        krát veci čo už boli vypočítané. Preto je použité pre čiastočné zrýchlenie výpočtu využité viac vlakien, každé
-        pre jednu vrstvu.
-        """
-        # jedno vlakno 0.7328296000000023 s
-        # viac vlakien rychlejsie o 100ms
+        Výstup jednej vrstvy je použitý ako vstup ďalšej vrstvy. Aktivácie vrstiev pod zmenenou vrstvou sú uložené
+        v ActivationEngine, preto sa počíta až od zmenenej vrstvy a každá vrstva sa počíta najviac raz.
 
-        # Je možné paralelizovat výpočty. Pre každú rátanú vrstvu je použité jedno vlákno.
-        threads = []
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param starting_layer: poradové číslo najnižšej vrstvy, na ktorej došlo k zmene váh
+        :param generation:     generácia zmeny, pre ktorú sa počíta. Ak medzitým prišla novšia zmena, výpočet skončí.
+        :return: False ak bol výpočet prerušený novšou zmenou, inak True
+        """
+        # Vrstvy sú prechádzané vzostupne, aby bola každá ďalšia vrstva počítaná z uloženého výstupu predchádzajúcej.
         start = time.perf_counter()
-        for layer_number in self.__active_layers:
+        for layer_number in sorted(self.__active_layers):
+            if self.is_stale(generation):
+                return False
             if layer_number > starting_layer:
-                t = threading.Thread(target=self.set_points_for_layer, args=(layer_number,))
-                t.start()
-                threads.append(t)
-        # Po výpočtoch je potrebné počkať na dokončenie
-        for thread in threads:
-            thread.join()
+                self.set_points_for_layer(layer_number)
         end = time.perf_counter()
         print(f'Calculation time {end - start} s')
+        return True
+
+    def is_stale(self, generation=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zistí, či výpočet pre zadanú generáciu zmeny nebol nahradený novšou zmenou. Výpočty bez generácie (načítanie
+        bodov, zmena nastavení) nie sú nikdy zastarané.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation: generácia zmeny, pre ktorú sa počíta, alebo None
+        """
+        return generation is not None and self.__change_scheduler.is_stale(generation)
 
     def monitor_change(self):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Metóda je spustená v monitorovaciom vlákne. Vlákno beží počas celého behu programu.
+        Ak počas výpočtu príde novšia zmena, výpočet je prerušený a jeho výsledky nie sú zobrazené. Najnižšia vrstva
+        prerušeného výpočtu je zapamätaná, aby nasledujúci výpočet aktualizoval aj vrstvy, ktoré prerušený výpočet
+        nestihol.
         """
+        # Najnižšia vrstva, od ktorej ešte neboli zmeny zobrazené.
+        pending_starting_layer = None
         # Sleduje zmeny váh a biasov na vrstvách.
-        while self.__is_running:
-            self.__condition_var.acquire()
-
-            # Čaká, kým sa neobjaví zmena a potom otestuje, či je v zásobníku nejaká vrstva.
-            while not self.__changed_layer_q.is_empty():
-                self.__condition_var.wait()
-                # Otestuje či náhodou beh programu už neskončil.
-                if not self.__is_running:
-                    self.__condition_var.release()
-                    return
-            if not self.__is_running:
-                self.__condition_var.release()
+        while True:
+            # Čaká, kým sa neobjaví zmena. Ak beh programu skončil, vlákno končí.
+            changes = self.__change_scheduler.wait_for_changes()
+            if changes is None:
                 return
-            # Vytvorenie kópie zásobníka. Vyčistenie zásboníka.
-            actual_changed = self.__changed_layer_q.copy()
-            self.__changed_layer_q.clear()
-            self.__condition_var.release()
+            actual_changed, generation, changed_parameters = changes
 
             # Aplikovanie zmien na zmeneých vrstvách. Nájdenie vrstvy, od ktorej je potrebné aplikovať zmeny.
             starting_layer_number = self.__number_of_layers
+            if pending_starting_layer is not None:
+                starting_layer_number = pending_starting_layer
+            # Vrstvy sú zoradené vzostupne, aby sa zmena na vyššej vrstve neaplikovala na už neplatné aktivácie.
             for layer_number in actual_changed:
                 if layer_number < starting_layer_number:
                     starting_layer_number = layer_number
-                layer = self.__neural_layers[layer_number]
-                self.set_layer_weights_and_biases(layer_number, layer.layer_weights, layer.layer_biases)
-            self.recalculate_cords(starting_layer_number)
-            self.broadcast_changes(starting_layer_number)
-            # time.sleep(0.05)
+                self.__activation_engine.weights_changed(layer_number, changed_parameters[layer_number])
+            pending_starting_layer = starting_layer_number
 
-    def get_activation_for_layer(self, input_points, layer_number):
+            # Zastarané výsledky nie sú zobrazené, zmeny sa zobrazia pri spracovaní novšej zmeny.
+            if not self.recalculate_cords(starting_layer_number, generation):
+                continue
+            if self.broadcast_changes(starting_layer_number, generation):
+                pending_starting_layer = None
+            self.__change_scheduler.mark_processed(generation)
+
+    def get_activation_for_layer(self, layer_number):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
-        Vráti aktiváciu pre danú vrstvu na základe vstupných dát.
+        Vráti aktiváciu pre danú vrstvu na základe vstupných dát. Vstupné body a body hrán mriežky sú spojené do jednej
+        dávky, preto je každá vrstva počítaná len raz. Prvých self.__number_of_points riadkov patrí vstupným bodom,
+        zvyšok vrcholom mriežky.
 
         Parametre
         ----------------------------------------------------------------------------------------------------------------
-        :param input_points: vstupné body, ktorých aktiváciu chceme získať
         :param layer_number: číslo vrstvy, ktorej výstup chceme získať
         """
         # Aktivacia na jednotlivých vrstvách. Ak je to prvá, vstupná vrstva, potom je aktivácia len vstupné hodnoty.
-        if layer_number == 0:
-            return input_points
-        else:
-            intermediate_layer_mode = keras.Model(inputs=self.__keras_model.input,
-                                                  outputs=self.__keras_layers[layer_number - 1].output)
-            return intermediate_layer_mode.predict(input_points)
+        return self.__activation_engine.get_activation(INPUT_BATCH, layer_number)
 
     def set_points_for_layer(self, layer_number):
         """
@@ -395,19 +472,23 @@ class GraphLogicLayer:
         """
         # nastavenie vstupných bodov
         if self.__input_data is not None:
-            self.__neural_layers[layer_number].point_cords = self.get_activation_for_layer(self.__input_data,
-                                                                                           layer_number).transpose()
+            activation = self.get_activation_for_layer(layer_number)
+            activation_version = self.__activation_engine.get_activation_version(INPUT_BATCH, layer_number)
+            self.__neural_layers[layer_number].set_point_cords(activation[:self.__number_of_points].transpose(),
+                                                               activation_version)
         if self.__neural_layers[layer_number].calculate_polygon:
             self.set_polygon_cords(layer_number)
 
     def set_polygon_cords(self, layer_number):
-        # Výpočet aktivácie pre jednotlivé body hrán polygonu.
+        # Výpočet aktivácie pre jednotlivé vrcholy polygonu. Aktivácia dávky je uložená, preto nie je počítaná znovu.
+        # Hrany sú z vrcholov poskladané až pri zobrazení.
         if self.__polygon_cords is not None:
-            start_points = self.get_activation_for_layer(self.__polygon_cords[0], layer_number).transpose()
-            end_points = self.get_activation_for_layer(self.__polygon_cords[1], layer_number).transpose()
-            self.__neural_layers[layer_number].polygon_cords_tuples = [start_points, end_points]
+            activation = self.get_activation_for_layer(layer_number)
+            neural_layer = self.__neural_layers[layer_number]
+            neural_layer.polygon_edges = self.__polygon_edges
+            neural_layer.polygon_vertices_cords = activation[self.__number_of_points:].transpose()
 
-    def broadcast_changes(self, start_layer=0):
+    def broadcast_changes(self, start_layer=0, generation=None):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
@@ -417,14 +498,32 @@ class GraphLogicLayer:
         Paramatre
         ----------------------------------------------------------------------------------------------------------------
         :param start_layer: poradové číslo vrstvy. Vrstvy s poradovým číslom väčším ako je toto, budú prekreslené.
-        :return:
-        """
-        # Pre aktívne vrstvy, ktoré sú väčšie ako začiatočná vrstva sa aplikujú vykonané zmeny.
-        for layer_number in self.__active_layers:
-            if layer_number > start_layer:
-                self.__neural_layers[layer_number].apply_changes()
-                self.__neural_layers[layer_number].redraw_graph_if_active()
+        :param generation:  generácia zmeny, pre ktorú sa počíta. Ak medzitým prišla novšia zmena, aplikovanie skončí.
+        :return: False ak bolo aplikovanie prerušené novšou zmenou, inak True
+        """
+        # Pre aktívne vrstvy, ktoré sú väčšie ako začiatočná vrstva sa aplikujú vykonané zmeny. Vrstvy sú na sebe
+        # nezávislé, preto sú zmeny aplikované súčasne vo vláknach worker poolu.
+        changed_layers = [self.__neural_layers[layer_number] for layer_number in self.__active_layers
+                          if layer_number > start_layer]
+        tasks = [(layer.layer_name, layer.apply_changes, (lambda: self.is_stale(generation),))
+                 for layer in changed_layers]
+        self.__worker_pool.run_tasks(tasks)
+
+        # Výsledok mohol byť medzičasom nahradený novšou zmenou, zastarané výsledky sa nevykresľujú.
+        if self.is_stale(generation):
+            return False
+        for layer in changed_layers:
+            layer.redraw_graph_if_active()
         self.__main_graph_frame.update_active_options_layer(start_layer)
+        return True
+
+    def update_active_layers(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Oznámi ActivationEngine zmenu zobrazovaných vrstiev, aby mohol podľa potreby vytvoriť nový viacvýstupový model.
+        """
+        self.__activation_engine.set_active_layers(self.__active_layers)
 
     def redraw_active_graphs(self, start_layer=0):
         """
@@ -440,11 +539,15 @@ class GraphLogicLayer:
             if layer_number > start_layer:
                 self.__neural_layers[layer_number].redraw_graph_if_active()
 
-    def set_layer_weights_and_biases(self, layer_number, layer_weights, layer_biases):
-        # Nastvaenie hodnôt a biasu priamo do keras modelu.
-        self.__keras_layers[layer_number].set_weights([np.array(layer_weights), np.array(layer_biases)])
+    def synchronize_model_weights(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zapíše do keras modelu všetky zmenené váhy, ktorých zápis bol odložený. Volá sa pred uložením modelu.
+        """
+        self.__activation_engine.synchronize_keras_weights()
 
-    def signal_change_on_layer(self, layer_number):
+    def signal_change_on_layer(self, layer_number, changed_parameter=None):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
@@ -452,13 +555,13 @@ class GraphLogicLayer:
 
         Parametre
         ----------------------------------------------------------------------------------------------------------------
-        :param layer_number: poradové číslo vrstvy, na ktorej došlo k zmene váh
+        :param layer_number:      poradové číslo vrstvy, na ktorej došlo k zmene váh
+        :param changed_parameter: zmenená váha alebo bias, None ak nie je známe, čo sa zmenilo
         """
         # Oznámi, že došlo k zmene na vrstve. Tá je zaradená do zásobníka.
-        self.__condition_var.acquire()
-        self.__changed_layer_q.add(layer_number)
-        self.__condition_var.notify()
-        self.__condition_var.release()
+        self.__change_scheduler.signal_change(layer_number, changed_parameter)
+        # Zmena môže spustiť nový výpočet, jeho priebeh a chyby sú sledované z hlavného vlákna.
+        self.__main_graph_frame.watch_calculation_status()
 
     def load_points(self, filepath):
         """
@@ -507,6 +610,7 @@ class GraphLogicLayer:
                 if False in is_column_numeric:
                     return 'Data columns contains non numeric values!'
                 self.__input_data = data.to_numpy()
+                self.__number_of_points = len(self.__input_data)
 
                 # Z farieb, ktoré sa nachádzajú v premennej matplotlibu sú zvolené základné farby a potom aj ďalšie
                 # farby, z ktorých sú zvolené len tmavšie odtiene.
@@ -536,27 +640,27 @@ class GraphLogicLayer:
                     # bodov
                     minimal_cord = np.min(self.__input_data[:, :shape_of_input], axis=0).tolist()
                     maximal_cord = np.max(self.__input_data[:, :shape_of_input], axis=0).tolist()
-                    if shape_of_input == 3:
-                        polygon = Polygon(minimal_cord, maximal_cord, [5, 5, 5])
-                    elif shape_of_input == 2:
-                        polygon = Polygon(minimal_cord, maximal_cord, [5, 5, 5])
-
-                    polygon_peak_cords = np.array(polygon.Peaks)
-
-                    edges_tuples = np.array(polygon.Edges)
+                    polygon = Polygon(minimal_cord, maximal_cord, POLYGON_DIVISIONS[shape_of_input])
 
-                    self.__polygon_cords = []
-
-                    self.__polygon_cords.append(polygon_peak_cords[:, edges_tuples[:, 0]].transpose())
-
-                    self.__polygon_cords.append(polygon_peak_cords[:, edges_tuples[:, 1]].transpose())
+                    # Vrcholy mriežky sú uložené len raz, hrany obsahujú len indexy vrcholov.
+                    self.__polygon_cords = np.array(polygon.Peaks).transpose()
+                    self.__polygon_edges = np.array(polygon.Edges)
 
                     for layer in self.__neural_layers:
                         layer.possible_polygon = True
                 else:
+                    self.__polygon_cords = None
+                    self.__polygon_edges = None
                     for layer in self.__neural_layers:
                         layer.possible_polygon = False
 
+                # Vstupné body a vrcholy mriežky sú spojené do jednej dávky, aby bola každá vrstva počítaná len raz.
+                # Po výpočte je dávka opäť rozdelená.
+                input_batch = [self.__input_data]
+                if self.__polygon_cords is not None:
+                    input_batch.append(self.__polygon_cords)
+                self.__activation_engine.set_input(INPUT_BATCH, np.concatenate(input_batch))
+
                 # Ak prebehlo načítvanaie bez chyby, sú aplikované zmeny,
                 self.recalculate_cords(-1)
                 self.broadcast_changes(-1)
@@ -567,11 +671,47 @@ class GraphLogicLayer:
         else:
             return 'No Keras model loaded!'
 
+    def run_projection(self, function, data, *args):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vykonanie výpočtu redukcie priestoru. Pri väčších dátach je výpočet vykonaný v procese z process_pool, aby
+        projekcie viacerých vrstiev nesúťažili o GIL. Aktivácie sú procesu odovzdané cez zdieľanú pamäť, späť je
+        serializovaný len model a projekcia. Pri malých dátach by spustenie úlohy v procese trvalo dlhšie ako výpočet.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param function: funkcia definovaná na úrovni modulu, prvým argumentom sú dáta
+        :param data:     dáta v tvare (počet vzoriek, počet neurónov)
+        :param args:     ďalšie argumenty funkcie
+        :return: výsledok funkcie
+        """
+        if data.size < PROCESS_POOL_MIN_SIZE:
+            return function(data, *args)
+        result, _ = self.__process_pool.run_with_shared_array(function, data, *args)
+        return result
+
     def __del__(self):
-        self.__is_running = False
-        self.__condition_var.acquire()
-        self.__condition_var.notify()
-        self.__condition_var.release()
+        self.__change_scheduler.stop()
+        self.__worker_pool.shutdown()
+        self.__process_pool.shutdown()
+        self.__background_t_SNE.shutdown()
+
+    @property
+    def t_SNE_cache(self):
+        return self.__t_SNE_cache
+
+    @property
+    def background_t_SNE(self):
+        return self.__background_t_SNE
+
+    @property
+    def has_pending_changes(self):
+        return self.__change_scheduler.has_pending_changes
+
+    @property
+    def is_calculating(self):
+        return self.has_pending_changes or self.__background_t_SNE.is_running
 
 
 class MainGraphFrame(tk.LabelFrame):
@@ -731,6 +871,7 @@ class MainGraphFrame(tk.LabelFrame):
             self.__active_layers.append(layer_number)
             self.__add_graph_frame.hide_item(layer_name)
 
+            self.__logic_layer.update_active_layers()
             self.__logic_layer.set_points_for_layer(layer_number)
             layer_to_show.apply_changes()
             # Ak je počet aktívnych vrstiev rovný celkovému počtu vrstiev je skrytý panel pre pridávanie nových vrstiev.
@@ -754,6 +895,7 @@ class MainGraphFrame(tk.LabelFrame):
             layer.clear()
 
             self.__active_layers.remove(layer_number)
+            self.__logic_layer.update_active_layers()
             self.__add_graph_frame.show_item(layer_name)
             if len(self.__active_layers) < self.__number_of_layers:
                 self.__add_graph_frame.pack(side='right', fill='y', expand=True)
@@ -771,6 +913,10 @@ class MainGraphFrame(tk.LabelFrame):
     def update_active_options_layer(self, start_layer):
         self.__options_frame.update_active_options_layer(start_layer)
 
+    def watch_calculation_status(self):
+        self.__options_frame.start_status_updates()
+        render_scheduler.wake()
+
 
 class OptionsFrame(tk.LabelFrame):
     def __init__(self, parent, logicalLayer: GraphLogicLayer, *args, **kwargs):
@@ -810,20 +956,38 @@ class OptionsFrame(tk.LabelFrame):
                                           Sú tu zobrazované aj informácie z metódy prípadne zoznam nastaviteľných
                                           parametrov, potrebných pre použitie metódy
         :var self.__actual_used_label:    label, ktorý oboznámjue používateľa s práve použitou metódou redukcie
-        :var self.__no_method_radio:      radio button, ktorý označuje že je zvolená metóda no_method
-        :var self.__PCA_method_radio:     radio button, ktorý označuje že je zvolená metóda PCA
-        :var self.__tSNE_method_radio:    radio button, ktorý označuje že je zvolená metóda t-SNE
+        :var self.__method_radios:        ku každej metóde z registra je priradený radio button, ktorý označuje, že je
+                                          metóda zvolená
         :var self.__PCA_info_frame:       obaľuje listboxy obashujúce informácie po použití metódy PCA
+        :var self.__PCA_options_frame:    obaľuje možnosti výpočtu PCA
+        :var self.__PCA_solver_var:       zvolený spôsob výpočtu PCA. 'full' počíta všetky komponenty, 'randomized' len
+                                          zadaný počet hlavných komponentov pomocou randomizovaného SVD, 'incremental'
+                                          zadaný počet komponentov postupne po úsekoch vzoriek bez škálovanej kópie
+                                          celej matice aktivácií
+        :var self.__PCA_components_label: rewritable label pre počet počítaných komponentov pri randomizovanom PCA
+        :var self.__PCA_freeze_check:     checkbox, ktorý zachytáva, či je báza PCA zmrazená. Pri zmrazenej báze sú nové
+                                          aktivácie len premietnuté do naposledy fitnutých komponentov
+        :var self.__PCA_refit_button:     tlačidlo na vynútenie nového fitu PCA
         :var self.__PC_explanation_frame: obsahuje listbox, v ktorom je vyjadrená koľko percent variability je 
                                           vysvetelných jednotlivými komponentmi PCA
         :var self.__PC_explanation_lb:    listbox v ktorom je zobrazené aká variabilita je vyjadrená jednotlivými PC
         :var self.__PC_scores_frame:      obsahuje listbox, ktorý udáva ktoré neuróny majú najväčšiu váhu pri PCA
         :var self.__PC_scores_lb:         listbox v ktorom sú zoradené neuróny s najäčším vplyvom
-        :var self.__tSNE_parameter_frame: obaľovací widget, obsahuje zoznam nastaviteľných parametrov, potrebných pre
-                                          metódu t-SNE
-        :var self.__tSNE_parameters_dict: slovník, ku v ktorom su k jednotlivým názvom parametrov priradené rewritable
-                                          labels
+        :var self.__tSNE_parameter_frame: frame s parametrami t-SNE, obsahuje aj vlastné nastavenia t-SNE
+        :var self.__tSNE_warm_start_check: checkbox, ktorý zachytáva, či má byť t-SNE po malej zmene aktivácií počítané
+                                           z predchádzajúceho výsledku
+        :var self.__method_cost_label:    zobrazuje náročnosť zvolenej metódy a či podporuje premietnutie bez nového fitu
+        :var self.__method_error_label:   zobrazuje chybu posledného výpočtu metódy z registra aktívnej vrstvy
+        :var self.__method_option_frames: k metódam z registra, ktoré majú nastavenia, je priradený frame s nimi
+        :var self.__method_parameters_dicts: k metódam z registra, ktoré deklarujú parametre, je priradený slovník
+                                          rewritable labels ich parametrov
+        :var self.__method_info_frames:   k metódam z registra, ktoré zobrazujú informácie o výsledku, je priradená
+                                          dvojica (frame s informáciami, funkcia na ich aktualizáciu)
+        :var self.__tSNE_landmark_check:  checkbox, ktorý zachytáva, či má byť t-SNE počítané len pre landmarky a ostatné
+                                          body umiestnené podľa najbližších landmarkov
+        :var self.__tSNE_landmark_dict:   slovník, v ktorom sú k parametrom landmark režimu priradené rewritable labels
         :var self.__apply_method_btn:     tlačidlo na použitie zvolenej metódy pomocou radio buttons
+        :var self.__status_update_id: id naplánovaného zobrazenia stavu výpočtu, None ak nie je naplánované
 
         Parmetre
         ----------------------------------------------------------------------------------------------------------------
@@ -887,20 +1051,22 @@ class OptionsFrame(tk.LabelFrame):
 
         self.__currently_used_method = 'No method'
 
-        # Jednotlivé metódy.
+        # Jednotlivé metódy z registra. Vstavané metódy sú v prvom riadku, ďalšie metódy v druhom.
         self.__method_var = tk.StringVar()
-        self.__no_method_radio = tk.Radiobutton(self.__radio_button_group_frame, command=self.on_method_change,
-                                                text='No method', variable=self.__method_var, value='No method')
-        self.__no_method_radio.select()
-        self.__no_method_radio.pack(side='left')
-        self.__PCA_method_radio = tk.Radiobutton(self.__radio_button_group_frame, command=self.on_method_change,
-                                                 text='PCA', variable=self.__method_var, value='PCA')
-        self.__PCA_method_radio.pack(side='left')
-        self.__PCA_method_radio.deselect()
-        self.__tSNE_method_radio = tk.Radiobutton(self.__radio_button_group_frame, command=self.on_method_change,
-                                                  text='t-SNE', variable=self.__method_var, value='t-SNE')
-        self.__tSNE_method_radio.pack(side='left')
-        self.__tSNE_method_radio.deselect()
+        self.__registered_methods_frame = tk.Frame(self.__dim_reduction_frame)
+        self.__registered_methods_frame.pack(fill='x', expand=True)
+        self.__method_radios = dict()
+        for method in get_registered_methods():
+            radio_frame = self.__radio_button_group_frame if method.builtin else self.__registered_methods_frame
+            method_radio = tk.Radiobutton(radio_frame, command=self.on_method_change,
+                                          text=method.name, variable=self.__method_var, value=method.name)
+            method_radio.pack(side='left')
+            self.__method_radios[method.name] = method_radio
+        self.__method_var.set(self.__currently_used_method)
+        self.__method_cost_label = tk.Label(self.__dim_reduction_frame, text='')
+        self.__method_cost_label.pack()
+        self.__method_error_label = tk.Label(self.__dim_reduction_frame, text='', fg='red')
+        self.__method_error_label.pack()
 
         self.__PCA_info_frame = tk.LabelFrame(self.__dim_reduction_frame, text='PCA information')
 
@@ -916,19 +1082,80 @@ class OptionsFrame(tk.LabelFrame):
         self.__PC_scores_lb = tk.Listbox(self.__PC_scores_frame, highlightthickness=0)
         self.__PC_scores_lb.pack(fill='both')
 
-        self.__tSNE_parameter_frame = tk.LabelFrame(self.__dim_reduction_frame, text='t-SNE parameters')
-        self.__tSNE_parameters_dict = dict()
-
-        t_sne_parameter_id_list = ['n_components', 'perplexity', 'early_exaggeration', 'learning_rate', 'n_iter']
-        t_sne_parameter_label = ['Number of components:', 'Perplexity:', 'Early exaggeration:', 'Learning rate:',
-                                 'Number of iteration:']
-
-        for i in range(len(t_sne_parameter_id_list)):
-            t_sne_parameter = RewritableLabel(self.__tSNE_parameter_frame, t_sne_parameter_id_list[i],
-                                              self.validate_t_sne_entry, t_sne_parameter_label[i], '-')
-            t_sne_parameter.set_entry_width(3)
-            t_sne_parameter.pack(fill='x')
-            self.__tSNE_parameters_dict[t_sne_parameter_id_list[i]] = t_sne_parameter
+        self.__PCA_options_frame = tk.LabelFrame(self.__dim_reduction_frame, text='PCA options')
+        self.__PCA_solver_var = tk.StringVar()
+        self.__PCA_full_radio = tk.Radiobutton(self.__PCA_options_frame, command=self.on_PCA_solver_change,
+                                               text='Full', variable=self.__PCA_solver_var, value='full')
+        self.__PCA_full_radio.grid(row=0, column=0, sticky='w')
+        self.__PCA_randomized_radio = tk.Radiobutton(self.__PCA_options_frame, command=self.on_PCA_solver_change,
+                                                     text='Randomized', variable=self.__PCA_solver_var,
+                                                     value='randomized')
+        self.__PCA_randomized_radio.grid(row=0, column=1, sticky='w')
+        self.__PCA_incremental_radio = tk.Radiobutton(self.__PCA_options_frame, command=self.on_PCA_solver_change,
+                                                      text='Incremental', variable=self.__PCA_solver_var,
+                                                      value='incremental')
+        self.__PCA_incremental_radio.grid(row=0, column=2, sticky='w')
+        self.__PCA_components_label = RewritableLabel(self.__PCA_options_frame, 'n_computed_components',
+                                                      self.validate_PCA_entry, 'Computed components:', '-')
+        self.__PCA_components_label.set_entry_width(4)
+        self.__PCA_components_label.grid(row=1, column=0, columnspan=3, sticky='w')
+        self.__PCA_freeze_basis = tk.BooleanVar()
+        self.__PCA_freeze_check = tk.Checkbutton(self.__PCA_options_frame, text='Freeze basis',
+                                                 command=self.on_PCA_freeze_check, variable=self.__PCA_freeze_basis)
+        self.__PCA_freeze_check.grid(row=2, column=0, sticky='w')
+        self.__PCA_refit_button = tk.Button(self.__PCA_options_frame, text='Refit', command=self.on_PCA_refit)
+        self.__PCA_refit_button.grid(row=2, column=1, sticky='w')
+
+        # Nastavenia metód, ktoré deklarujú parametre, sú vytvorené podľa týchto parametrov. Vstavané metódy majú
+        # navyše vlastné nastavenia pridané do rovnakého frame.
+        self.__method_option_frames = dict()
+        self.__method_parameters_dicts = dict()
+        for method in get_registered_methods():
+            if not method.parameter_labels:
+                continue
+            parameter_frame = tk.LabelFrame(self.__dim_reduction_frame, text=f'{method.name} parameters')
+            parameters_dict = dict()
+            for parameter_id, parameter_label in method.parameter_labels:
+                rewritable_label = RewritableLabel(parameter_frame, parameter_id,
+                                                   lambda id, value, name=method.name:
+                                                   self.validate_method_entry(name, id, value),
+                                                   parameter_label, '-')
+                rewritable_label.set_entry_width(3)
+                rewritable_label.pack(fill='x')
+                parameters_dict[parameter_id] = rewritable_label
+            self.__method_option_frames[method.name] = parameter_frame
+            self.__method_parameters_dicts[method.name] = parameters_dict
+        self.__method_option_frames['PCA'] = self.__PCA_options_frame
+        # Frame s informáciami o použitej metóde a funkcia, ktorá ich aktualizuje.
+        self.__method_info_frames = {'PCA': (self.__PCA_info_frame, self.update_PCA_information)}
+
+        self.__tSNE_parameter_frame = self.__method_option_frames['t-SNE']
+        self.__tSNE_warm_start = tk.BooleanVar()
+        self.__tSNE_warm_start_check = tk.Checkbutton(self.__tSNE_parameter_frame, text='Warm start',
+                                                      command=self.on_tSNE_warm_start_check,
+                                                      variable=self.__tSNE_warm_start)
+        self.__tSNE_warm_start_check.pack(anchor='w')
+
+        self.__tSNE_landmark = tk.BooleanVar()
+        self.__tSNE_landmark_check = tk.Checkbutton(self.__tSNE_parameter_frame, text='Landmarks',
+                                                    command=self.on_tSNE_landmark_check,
+                                                    variable=self.__tSNE_landmark)
+        self.__tSNE_landmark_check.pack(anchor='w')
+        self.__tSNE_landmark_dict = dict()
+        for landmark_parameter_id, landmark_parameter_label in [('n_landmarks', 'Number of landmarks:'),
+                                                                ('n_neighbors', 'Number of neighbours:')]:
+            landmark_parameter = RewritableLabel(self.__tSNE_parameter_frame, landmark_parameter_id,
+                                                 self.validate_landmark_entry, landmark_parameter_label, '-')
+            landmark_parameter.set_entry_width(5)
+            landmark_parameter.pack(fill='x')
+            self.__tSNE_landmark_dict[landmark_parameter_id] = landmark_parameter
+
+        self.__tSNE_progress_frame = tk.Frame(self.__tSNE_parameter_frame)
+        self.__tSNE_progress_label = tk.Label(self.__tSNE_progress_frame, text='')
+        self.__tSNE_progress_label.pack(side='left')
+        self.__tSNE_cancel_btn = tk.Button(self.__tSNE_progress_frame, text='Cancel', command=self.on_tSNE_cancel)
+        self.__tSNE_cancel_btn.pack(side='right')
+        self.__tSNE_progress_frame.pack(fill='x')
 
         self.__apply_method_btn = tk.Button(self.__dim_reduction_frame, text='Use method', command=self.use_selected_method)
         self.__apply_method_btn.pack(side='bottom')
@@ -947,6 +1174,7 @@ class OptionsFrame(tk.LabelFrame):
 
         self.__active_layer = None
         self.__changed_config = None
+        self.__status_update_id = None
 
     def initialize(self):
         """
@@ -1012,23 +1240,14 @@ class OptionsFrame(tk.LabelFrame):
         Nastavenie hodnôt jednotlivých vstuov pre časť s možnosťami pre redukciu priestoru.
         """
         self.set_actual_method_lable(self.__currently_used_method)
-        config_selected_method = self.__changed_config['config_selected_method']
-
-        self.__no_method_radio.deselect()
-        self.__PCA_method_radio.deselect()
-        self.__tSNE_method_radio.deselect()
-
-        if config_selected_method == 'No method':
-            self.__no_method_radio.select()
-        elif config_selected_method == 'PCA':
-            self.__PCA_method_radio.select()
-        elif config_selected_method == 't-SNE':
-            self.__tSNE_method_radio.select()
+        self.__method_radios[self.__changed_config['config_selected_method']].select()
 
-        if self.__currently_used_method == 'PCA':
-            self.update_PCA_information()
+        if self.__currently_used_method in self.__method_info_frames:
+            self.__method_info_frames[self.__currently_used_method][1]()
 
+        self.initialize_PCA_options()
         self.initialize_t_sne_parameters()
+        self.initialize_method_parameters()
         self.on_method_change()
 
     def initialize_with_layer_config(self, neural_layer, config):
@@ -1046,28 +1265,65 @@ class OptionsFrame(tk.LabelFrame):
         self.__active_layer = neural_layer
         self.__changed_config = config
         self.update_selected_config()
+        self.start_status_updates()
+
+    def initialize_PCA_options(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Nastavenie možností výpočtu PCA na základe configu.
+        """
+        pca_config = self.__changed_config['PCA_config']
+        self.__PCA_solver_var.set(pca_config['solver'])
+        max_components = pca_config['parameter_borders']['n_computed_components'][2]
+        self.__PCA_components_label.set_label_name(f'Computed components (max {max_components}):')
+        self.__PCA_components_label.set_variable_label(pca_config['n_computed_components'])
+        self.show_PCA_components_option()
+        if pca_config['freeze_basis']:
+            self.__PCA_freeze_check.select()
+        else:
+            self.__PCA_freeze_check.deselect()
 
     def initialize_t_sne_parameters(self):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
-        Predvyplnenie parametrov pre metódu t-SNE.
+        Predvyplnenie vlastných nastavení t-SNE (warm start, landmark režim). Parametre t-SNE sú predvyplnené spolu
+        s parametrami ostatných metód.
         """
         t_sne_config = self.__changed_config['t_SNE_config']
-        actual_used_config = t_sne_config['used_config']
-        options_config = t_sne_config['options_config']
-        number_of_components = t_sne_config['parameter_borders']['n_components'][2]
-        self.__tSNE_parameters_dict['n_components'].set_label_name(f'Number of components (max {number_of_components}):')
-        for key in self.__tSNE_parameters_dict:
-            rewritable_label = self.__tSNE_parameters_dict[key]
-            rewritable_label.set_variable_label(options_config[key])
-
-            # Ak sa aktuálne používaná hodnota parametra nerovná naposledy nastavenej hodnote parametra je tento
-            # parameter označený ako zmenený no ešte nepoužitý.
-            if actual_used_config[key] == options_config[key]:
-                rewritable_label.set_mark_changed(False)
-            else:
-                rewritable_label.set_mark_changed(True)
+        if t_sne_config['warm_start']:
+            self.__tSNE_warm_start_check.select()
+        else:
+            self.__tSNE_warm_start_check.deselect()
+
+        landmark_config = t_sne_config['landmark_config']
+        if landmark_config['enabled']:
+            self.__tSNE_landmark_check.select()
+        else:
+            self.__tSNE_landmark_check.deselect()
+        for key in self.__tSNE_landmark_dict:
+            self.__tSNE_landmark_dict[key].set_variable_label(landmark_config[key])
+
+    def initialize_method_parameters(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Predvyplnenie parametrov metód z registra.
+        """
+        for method_name, parameters_dict in self.__method_parameters_dicts.items():
+            method_config = get_method(method_name).get_layer_config(self.__changed_config)
+            actual_used_config = method_config['used_config']
+            options_config = method_config['options_config']
+            if 'n_components' in parameters_dict:
+                max_components = method_config['parameter_borders']['n_components'][2]
+                parameters_dict['n_components'].set_label_name(f'Number of components (max {max_components}):')
+            for key in parameters_dict:
+                rewritable_label = parameters_dict[key]
+                rewritable_label.set_variable_label(options_config[key])
+                # Ak sa aktuálne používaná hodnota parametra nerovná naposledy nastavenej hodnote parametra je tento
+                # parameter označený ako zmenený no ešte nepoužitý.
+                rewritable_label.set_mark_changed(actual_used_config[key] != options_config[key])
 
     def update_selected_config(self):
         """
@@ -1121,48 +1377,46 @@ class OptionsFrame(tk.LabelFrame):
         """
         if self.__active_layer is not None and self.__changed_config is not None:
             actual_method = self.__changed_config['used_method']
-            if actual_method == 'PCA' and start_layer < self.__active_layer.layer_number:
-                self.update_PCA_information()
+            if actual_method in self.__method_info_frames and start_layer < self.__active_layer.layer_number:
+                self.__method_info_frames[actual_method][1]()
 
     def use_selected_method(self):
         if self.__active_layer is not None:
-            method = self.__method_var.get()
+            method = get_method(self.__method_var.get())
             need_recalculation = False
-            if method == 't-SNE':
-                need_recalculation = self.apply_t_SNE_options_if_changed()
+            if method.name in self.__method_parameters_dicts:
+                method_config = method.get_layer_config(self.__changed_config)
+                if not self.check_method_parameters(method, method_config['options_config'],
+                                                    method_config.get('landmark_config')):
+                    return
+                need_recalculation = self.apply_method_options_if_changed(method)
 
-            if method != self.__changed_config['used_method']:
+            if method.name != self.__changed_config['used_method']:
                 need_recalculation = True
-                self.__changed_config['used_method'] = self.__currently_used_method = method
+                self.__changed_config['used_method'] = self.__currently_used_method = method.name
             if need_recalculation:
                 self.__changed_config['apply_changes'] = True
                 self.__active_layer.use_config()
-                self.__actual_used_label.configure(text=f'Actual used: {method}')
-
-                # Hide all informations
-                self.hide_all_methods_information()
-                if method == 'PCA':
-                    self.update_PCA_information()
-                    self.__PCA_info_frame.pack(fill='x', expand=True)
-                elif method == 't-SNE':
-                    self.__tSNE_parameter_frame.pack(fill='x', expand=True)
-
-                self.set_actual_method_lable(method)
+                self.show_method_options(method.name)
+                self.set_actual_method_lable(method.name)
+                self.start_status_updates()
             self.set_cords_entries_according_chosen_method()
 
-    def apply_t_SNE_options_if_changed(self):
+    def apply_method_options_if_changed(self, method):
         changed = False
         if self.__changed_config is not None:
-            t_sne_config = self.__changed_config['t_SNE_config']
-            used_config = t_sne_config['used_config']
-            options_config = t_sne_config['options_config']
+            method_config = method.get_layer_config(self.__changed_config)
+            used_config = method_config['used_config']
+            options_config = method_config['options_config']
             for key in used_config:
                 if used_config[key] != options_config[key]:
                     changed = True
                     used_config[key] = options_config[key]
             if changed:
-                t_sne_config['displayed_cords'] = list(range(used_config['n_components']))
-                self.set_entries_not_marked(self.__tSNE_parameters_dict.values())
+                number_of_components = used_config.get('n_components', self.__changed_config['number_of_dimensions'])
+                method_config['displayed_cords'] = list(range(min(3, number_of_components)))
+                method_config['n_possible_components'] = number_of_components
+                self.set_entries_not_marked(self.__method_parameters_dicts[method.name].values())
         return changed
 
     def update_t_SNE_new_parameters(self):
@@ -1197,8 +1451,24 @@ class OptionsFrame(tk.LabelFrame):
         self.hide_all_methods_information()
 
     def hide_all_methods_information(self):
-        self.__PCA_info_frame.pack_forget()
-        self.__tSNE_parameter_frame.pack_forget()
+        for options_frame in self.__method_option_frames.values():
+            options_frame.pack_forget()
+        for info_frame, _ in self.__method_info_frames.values():
+            info_frame.pack_forget()
+
+    def show_method_options(self, method_name):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zobrazenie nastavení zvolenej metódy. Informácie o výsledku metódy sú zobrazené, len ak je metóda použitá.
+        """
+        self.hide_all_methods_information()
+        if method_name in self.__method_option_frames:
+            self.__method_option_frames[method_name].pack(fill='x')
+        if method_name in self.__method_info_frames and self.__changed_config['used_method'] == method_name:
+            info_frame, update_information = self.__method_info_frames[method_name]
+            update_information()
+            info_frame.pack(fill='x')
 
     def set_actual_method_lable(self, method_name):
         self.__actual_used_label.configure(text=f'Actual used: {method_name}')
@@ -1207,16 +1477,153 @@ class OptionsFrame(tk.LabelFrame):
         if self.__changed_config:
             method = self.__method_var.get()
             self.__changed_config['config_selected_method'] = method
-            if method == 'PCA':
-                if self.__changed_config['used_method'] == method:
-                    self.__PCA_info_frame.pack(fill='x')
-                self.__tSNE_parameter_frame.pack_forget()
-            elif method == 't-SNE':
-                self.__PCA_info_frame.pack_forget()
-                self.__tSNE_parameter_frame.pack(fill='x')
-            else:
-                self.__PCA_info_frame.pack_forget()
-                self.__tSNE_parameter_frame.pack_forget()
+            self.show_method_options(method)
+            method_info = get_method(method)
+            self.__method_cost_label.configure(text='Cost: {}, transform updates: {}'.format(
+                method_info.cost_class, 'yes' if method_info.supports_transform else 'no'))
+
+    def on_PCA_solver_change(self):
+        if self.__changed_config:
+            self.__changed_config['PCA_config']['solver'] = self.__PCA_solver_var.get()
+            self.show_PCA_components_option()
+            self.apply_PCA_options()
+
+    def show_PCA_components_option(self):
+        # Počet počítaných komponentov má význam len pri randomizovanom a inkrementálnom PCA, úplné PCA počíta všetky.
+        if self.__PCA_solver_var.get() == 'full':
+            self.__PCA_components_label.grid_remove()
+        else:
+            self.__PCA_components_label.grid()
+
+    def on_tSNE_landmark_check(self):
+        if self.__changed_config:
+            t_sne_config = self.__changed_config['t_SNE_config']
+            landmark_config = dict(t_sne_config['landmark_config'], enabled=self.__tSNE_landmark.get())
+            if not self.check_method_parameters(get_method('t-SNE'), t_sne_config['used_config'], landmark_config):
+                self.__tSNE_landmark_check.deselect()
+                return
+            t_sne_config['landmark_config']['enabled'] = landmark_config['enabled']
+            self.apply_t_SNE_landmark_options()
+
+    def check_method_parameters(self, method, parameters, landmark_config=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Overenie parametrov metódy ešte pred spustením výpočtu (napr. TSNE vyžaduje perplexitu menšiu ako počet
+        vzoriek). Pri chybe je jej dôvod zobrazený pod možnosťami metódy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param method:          metóda z registra
+        :param parameters:      parametre, ktoré majú byť použité
+        :param landmark_config: nastavenia landmark režimu, ktoré majú byť použité, None ak ich metóda nemá
+        :return: True, ak je možné metódu s týmito parametrami spustiť
+        """
+        number_of_samples = self.__active_layer.get_number_of_samples(landmark_config)
+        message = method.check_parameters(parameters, number_of_samples)
+        if message is None:
+            return True
+        self.__method_error_label.configure(text=message)
+        return False
+
+    def validate_landmark_entry(self, id, value):
+        try:
+            landmark_config = self.__changed_config['t_SNE_config']['landmark_config']
+            test_tuple = landmark_config['parameter_borders'][id]
+            if not (test_tuple[0] <= test_tuple[1](value) <= test_tuple[2]):
+                self.__tSNE_landmark_dict[id].set_entry_text('err')
+                return False
+            new_landmark_config = dict(landmark_config)
+            new_landmark_config[id] = test_tuple[1](value)
+            t_sne_parameters = self.__changed_config['t_SNE_config']['used_config']
+            if not self.check_method_parameters(get_method('t-SNE'), t_sne_parameters, new_landmark_config):
+                self.__tSNE_landmark_dict[id].set_entry_text('err')
+                return False
+            parameter_label = self.__tSNE_landmark_dict[id]
+            parameter_label.set_variable_label(value)
+            parameter_label.show_variable_label()
+            landmark_config[id] = test_tuple[1](value)
+            if landmark_config['enabled']:
+                self.apply_t_SNE_landmark_options()
+            return True
+        except ValueError:
+            self.__tSNE_landmark_dict[id].set_entry_text('err')
+            return False
+
+    def apply_t_SNE_landmark_options(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Ak je t-SNE práve použitá metóda, zmena landmark režimu je aplikovaná hneď. Nastavenia t-SNE sú zobrazené, len
+        ak je t-SNE zvolená metóda.
+        """
+        if self.__changed_config['used_method'] == self.__changed_config['config_selected_method']:
+            self.__changed_config['apply_changes'] = True
+            self.__active_layer.use_config()
+            self.start_status_updates()
+
+    def on_tSNE_cancel(self):
+        if self.__active_layer is not None:
+            self.__active_layer.cancel_t_SNE()
+            self.start_status_updates()
+
+    def start_status_updates(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Naplánuje zobrazovanie stavu výpočtu, ak ešte nie je naplánované. Volá sa z hlavného vlákna tkinter pri
+        udalostiach, ktoré môžu spustiť nový výpočet.
+        """
+        if self.__status_update_id is None:
+            self.update_calculation_status()
+
+    def update_calculation_status(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zobrazenie priebehu výpočtu t-SNE a chyby metódy z registra aktívnej vrstvy. Výpočty bežia v iných vláknach,
+        preto je ich stav čítaný z hlavného vlákna tkinter. Zobrazenie je znova naplánované, len kým t-SNE beží alebo
+        kým monitorovacie vlákno nespracovalo zmeny, ktoré môžu výpočet spustiť.
+        """
+        self.__status_update_id = None
+        method_error = self.__active_layer.method_error if self.__active_layer is not None else None
+        self.__method_error_label.configure(text='' if method_error is None else method_error)
+        progress = self.__active_layer.t_SNE_progress if self.__active_layer is not None else None
+        if progress is not None:
+            self.__tSNE_progress_label.configure(text='Iteration {}/{}'.format(*progress))
+            self.__tSNE_cancel_btn.configure(state='normal')
+        else:
+            error = self.__active_layer.t_SNE_error if self.__active_layer is not None else None
+            self.__tSNE_progress_label.configure(text='' if error is None else 't-SNE failed: {}'.format(error))
+            self.__tSNE_cancel_btn.configure(state='disabled')
+        if progress is not None or self.__graph_logic.has_pending_changes:
+            self.__status_update_id = self.after(T_SNE_PROGRESS_INTERVAL, self.update_calculation_status)
+
+    def on_tSNE_warm_start_check(self):
+        if self.__changed_config:
+            self.__changed_config['t_SNE_config']['warm_start'] = self.__tSNE_warm_start.get()
+
+    def on_PCA_freeze_check(self):
+        if self.__changed_config:
+            self.__changed_config['PCA_config']['freeze_basis'] = self.__PCA_freeze_basis.get()
+
+    def on_PCA_refit(self):
+        if self.__changed_config:
+            self.__active_layer.reset_method_model(self.__changed_config['config_selected_method'])
+            self.apply_PCA_options()
+
+    def apply_PCA_options(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Ak je PCA práve použitá metóda, zmena možností výpočtu PCA je aplikovaná hneď. Možnosti PCA sú zobrazené, len
+        ak je PCA zvolená metóda.
+        """
+        if self.__changed_config['used_method'] == self.__changed_config['config_selected_method']:
+            self.__changed_config['apply_changes'] = True
+            self.__active_layer.use_config()
+            self.update_PCA_information()
+            self.set_cords_entries_according_chosen_method()
 
     def on_color_label(self):
         if self.__changed_config:
@@ -1241,45 +1648,55 @@ class OptionsFrame(tk.LabelFrame):
             self.__changed_config['draw_3d'] = self.__3d_graph.get()
             self.__active_layer.use_config()
 
-    def validate_t_sne_entry(self, id, value):
+    def validate_method_entry(self, method_name, id, value):
+        parameters_dict = self.__method_parameters_dicts[method_name]
         try:
-            test_tuple = self.__changed_config['t_SNE_config']['parameter_borders'][id]
+            method = get_method(method_name)
+            method_config = method.get_layer_config(self.__changed_config)
+            test_tuple = method_config['parameter_borders'][id]
             if not (test_tuple[0] <= test_tuple[1](value) <= test_tuple[2]):
-                self.__tSNE_parameters_dict[id].set_entry_text('err')
+                parameters_dict[id].set_entry_text('err')
+                return False
+            new_options_config = dict(method_config['options_config'])
+            new_options_config[id] = test_tuple[1](value)
+            if not self.check_method_parameters(method, new_options_config, method_config.get('landmark_config')):
+                parameters_dict[id].set_entry_text('err')
                 return False
-            parameter_label = self.__tSNE_parameters_dict[id]
+            parameter_label = parameters_dict[id]
             parameter_label.set_variable_label(value)
             parameter_label.show_variable_label()
-            self.__changed_config['t_SNE_config']['options_config'][id] = test_tuple[1](value)
-            if self.__changed_config['t_SNE_config']['options_config'][id] == self.__changed_config['t_SNE_config']['used_config'][id]:
-                parameter_label.set_mark_changed(False)
-            else:
-                parameter_label.set_mark_changed(True)
+            method_config['options_config'][id] = test_tuple[1](value)
+            parameter_label.set_mark_changed(method_config['options_config'][id] != method_config['used_config'][id])
+            return True
+        except ValueError:
+            parameters_dict[id].set_entry_text('err')
+            return False
+
+    def validate_PCA_entry(self, id, value):
+        try:
+            pca_config = self.__changed_config['PCA_config']
+            test_tuple = pca_config['parameter_borders'][id]
+            if not (test_tuple[0] <= test_tuple[1](value) <= test_tuple[2]):
+                self.__PCA_components_label.set_entry_text('err')
+                return False
+            self.__PCA_components_label.set_variable_label(value)
+            self.__PCA_components_label.show_variable_label()
+            pca_config[id] = test_tuple[1](value)
+            self.apply_PCA_options()
             return True
         except ValueError:
-            self.__tSNE_parameters_dict[id].set_entry_text('err')
+            self.__PCA_components_label.set_entry_text('err')
             return False
 
     def validate_cord_entry(self, id, value):
         try:
-            bottom_border = 0
-            top_border = 0
-            changed_cords = None
-            if self.__currently_used_method == 'No method':
-                bottom_border = 0
-                top_border = self.__changed_config['number_of_dimensions']
-                changed_cords = self.__changed_config['no_method_config']['displayed_cords']
-                new_value = int(value)
-            elif self.__currently_used_method == 'PCA':
-                bottom_border = 1
-                top_border = min(self.__changed_config['number_of_dimensions'], self.__changed_config['number_of_samples']) + 1
-                changed_cords = self.__changed_config['PCA_config']['displayed_cords']
-                new_value = int(value) - 1
-            elif self.__currently_used_method == 't-SNE':
-                bottom_border = 0
-                top_border = self.__changed_config['t_SNE_config']['used_config']['n_components']
-                changed_cords = self.__changed_config['t_SNE_config']['displayed_cords']
-                new_value = int(value)
+            # Zobrazované súradnice sú zadávané od čísla prvého komponentu metódy, v configu sú uložené od 0.
+            method = get_method(self.__currently_used_method)
+            method_config = method.get_layer_config(self.__changed_config)
+            bottom_border = method.cord_offset
+            top_border = method_config['n_possible_components'] + method.cord_offset
+            changed_cords = method_config['displayed_cords']
+            new_value = int(value) - method.cord_offset
 
             if not (bottom_border <= int(value) < top_border):
                 self.__cords_entries_list[id].set_entry_text('err')
@@ -1306,27 +1723,18 @@ class OptionsFrame(tk.LabelFrame):
         self.__active_layer.use_config()
 
     def set_cords_entries_according_chosen_method(self):
-        if self.__currently_used_method == 'No method':
-            entry_names = ['Axis X:', 'Axis Y:', 'Axis Z:']
-            cords_label_text = 'Possible cords: 0-{}'.format(self.__changed_config['number_of_dimensions']-1)
-            displayed_cords = self.__changed_config['no_method_config']['displayed_cords']
-            possible_cords = self.__changed_config['max_visible_dim']
-        elif self.__currently_used_method == 'PCA':
-            entry_names = ['PC axis X:', 'PC axis Y:', 'PC axis Z:']
-            number_of_pcs = min(self.__changed_config['number_of_dimensions'],
-                                                                   self.__changed_config['number_of_samples'])
-            if number_of_pcs == 0:
-                cords_label_text = 'No possible PCs:'
-            else:
-                cords_label_text = 'Possible PCs: 1-{}'.format(number_of_pcs)
-            possible_cords = min(number_of_pcs, self.__changed_config['max_visible_dim'])
-            displayed_cords = self.__changed_config['PCA_config']['displayed_cords'].copy()
-            displayed_cords = np.array(displayed_cords) + 1
-        elif self.__currently_used_method == 't-SNE':
-            entry_names = ['t-SNE X:', 't-SNE Y:', 't-SNE Z:']
-            possible_cords = self.__changed_config['t_SNE_config']['used_config']['n_components']
-            cords_label_text = 'Possible t-SNE components: 0-{}'.format(possible_cords - 1)
-            displayed_cords = self.__changed_config['t_SNE_config']['displayed_cords'].copy()
+        method = get_method(self.__currently_used_method)
+        method_config = method.get_layer_config(self.__changed_config)
+        entry_names = ['{} X:'.format(method.axis_name), '{} Y:'.format(method.axis_name),
+                       '{} Z:'.format(method.axis_name)]
+        number_of_components = method_config['n_possible_components']
+        if number_of_components == 0:
+            cords_label_text = 'No possible components'
+        else:
+            cords_label_text = 'Possible components: {}-{}'.format(method.cord_offset,
+                                                                   number_of_components - 1 + method.cord_offset)
+        possible_cords = min(number_of_components, self.__changed_config['max_visible_dim'])
+        displayed_cords = np.array(method_config['displayed_cords']) + method.cord_offset
         self.set_cords_entries(entry_names, cords_label_text, displayed_cords, possible_cords)
 
     def set_cords_entries(self, entry_name, cords_label_text, displayed_cords, possible_cords):
@@ -1344,7 +1752,7 @@ class OptionsFrame(tk.LabelFrame):
 
 
 class NeuralLayer:
-    def __init__(self, logicLayer: GraphLogicLayer, keras_layer: keras.layers.Layer,
+    def __init__(self, logicLayer: GraphLogicLayer, keras_layer: 'keras.layers.Layer',
                  layer_number: int, *args, **kwargs):
         '''
         Popis
@@ -1360,6 +1768,15 @@ class NeuralLayer:
         :var self.__point_cords: referencia na súradnice bodov v danej vrstve. (hodnoy sa menia v GraphLogicLayer)
         :var self.__displayed_cords: obsahuje súradnice, ktoré budú zobrazené v grafe. Referenciu na tento objekt
                                      obsahuje aj PlotingFrame
+        :var self.__activations_version: verzia aktivácií vrstvy z ActivationEngine, mení sa pri každej ich zmene.
+                                         Podľa nej sa zisťuje, či je výsledok redukcie priestoru ešte platný.
+        :var self.__t_SNE_previous: posledný výsledok t-SNE spolu s aktiváciami a parametrami, z ktorých bol vypočítaný.
+                                    Slúži ako počiatočné rozloženie pri malej zmene aktivácií.
+        :var self.__t_SNE_context: kontext práve bežiacej úlohy t-SNE vrstvy, výsledky iných úloh sú zahodené
+        :var self.__t_SNE_error: text chyby posledného výpočtu t-SNE alebo None
+        :var self.__method_caches: ku každej použitej metóde z registra je priradený jej fitnutý model, parametre,
+                                   projekcia a verzia aktivácií, z ktorých bola vypočítaná
+        :var self.__method_error: text chyby posledného výpočtu metódy z registra alebo None
 
         Parametre
         --------
@@ -1391,7 +1808,9 @@ class NeuralLayer:
 
         self.__calculate_polygon = False
 
-        self.__polygon_cords_tuples = None
+        self.__polygon_vertices_cords = None
+
+        self.__polygon_edges = None
 
         self.__layer_config = {}
 
@@ -1414,6 +1833,13 @@ class NeuralLayer:
         self.__visible = False
         self.__weights_changed = False
 
+        self.__activations_version = -1
+        self.__t_SNE_previous = None
+        self.__t_SNE_context = None
+        self.__t_SNE_error = None
+        self.__method_error = None
+        self.__method_caches = dict()
+
     def pack(self, *args, **kwargs):
         if self.__visible:
             self.__layer_wrapper.pack(*args, **kwargs)
@@ -1434,6 +1860,10 @@ class NeuralLayer:
         self.__layer_config = {}
         self.__computation_in_process = False
         self.__point_cords = np.array([[] for _ in range(self.__number_of_dimension)])
+        self.__activations_version = -1
+        self.__t_SNE_previous = None
+        self.__t_SNE_error = None
+        self.__method_caches = dict()
         self.__points_config = points_config
 
         # Počet súradníc ktoré sa majú zobraziť určíme ako menšie z dvojice čísel 3 a počet dimenzií, pretože max počet,
@@ -1444,18 +1874,12 @@ class NeuralLayer:
         self.__neuron_labels = []
         self.__pc_labels = []
         self.__points_method_cords = []
-        used_t_sne_components = []
-        used_no_method_cords = []
-        used_PCA_components = []
 
         for i in range(self.__number_of_dimension):
             self.__neuron_labels.append(f'Neuron{i}')
             self.__pc_labels.append(f'PC{i + 1}')
 
         for i in range(number_of_cords):
-            used_no_method_cords.append(i)
-            used_t_sne_components.append(i)
-            used_PCA_components.append(i)
             self.__axis_labels.append(axis_default_names[i])
 
         self.__layer_config['apply_changes'] = False
@@ -1475,106 +1899,329 @@ class NeuralLayer:
         self.__layer_config['used_method'] = 'No method'
         self.__layer_config['config_selected_method'] = 'No method'
 
-        no_method_config = {'displayed_cords': used_no_method_cords}
-        pca_config = {'displayed_cords': used_PCA_components,
-                      'n_possible_pc': 0,
-                      'percentage_variance': None,
-                      'largest_influence': None,
-                      'options_used_components': used_PCA_components.copy()}
-
-        number_t_sne_components = min(self.__number_of_dimension, 3)
-        used_config = {'n_components': number_t_sne_components, 'perplexity': 30, 'early_exaggeration': 12.0,
-                       'learning_rate': 200, 'n_iter': 1000}
-        parameter_borders = {'n_components': (1, int, number_t_sne_components),
-                             'perplexity': (0, float, float("inf")),
-                             'early_exaggeration': (0, float, 1000),
-                             'learning_rate': (float("-inf"), float, float("inf")),
-                             'n_iter': (250, int, float("inf"))
-                             }
-
-        t_sne_config = {'used_config': used_config, 'options_config': used_config.copy(),
-                        'parameter_borders': parameter_borders,
-                        'displayed_cords': used_t_sne_components}
-        self.__layer_config['no_method_config'] = no_method_config
-        self.__layer_config['PCA_config'] = pca_config
-        self.__layer_config['t_SNE_config'] = t_sne_config
+        # Config každej metódy z registra je vytvorený metódou, vstavané metódy ho majú pod vlastným kľúčom.
+        self.__layer_config['methods_config'] = dict()
+        for method in get_registered_methods():
+            method_config = method.create_config(self.__number_of_dimension)
+            if method.config_key is not None:
+                self.__layer_config[method.config_key] = method_config
+            else:
+                self.__layer_config['methods_config'][method.name] = method_config
+        self.__layer_config['PCA_config']['chunk_size'] = PCA_CHUNK_SIZE
+        self.__layer_config['t_SNE_config']['warm_start'] = True
+        self.__layer_config['t_SNE_config']['landmark_config'] = {
+            'enabled': False, 'n_landmarks': 2000, 'n_neighbors': 10,
+            'parameter_borders': {'n_landmarks': (2, int, float("inf")), 'n_neighbors': (1, int, 100)}}
 
         self.__layer_config['possible_polygon'] = False
         self.__layer_config['show_polygon'] = False
 
-    def apply_changes(self):
+    def apply_changes(self, is_cancelled=None):
         '''
         Popis
         --------
-        Aplikovanie zmien po prepočítaní súradníc.
+        Aplikovanie zmien po prepočítaní súradníc. Najprv je aktualizovaná projekcia (výpočtový stav), potom zobrazenie.
+
+        Parametre
+        --------
+        :param is_cancelled: funkcia, ktorá vráti True, ak bol výpočet nahradený novšou zmenou. Dlhé výpočty (t-SNE)
+                             ju testujú a zastarané výsledky zahodia.
         '''
-        # Je potrbné podľa navolených zobrazovaných súradníc priradiť z prepočítaných jednotlivé súradnice do súradníc
-        # zobrazovaných.
-        self.set_used_cords()
         if self.__has_points:
-            used_method = self.__layer_config['used_method']
-            if used_method == 'No method':
-                self.apply_no_method()
-            elif used_method == 'PCA':
-                self.apply_PCA()
-            elif used_method == "t-SNE":
-                self.apply_t_SNE()
-            self.set_points_for_graph()
+            if self.update_projection(is_cancelled):
+                self.update_view()
+
+    def update_projection(self, is_cancelled=None):
+        '''
+        Popis
+        --------
+        Výpočtový stav vrstvy: z aktivácií a parametrov zvolenej metódy vypočíta projekciu všetkých komponentov.
+        Výsledok nezávisí od nastavení zobrazenia (zobrazované komponenty, popisy osí, 3D, farby, mriežka).
+
+        Parametre
+        --------
+        :param is_cancelled: funkcia, ktorá vráti True, ak bol výpočet nahradený novšou zmenou
+        :return: True, ak je projekcia k dispozícii a je možné ju zobraziť
+        '''
+        # Všetky metódy sú počítané cez register metód. Metóda, ktorá beží na pozadí (t-SNE), má vlastnú cache
+        # a zobrazuje výsledok priebežne.
+        method = get_method(self.__layer_config['used_method'])
+        if method.runs_in_background:
+            return self.apply_t_SNE(is_cancelled)
+        self.cancel_t_SNE()
+        self.__method_error = None
+        return self.apply_method(method)
+
+    def update_view(self):
+        '''
+        Popis
+        --------
+        Stav zobrazenia vrstvy: z už vypočítanej projekcie vyberie zobrazované komponenty. Reduktory nie sú volané.
+        '''
+        self.set_used_cords()
+        self.set_points_for_graph()
 
     def set_points_for_graph(self):
-        used_method = self.__layer_config['used_method']
         self.set_displayed_cords()
-        if used_method == 'No method':
+        # Mriežku vstupov je možné zobraziť, len ak sú projekciou samotné aktivácie.
+        if get_method(self.__layer_config['used_method']).identity:
             self.set_displayed_cords_for_polygon()
 
     def set_used_cords(self):
-        used_method = self.__layer_config['used_method']
-        if used_method == 'No method':
-            self.__used_cords = self.__layer_config['no_method_config']['displayed_cords']
-        elif used_method == 'PCA':
-            self.__used_cords = self.__layer_config['PCA_config']['displayed_cords']
-        elif used_method == 't-SNE':
-            self.__used_cords = self.__layer_config['t_SNE_config']['displayed_cords']
+        method = get_method(self.__layer_config['used_method'])
+        self.__used_cords = method.get_layer_config(self.__layer_config)['displayed_cords']
 
     def set_displayed_cords_for_polygon(self):
-        if self.__polygon_cords_tuples is not None:
+        if self.__polygon_vertices_cords is not None:
             if self.__graph_frame is not None:
-                tmp1 = self.__polygon_cords_tuples[0][self.__used_cords].transpose()
-                tmp2 = self.__polygon_cords_tuples[1][self.__used_cords].transpose()
-                self.__graph_frame.plotting_frame.line_tuples = list(zip(tmp1, tmp2))
+                # Hrany sú vytvorené indexovaním zobrazovaných súradníc vrcholov, výsledok má tvar
+                # (počet hrán, 2, počet zobrazovaných súradníc).
+                vertices = self.__polygon_vertices_cords[self.__used_cords].transpose()
+                self.__graph_frame.plotting_frame.line_tuples = vertices[self.__polygon_edges]
 
     def set_displayed_cords(self):
         self.__graph_frame.plotting_frame.points_cords = self.__points_method_cords[self.__used_cords]
 
-    def apply_no_method(self):
-        #self.__used_cords = self.__layer_config['no_method_config']['displayed_cords']
-        self.__points_method_cords = self.__point_cords[self.__used_cords]
+    def apply_method(self, method):
+        '''
+        Popis
+        --------
+        Použitie metódy z registra. Ak sa aktivácie ani parametre nezmenili, je použitá uložená projekcia. Pri metódach,
+        ktorých model nezávisí od hodnôt dát, a pri zmrazenej báze sú nové aktivácie len premietnuté už fitnutým
+        modelom. Osi grafu sa tak pri zmene váh nemenia a výpočet je len jedno maticové násobenie.
 
-    def apply_PCA(self):
-        pca_config = self.__layer_config['PCA_config']
-        #self.__used_cords = pca_config['displayed_cords']
+        Parametre
+        --------
+        :param method: metóda z registra
+        :return: True, ak bola projekcia vypočítaná
+        '''
+        method_config = method.get_layer_config(self.__layer_config)
+        parameters = method.get_fit_parameters(method_config)
+        cache = self.__method_caches.get(method.name)
+        same_model = cache is not None and cache['parameters'] == parameters
+        if same_model and cache['version'] == self.__activations_version:
+            self.__points_method_cords = cache['projection']
+            return True
         points_cords = self.__point_cords.transpose()
-        scaled_data = preprocessing.StandardScaler().fit_transform(points_cords)
-        pca = PCA()
-        pca.fit(scaled_data)
-        pca_data = pca.transform(scaled_data)
-        pcs_components_transpose = pca_data.transpose()
-        self.__points_method_cords = pcs_components_transpose
-        number_of_pcs_indexes = min(self.__number_of_dimension, pca.explained_variance_ratio_.size)
-        if number_of_pcs_indexes > 0:
-            self.__layer_config['PCA_config']['percentage_variance'] = pd.Series(
-                np.round(pca.explained_variance_ratio_ * 100, decimals=1), index=self.__pc_labels[:number_of_pcs_indexes])
-            self.__layer_config['PCA_config']['largest_influence'] = pd.Series(pca.components_[0], index=self.__neuron_labels)
-
-    def apply_t_SNE(self):
+        # Ak sú projekciou samotné aktivácie, výsledok je pohľad na ne, preto nie je počítaný v procese.
+        run_projection = (self.__logic_layer.run_projection if not method.identity
+                          else lambda function, *args: function(*args))
+        model = cache['model'] if same_model else None
+        keep_model = method.supports_transform and (method.data_independent_fit or method_config.get('freeze_basis'))
+        if keep_model and method.accepts_model(model, points_cords):
+            projection = run_projection(transform_reduction_method, points_cords, method.name, model)
+        else:
+            labels = list(self.__points_config['label']) if method.needs_labels else None
+            try:
+                model, projection = run_projection(fit_reduction_method, points_cords, method.name, parameters, labels)
+            except ValueError as error:
+                self.__method_error = '{} failed: {}'.format(method.name, error)
+                return False
+            self.set_variance_information(method, method_config, model, points_cords)
+        self.__method_caches[method.name] = {'parameters': parameters, 'version': self.__activations_version,
+                                             'model': model, 'projection': projection}
+        # Skutočný počet komponentov môže byť menší ako požadovaný (napr. pri LDA je najviac počet labels - 1). Počet
+        # zobrazovaných osí je obmedzený počtom komponentov, aby nebola rovnaká os zobrazená viackrát.
+        number_of_components = projection.shape[0]
+        method_config['n_possible_components'] = number_of_components
+        displayed_cords = method_config['displayed_cords']
+        number_of_axes = min(len(displayed_cords), number_of_components)
+        valid_cords = list(dict.fromkeys(cord for cord in displayed_cords if cord < number_of_components))
+        unused_cords = [cord for cord in range(number_of_components) if cord not in valid_cords]
+        displayed_cords[:] = (valid_cords + unused_cords)[:number_of_axes]
+        self.__points_method_cords = projection
+        return True
+
+    def set_variance_information(self, method, method_config, model, points_cords):
+        '''
+        Popis
+        --------
+        Uloženie informácií o fitnutom modeli (vysvetlená variabilita komponentov, váhy neurónov v prvom komponente)
+        do configu metódy, ak ich metóda poskytuje.
+        '''
+        variance_information = method.get_variance_information(model)
+        if variance_information is None:
+            return
+        variance_ratio, loading_scores = variance_information
+        max_number_of_components = min(points_cords.shape)
+        number_of_components = min(self.__number_of_dimension, variance_ratio.size)
+        if number_of_components > 0:
+            variance_series = pd.Series(np.round(variance_ratio[:number_of_components] * 100, decimals=1),
+                                        index=self.__pc_labels[:number_of_components])
+            # Nevypočítané komponenty spolu vysvetľujú zvyšok variability. Ide o odhad, pomer variability je pri
+            # randomizovanom SVD počítaný voči celkovej variabilite dát.
+            if number_of_components < max_number_of_components:
+                tail_label = '{}-{} (approx.)'.format(self.__pc_labels[number_of_components],
+                                                      self.__pc_labels[max_number_of_components - 1])
+                tail_variance = max(0.0, 100 - variance_ratio.sum() * 100)
+                variance_series[tail_label] = round(tail_variance, 1)
+            method_config['percentage_variance'] = variance_series
+            method_config['largest_influence'] = pd.Series(loading_scores, index=self.__neuron_labels)
+
+    def apply_t_SNE(self, is_cancelled=None):
+        '''
+        Popis
+        --------
+        Použitie metódy t-SNE. Ak výsledok nie je v cache, je spustený výpočet v samostatnom procese a rozloženie je
+        zobrazované priebežne, ako výpočet konverguje.
+
+        Parametre
+        --------
+        :param is_cancelled: funkcia, ktorá vráti True, ak bol výpočet nahradený novšou zmenou
+        :return: True, ak je výsledok k dispozícii hneď, inak False
+        '''
         t_sne_config = self.__layer_config['t_SNE_config']
         #self.__used_cords = t_sne_config['displayed_cords']
+        if is_cancelled is not None and is_cancelled():
+            return False
         points_cords = self.__point_cords.transpose()
-        number_of_components = t_sne_config['used_config']['n_components']
-        tsne = TSNE(**t_sne_config['used_config'])
-        transformed_cords = tsne.fit_transform(points_cords).transpose()
-        print(transformed_cords)
-        self.__points_method_cords = transformed_cords
+        # Výsledok t-SNE je pri pevnom random_state daný aktiváciami a parametrami, preto je uložený v cache podľa ich
+        # hashu. Opakované zobrazenie alebo návrat k predchádzajúcim váham tak nevyžaduje nový výpočet.
+        t_sne_cache = self.__logic_layer.t_SNE_cache
+        landmark_config = t_sne_config['landmark_config']
+        number_of_points = points_cords.shape[0]
+        use_landmarks = landmark_config['enabled'] and landmark_config['n_landmarks'] < number_of_points
+        cache_parameters = dict(t_sne_config['used_config'])
+        if use_landmarks:
+            cache_parameters.update(n_landmarks=landmark_config['n_landmarks'],
+                                    n_neighbors=landmark_config['n_neighbors'])
+        cache_key = t_sne_cache.make_key(points_cords, cache_parameters)
+        transformed_cords = t_sne_cache.get(cache_key)
+        if transformed_cords is not None:
+            self.cancel_t_SNE()
+            self.__t_SNE_previous = {'activations': points_cords.copy(), 'embedding': transformed_cords,
+                                     'parameters': dict(t_sne_config['used_config'])}
+            self.__points_method_cords = transformed_cords
+            return True
+        parameters = dict(t_sne_config['used_config'])
+        initial_cords = self.get_t_SNE_warm_start(points_cords) if t_sne_config['warm_start'] else None
+        if initial_cords is not None:
+            # Pri malej zmene aktivácií je t-SNE spustené z predchádzajúceho rozloženia, bez zveličenia na začiatku
+            # a s menším počtom iterácií. Rozloženie sa tak mení plynulo. Výsledok závisí od predchádzajúceho
+            # výpočtu, preto nie je ukladaný do cache.
+            parameters['n_iter'] = min(parameters['n_iter'], T_SNE_WARM_START_ITERATIONS)
+        context = {'cache_key': None if initial_cords is not None else cache_key,
+                   'activations': points_cords.copy(),
+                   'parameters': dict(t_sne_config['used_config']),
+                   'landmarks': None}
+        t_sne_data = points_cords
+        if use_landmarks:
+            # t-SNE je počítané len pre podmnožinu bodov, v ktorej sú labels zastúpené rovnomerne. Ostatné body sú
+            # umiestnené ako vážený priemer najbližších landmarkov v priestore aktivácií.
+            labels = self.__points_config['label']
+            if len(labels) != number_of_points:
+                labels = np.zeros(number_of_points)
+            landmark_indexes = stratified_sample(labels, landmark_config['n_landmarks'], parameters['random_state'])
+            t_sne_data = points_cords[landmark_indexes]
+            neighbor_indexes, neighbor_weights = knn_interpolation_weights(t_sne_data, points_cords,
+                                                                           landmark_config['n_neighbors'])
+            context['landmarks'] = (neighbor_indexes, neighbor_weights)
+            if initial_cords is not None:
+                initial_cords = initial_cords[landmark_indexes]
+        self.__t_SNE_error = None
+        self.__t_SNE_context = context
+        self.__logic_layer.background_t_SNE.start(self, t_sne_data, parameters, initial_cords, self.on_t_SNE_embedding,
+                                                  self.on_t_SNE_error, context)
+        # V hlavnom vlákne spustí slučku snímkov, v monitorovacom vlákne ju drží nespracovaná zmena.
+        render_scheduler.wake()
+        return False
+
+    def on_t_SNE_embedding(self, embedding, finished, context):
+        '''
+        Popis
+        --------
+        Spracovanie priebežného alebo konečného výsledku t-SNE. Volané z vlákna, ktoré prijíma výsledky výpočtu.
+
+        Parametre
+        --------
+        :param embedding: rozloženie v tvare (počet komponentov, počet vzoriek)
+        :param finished: True, ak ide o konečný výsledok
+        :param context: informácie o spustenom výpočte (kľúč do cache, aktivácie, parametre, susedia landmarkov)
+        '''
+        # Výsledok mohol prísť až po zrušení alebo nahradení úlohy.
+        if context is not self.__t_SNE_context:
+            return
+        if context['landmarks'] is not None:
+            embedding = interpolate_embedding(embedding.transpose(), *context['landmarks']).transpose()
+        if finished:
+            self.__t_SNE_context = None
+            if context['cache_key'] is not None:
+                self.__logic_layer.t_SNE_cache.put(context['cache_key'], embedding)
+            self.__t_SNE_previous = {'activations': context['activations'], 'embedding': embedding,
+                                     'parameters': context['parameters']}
+        if get_method(self.__layer_config['used_method']).runs_in_background and self.__graph_frame is not None:
+            self.__points_method_cords = embedding
+            self.update_view()
+            self.redraw_graph_if_active()
+
+    def get_point_activations(self, point):
+        '''
+        Popis
+        --------
+        Aktivácie neurónov vrstvy pre bod so zadaným indexom. Používa sa pri zvýraznení bodu v grafe.
+
+        Parametre
+        --------
+        :param point: index bodu
+        :return: list dvojíc (názov neurónu, aktivácia), prázdny ak bod neexistuje
+        '''
+        point_cords = self.__point_cords
+        if point_cords.ndim != 2 or point >= point_cords.shape[1]:
+            return []
+        return list(zip(self.__neuron_labels, point_cords[:, point].tolist()))
+
+    def get_number_of_samples(self, landmark_config=None):
+        '''
+        Popis
+        --------
+        Počet vzoriek, pre ktoré by bola metóda počítaná so zadanými nastaveniami landmark režimu.
+        '''
+        number_of_points = self.__point_cords.shape[1] if self.__point_cords.ndim == 2 else 0
+        if landmark_config is not None and landmark_config['enabled']:
+            return min(number_of_points, landmark_config['n_landmarks'])
+        return number_of_points
+
+    def on_t_SNE_error(self, message, context):
+        '''
+        Popis
+        --------
+        Zapamätanie chyby výpočtu t-SNE, ktorá je zobrazená v možnostiach vrstvy. Volané z vlákna, ktoré prijíma
+        výsledky výpočtu.
+        '''
+        if context is not self.__t_SNE_context:
+            return
+        self.__t_SNE_context = None
+        self.__t_SNE_error = message
+
+    def cancel_t_SNE(self):
+        self.__t_SNE_context = None
+        self.__logic_layer.background_t_SNE.cancel(self)
+
+    def get_t_SNE_warm_start(self, points_cords):
+        '''
+        Popis
+        --------
+        Ak sa aktivácie od posledného výpočtu t-SNE s rovnakými parametrami zmenili len málo, vráti predchádzajúci
+        výsledok ako počiatočné rozloženie.
+
+        Parametre
+        --------
+        :param points_cords: aktuálne aktivácie v tvare (počet vzoriek, počet neurónov)
+        :return: počiatočné rozloženie v tvare (počet vzoriek, počet komponentov) alebo None
+        '''
+        previous = self.__t_SNE_previous
+        if previous is None or previous['parameters'] != self.__layer_config['t_SNE_config']['used_config']:
+            return None
+        previous_activations = previous['activations']
+        if previous_activations.shape != points_cords.shape:
+            return None
+        previous_norm = np.linalg.norm(previous_activations)
+        if previous_norm == 0:
+            return None
+        relative_change = np.linalg.norm(points_cords - previous_activations) / previous_norm
+        if relative_change > T_SNE_WARM_START_THRESHOLD:
+            return None
+        return previous['embedding'].transpose()
 
     def clear(self):
         '''
@@ -1582,6 +2229,7 @@ class NeuralLayer:
         --------
         Používat sa pri mazaní. Vyčistí premenné a skryje danú vrstvu.
         '''
+        self.cancel_t_SNE()
         if self.__visible:
             self.__graph_frame.clear()
             self.__layer_options_container.destroy()
@@ -1627,12 +2275,14 @@ class NeuralLayer:
         self.use_config()
         self.apply_changes()
 
-    def signal_change(self):
-        self.__logic_layer.signal_change_on_layer(self.__layer_number)
+    def signal_change(self, changed_parameter=None):
+        self.__logic_layer.signal_change_on_layer(self.__layer_number, changed_parameter)
 
     def set_polygon_cords(self):
+        # Zobrazenie mriežky je zmena zobrazenia, projekcia bodov nie je prepočítaná.
         self.__logic_layer.set_polygon_cords(self.__layer_number)
-        self.apply_changes()
+        if self.__has_points:
+            self.update_view()
 
     def require_graphs_redraw(self):
         self.__logic_layer.redraw_active_graphs(-1)
@@ -1641,16 +2291,32 @@ class NeuralLayer:
         if self.__graph_frame is not None:
             self.__graph_frame.redraw_graph()
 
+    def reset_method_model(self, method_name):
+        '''
+        Popis
+        --------
+        Zahodenie fitnutého modelu metódy (napr. zmrazenej bázy PCA), pri najbližšom použití metódy bude model
+        fitnutý znova.
+        '''
+        self.__method_caches.pop(method_name, None)
+
     def use_config(self):
+        '''
+        Popis
+        --------
+        Použitie configu vrstvy. Príznak apply_changes označuje zmenu výpočtového stavu (metóda, jej parametre), len vtedy
+        je prepočítaná projekcia. Ostatné zmeny (zobrazované komponenty, popisy osí, 3D, farby, uzamknutie pohľadu,
+        mriežka) menia len zobrazenie.
+        '''
         if self.__visible:
             if self.__layer_config['apply_changes']:
-                print('zmenene')
                 self.apply_changes()
                 self.__layer_config['cords_changed'] = False
                 self.__layer_config['apply_changes'] = False
             elif self.__layer_config['cords_changed']:
-                self.set_used_cords()
-                self.set_points_for_graph()
+                if self.__has_points:
+                    self.update_view()
+                self.__layer_config['cords_changed'] = False
             self.__graph_frame.apply_config(self.__layer_config)
 
     def __del__(self):
@@ -1660,6 +2326,18 @@ class NeuralLayer:
     def layer_name(self):
         return self.__layer_name
 
+    @property
+    def t_SNE_progress(self):
+        return self.__logic_layer.background_t_SNE.progress(self)
+
+    @property
+    def t_SNE_error(self):
+        return self.__t_SNE_error
+
+    @property
+    def method_error(self):
+        return self.__method_error
+
     @layer_name.setter
     def layer_name(self, name):
         self.__layer_config['layer_name'] = name
@@ -1681,8 +2359,10 @@ class NeuralLayer:
     def points_cords(self):
         return self.__point_cords
 
-    @points_cords.setter
-    def point_cords(self, new_cords):
+    def set_point_cords(self, new_cords, activations_version):
+        # Verzia aktivácií pochádza z ActivationEngine a mení sa aj pri úprave aktivácií na mieste (zmena jednej váhy).
+        # Ak sa nezmenila, ide o tie isté aktivácie a uložené projekcie sú stále platné.
+        self.__activations_version = activations_version
         self.__point_cords = new_cords
         self.__layer_config['number_of_samples'] = len(new_cords.transpose())
         if self.__point_cords.size == 0:
@@ -1691,8 +2371,16 @@ class NeuralLayer:
             self.__has_points = True
 
     @property
-    def polygon_cords_tuples(self):
-        return self.__polygon_cords_tuples
+    def polygon_vertices_cords(self):
+        return self.__polygon_vertices_cords
+
+    @property
+    def polygon_edges(self):
+        return self.__polygon_edges
+
+    @polygon_edges.setter
+    def polygon_edges(self, new_edges):
+        self.__polygon_edges = new_edges
 
     @property
     def possible_polygon(self):
@@ -1702,14 +2390,13 @@ class NeuralLayer:
     def possible_polygon(self, value):
         self.__layer_config['possible_polygon'] = value
 
-    @polygon_cords_tuples.setter
-    def polygon_cords_tuples(self, new_cords_tuples):
-        self.__polygon_cords_tuples = new_cords_tuples
-        if self.__polygon_cords_tuples is not None:
+    @polygon_vertices_cords.setter
+    def polygon_vertices_cords(self, new_vertices_cords):
+        self.__polygon_vertices_cords = new_vertices_cords
+        if self.__polygon_vertices_cords is not None:
             self.__layer_config['possible_polygon'] = True
         else:
             self.__layer_config['possible_polygon'] = False
-            self.__displayed_lines_cords = None
 
     @property
     def layer_weights(self):
@@ -1787,17 +2474,22 @@ class GraphFrame(tk.LabelFrame):
         self.__neural_layer = None
         self.__graph = None
 
-    def controller_signal(self):
+    def controller_signal(self, changed_parameter=None):
         """
         Popis
         --------
         Posúva signál o zmene váhy neurónovej vrstve.
+
+        Parametre
+        --------
+        :param changed_parameter: zmenená váha ('weight', začiatočný neurón, koncový neurón) alebo bias
+                                  ('bias', koncový neurón), None ak nie je známe, čo sa zmenilo
         """
 
-        self.__neural_layer.signal_change()
+        self.__neural_layer.signal_change(changed_parameter)
 
     def apply_config(self, config):
-        if config['used_method'] == 'No method':
+        if get_method(config['used_method']).identity:
             self.__graph.draw_polygon = config['show_polygon']
         else:
             self.__graph.draw_polygon = False
@@ -1807,6 +2499,9 @@ class GraphFrame(tk.LabelFrame):
         self.__graph.set_color_label(config['color_labels'])
         self.redraw_graph()
 
+    def get_point_activations(self, point):
+        return self.__neural_layer.get_point_activations(point)
+
     @property
     def plotting_frame(self):
         return self.__graph
@@ -1815,8 +2510,10 @@ class GraphFrame(tk.LabelFrame):
         self.__neural_layer.require_graphs_redraw()
 
 
-app = VisualizationApp()
-app.mainloop()
+# Výpočty v samostatných procesoch môžu tento modul importovať znova, aplikácia preto nesmie byť spustená pri importe.
+if __name__ == '__main__':
+    app = VisualizationApp()
+    app.mainloop()
 
 
 
@@ -3,13 +3,161 @@ matplotlib.use('TkAgg')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 from matplotlib import backend_bases
+from matplotlib.collections import LineCollection
 import mpl_toolkits.mplot3d as plt3d
 from mpl_toolkits.mplot3d import proj3d
-import matplotlib.animation as animation
 from GraphicalComponents import *
+from collections import OrderedDict
+import threading
+import time
 import numpy as np
+from scipy.spatial import cKDTree
 
 BASIC_POINT_COLOUR = '#04B2D9'
+# Polomer v pixeloch, v ktorom je okolo kurzora hľadaný najbližší bod grafu.
+PICK_RADIUS = 3
+# Najväčší počet neurónov, ktorých aktivácie sú vypísané v texte zvýrazneného bodu.
+TOOLTIP_MAX_NEURONS = 10
+# Čas medzi snímkami prekresľovania grafov v milisekundách.
+RENDER_FRAME_INTERVAL = 33
+# Čas v sekundách, ktorý môžu prekreslenia všetkých grafov v jednom snímku spolu spotrebovať.
+RENDER_FRAME_BUDGET = 0.03
+
+
+class RenderScheduler:
+    def __init__(self, frame_interval=RENDER_FRAME_INTERVAL, frame_budget=RENDER_FRAME_BUDGET):
+        '''
+        Popis
+        --------
+        Spoločný plánovač prekresľovania všetkých grafov. Grafy, ktoré sa zmenili, sú označené ako neaktuálne (aj z
+        iného vlákna) a prekreslené v najbližšom snímku v hlavnom vlákne tkinter. Každý graf je v jednom snímku
+        prekreslený najviac raz, viacero zmien medzi snímkami je zlúčených do jedného prekreslenia.
+        Snímky plánuje cez after len hlavné vlákno a len kým je čo prekresľovať. Označenie grafu v hlavnom vlákne
+        naplánuje snímok, ak ešte nie je naplánovaný. Iné vlákna tkinter nevolajú, graf len pridajú do zoznamu. Grafy
+        z iných vlákien sú označované len počas výpočtu (zmeny váh, t-SNE), preto slučka pokračuje, kým výpočet beží
+        podľa funkcie is_busy, a skončí, keď výpočet nebeží a zoznam neaktuálnych grafov je prázdny.
+
+        Atribúty
+        --------
+        :var self.__frame_interval: čas medzi snímkami v ms
+        :var self.__frame_budget: čas v sekundách, ktorý môžu všetky grafy v jednom snímku spolu spotrebovať. Grafy,
+                                  na ktoré sa nedostalo, sú prekreslené v nasledujúcom snímku ako prvé.
+        :var self.__dirty_graphs: neaktuálne grafy v poradí, v ktorom budú prekreslené
+        :var self.__lock: chráni zoznam neaktuálnych grafov
+        :var self.__root: hlavné okno aplikácie, na ktorom je volané after. Nastavené v hlavnom vlákne pri vytvorení
+                          prvého grafu.
+        :var self.__frame_scheduled: či je snímok naplánovaný, mení sa len v hlavnom vlákne
+        :var self.__is_busy: funkcia, ktorá vráti True, kým beží výpočet, ktorý môže grafy označiť z iného vlákna
+        '''
+        self.__frame_interval = frame_interval
+        self.__frame_budget = frame_budget
+        self.__dirty_graphs = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__root = None
+        self.__frame_scheduled = False
+        self.__is_busy = None
+
+    def attach(self, root):
+        """
+        Popis
+        --------
+        Nastavenie hlavného okna aplikácie, na ktorom sú plánované snímky. Volá sa len z hlavného vlákna tkinter,
+        ďalšie volania nemajú účinok.
+
+        Parametre
+        --------
+        :param root: hlavné okno aplikácie
+        """
+        if self.__root is None:
+            self.__root = root
+            self.wake()
+
+    def set_busy_check(self, is_busy):
+        """
+        Popis
+        --------
+        Nastavenie funkcie, ktorá vráti True, kým beží výpočet, ktorý môže grafy označiť z iného vlákna. Kým vráti
+        True, slučka snímkov beží aj pri prázdnom zozname neaktuálnych grafov.
+        """
+        self.__is_busy = is_busy
+
+    def mark_dirty(self, graph):
+        """
+        Popis
+        --------
+        Označenie grafu na prekreslenie. Je možné volať z ľubovoľného vlákna. V hlavnom vlákne je naplánovaný snímok,
+        v inom vlákne sa mení len zoznam neaktuálnych grafov.
+
+        Parametre
+        --------
+        :param graph: graf, ktorý má metódu render
+        """
+        with self.__lock:
+            self.__dirty_graphs[graph] = None
+        self.wake()
+
+    def discard(self, graph):
+        with self.__lock:
+            self.__dirty_graphs.pop(graph, None)
+
+    def wake(self):
+        """
+        Popis
+        --------
+        Naplánuje snímok, ak nie je naplánovaný a je neaktuálny graf alebo beží výpočet. Volá sa z hlavného vlákna
+        pri začatí výpočtu, v inom vlákne nemá účinok.
+        """
+        if self.__root is None or self.__frame_scheduled or threading.current_thread() is not threading.main_thread():
+            return
+        # Stav výpočtu je zistený skôr ako stav zoznamu. Výpočet označí grafy skôr, ako skončí, graf označený po
+        # skončení výpočtu je tak v zozname už nájdený.
+        is_busy = self.__is_busy is not None and self.__is_busy()
+        with self.__lock:
+            has_dirty_graphs = len(self.__dirty_graphs) > 0
+        if is_busy or has_dirty_graphs:
+            self.__frame_scheduled = True
+            self.__root.after(self.__frame_interval, self.render_frame)
+
+    def render_frame(self):
+        """
+        Popis
+        --------
+        Snímok slučky v hlavnom vlákne. Nasledujúci snímok je naplánovaný, len ak je ešte čo prekresľovať, aj vtedy,
+        keď prekreslenie grafu zlyhá. Výnimka nie je zachytená, tkinter ju vypíše aj s tracebackom.
+        """
+        self.__frame_scheduled = False
+        try:
+            self.render_dirty_graphs()
+        finally:
+            self.wake()
+
+    def render_dirty_graphs(self):
+        """
+        Popis
+        --------
+        Prekreslenie neaktuálnych grafov v rámci časového rozpočtu snímku. Grafy sú zo zoznamu vyberané po jednom, grafy,
+        na ktoré sa nedostalo, ostávajú v zozname na začiatku a čakajú na ďalší snímok.
+        """
+        frame_start = time.perf_counter()
+        rendered_graphs = set()
+        while True:
+            with self.__lock:
+                if len(self.__dirty_graphs) == 0:
+                    return
+                graph, _ = self.__dirty_graphs.popitem(last=False)
+                # Graf označený znova počas snímku je prekreslený až v nasledujúcom snímku.
+                if graph in rendered_graphs:
+                    self.__dirty_graphs[graph] = None
+                    self.__dirty_graphs.move_to_end(graph, last=False)
+                    return
+            rendered_graphs.add(graph)
+            graph.render()
+            if time.perf_counter() - frame_start > self.__frame_budget:
+                return
+
+
+render_scheduler = RenderScheduler()
+
 
 class PlotingFrame:
     def __init__(self, parent, graph_frame, *args, **kwargs):
@@ -32,9 +180,23 @@ class PlotingFrame:
         :var self.__draw_2D: vyjadruje, či sa má graf vykresliť ako 2D
         :var self.__toolbar: matplotlib toolbar na posúvanie približovanie a podobne. Zobrazovaný len pri 2D. Pri 3D
                              je pohľad ovládaný myšou
-        :var self.__changed: pre efektívnejší update
-        :var self.__ani: animácia pre prekresľovanie grafu pri zmenách. Najjedoduchší spôsob pre interaktívne a
-                         dynamické grafy
+        :var self.__render_scheduler: spoločný plánovač, ktorý prekresľuje zmenené grafy v hlavnom vlákne
+        :var self.__points_artist: scatter bodov, vytvorený raz pri zmene dimenzie grafu a ďalej len aktualizovaný
+        :var self.__polygon_artist: všetky hrany mriežky v jednej kolekcii čiar
+        :var self.__label_artists: texty s labels označených bodov
+        :var self.__drawn_axis_texts: naposledy nastavený názov grafu a popisy osí, ich zmena vyžaduje celé prekreslenie
+        :var self.__background: uložené statické pozadie 2D grafu (osi, mriežka, popisy), na ktoré sú pri zmene dát
+                                prekreslené len body, čiary a texty
+        :var self.__fit_view: ak je True, rozsah osí bude pri najbližšom prekreslení nastavený podľa dát aj pri
+                              uzamknutom pohľade
+        :var self.__pick_index: KD strom súradníc bodov na obrazovke pre výber bodu myšou. Je vytvorený až pri prvom
+                                výbere a zahodený pri zmene dát alebo pohľadu (prekreslenie celého plátna).
+        :var self.__pick_point_indices: indexy bodov zodpovedajúce vrcholom KD stromu, body s neplatnými súradnicami
+                                        v strome nie sú
+        :var self.__highlight_artist: jediný text so šípkou, ktorý zobrazuje label a hodnoty bodu pod kurzorom
+        :var self.__hovered_point: index bodu pod kurzorom, -1 ak kurzor nie je nad žiadnym bodom
+        :var self.__artists_background: uložené plátno aj s nakreslenými bodmi, mriežkou a textami. Pri pohybe myši
+                                        je obnovené a nakreslený je naň len zvýraznený bod.
         '''
         self.__plot_wrapper_frame = ResizableWindow(parent, 'bottom', *args, **kwargs)
         self.__plot_wrapper_frame.pack(fill='both', expand=True)
@@ -62,9 +224,23 @@ class PlotingFrame:
         self.__canvas = FigureCanvasTkAgg(self.__figure, self.__graph_container)
         self.__canvas.draw()
         self.__canvas.mpl_connect('button_press_event', self.on_mouse_double_click)
+        self.__canvas.mpl_connect('draw_event', self.on_draw)
+        self.__canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
         self.__axis = None
         self.__draw_3D = False
 
+        self.__points_artist = None
+        self.__polygon_artist = None
+        self.__label_artists = []
+        self.__drawn_axis_texts = None
+        self.__background = None
+        self.__fit_view = True
+        self.__pick_index = None
+        self.__pick_point_indices = None
+        self.__highlight_artist = None
+        self.__hovered_point = -1
+        self.__artists_background = None
+
         backend_bases.NavigationToolbar2.toolitems = (
             ('Home', 'Reset original view', 'home', 'home'),
             ('Back', 'Back to  previous view', 'back', 'back'),
@@ -76,13 +252,12 @@ class PlotingFrame:
         self.__toolbar = NavigationToolbar2Tk(self.__canvas, self.__graph_container)
         self.__toolbar.update()
         self.__canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-        self.__changed = False
-        self.__change_in_progress = False
         self.__locked_view = True
-        self.__ani = animation.FuncAnimation(self.__figure, self.update_changed, interval=105)
+        self.__render_scheduler = render_scheduler
+        # Hlavné okno je zistené tu, v hlavnom vlákne. Plánovač ho neskôr z iných vlákien nevolá.
+        self.__render_scheduler.attach(self.__graph_container.winfo_toplevel())
 
     def initialize(self, displayed_cords, points_config: dict, layer_name: str):
-        self.__change_in_progress = False
         if len(displayed_cords) != 0:
             self.__cords = displayed_cords
         self.__graph_container.pack(side=tk.TOP)
@@ -105,122 +280,371 @@ class PlotingFrame:
             self.__different_points_colour.clear()
             self.__active_points_label.clear()
 
-            nearest_x = 3
-            nearest_y = 3
-            closest_point = -1
-            number_of_points = len(self.__cords[0])
-            X_point_cords = self.__cords[0]
-            if len(self.__cords) > 1:
-                Y_point_cords = self.__cords[1]
-            else:
-                Y_point_cords = np.zeros_like(self.__cords[0])
-
-            if self.__draw_3D:
-                if len(self.__cords) == 3:
-                    Z_point_cords = self.__cords[2]
-                else:
-                    Z_point_cords = np.zeros_like(self.__cords[0])
-            # Rychlejsie pocita ale prehadzuje riadky, neviem to vyriesit
-            for point in range(number_of_points):
-                if self.__draw_3D:
-                    x_2d, y_2d, _ = proj3d.proj_transform(X_point_cords[point], Y_point_cords[point],
-                                                          Z_point_cords[point], self.__axis.get_proj())
-                    pts_display = self.__axis.transData.transform((x_2d, y_2d))
-                else:
-                    pts_display = self.__axis.transData.transform((X_point_cords[point], Y_point_cords[point]))
-
-                if math.fabs(event.x - pts_display[0]) < 3 and math.fabs(event.y - pts_display[1]) < 3:
-                    if nearest_x > math.fabs(event.x - pts_display[0]) and nearest_y > math.fabs(
-                            event.y - pts_display[1]):
-                        nearest_x = math.fabs(event.x - pts_display[0])
-                        nearest_y = math.fabs(event.y - pts_display[1])
-                        closest_point = point
-
+            closest_point = self.find_point(event.x, event.y)
             if closest_point != -1:
                 self.__different_points_colour.append((closest_point, '#F25D27'))
                 if len(self.__points_label) > 0:
                     self.__active_points_label.append((closest_point, self.__points_label[closest_point]))
             self.__parent_controller.require_graphs_redraw()
 
+    def on_mouse_move(self, event):
+        """
+        Popis
+        --------
+        Zvýraznenie bodu pod kurzorom. Pri ťahaní myšou (posun, otáčanie 3D grafu) nie je bod hľadaný, pohľad sa mení a
+        KD strom by bol vytváraný pri každom pohybe.
+        """
+        if self.__axis is None or self.__highlight_artist is None:
+            return
+        if event.button is not None or event.inaxes is not self.__axis:
+            hovered_point = -1
+        else:
+            hovered_point = self.find_point(event.x, event.y)
+        if hovered_point != self.__hovered_point:
+            self.__hovered_point = hovered_point
+            self.blit_highlight()
+
+    def find_point(self, x, y):
+        """
+        Popis
+        --------
+        Nájdenie bodu najbližšieho k zadanej pozícii na obrazovke. Bod musí byť v oboch osiach vzdialený najviac
+        PICK_RADIUS pixelov.
+
+        :return: index bodu alebo -1, ak v okolí nie je žiadny bod
+        """
+        pick_index = self.get_pick_index()
+        if pick_index is None:
+            return -1
+        distance, index = pick_index.query((x, y), distance_upper_bound=PICK_RADIUS, p=np.inf)
+        if not np.isfinite(distance):
+            return -1
+        return int(self.__pick_point_indices[index])
+
+    def get_pick_index(self):
+        """
+        Popis
+        --------
+        Vrátenie KD stromu súradníc bodov na obrazovke. Ak bol zahodený, všetky body sú naraz premietnuté na obrazovku
+        a strom je vytvorený znova.
+        """
+        if self.__pick_index is None and self.__axis is not None:
+            display_cords = self.get_points_display_cords()
+            valid_points = np.all(np.isfinite(display_cords), axis=1)
+            if np.any(valid_points):
+                self.__pick_point_indices = np.flatnonzero(valid_points)
+                self.__pick_index = cKDTree(display_cords[valid_points])
+        return self.__pick_index
+
+    def invalidate_pick_index(self):
+        self.__pick_index = None
+        self.__pick_point_indices = None
+
+    def get_points_display_cords(self):
+        """
+        :return: súradnice bodov na obrazovke v pixeloch v tvare (počet bodov, 2)
+        """
+        x_axe_cords, y_axe_cords, z_axe_cords = self.get_points_axis_cords()
+        if self.__draw_3D:
+            x_axe_cords, y_axe_cords, _ = proj3d.proj_transform(x_axe_cords, y_axe_cords, z_axe_cords,
+                                                                self.__axis.get_proj())
+        return self.__axis.transData.transform(np.column_stack([x_axe_cords, y_axe_cords]))
+
     def change_graph_dimension(self):
         if self.__draw_3D:
             self.set_graph_dimension(2)
         else:
             self.set_graph_dimension(3)
 
-    def update_changed(self, i):
-        if self.__changed:
-            self.__changed = False
-            self.__change_in_progress = True
+    def update_graph(self):
+        """
+        Popis
+        --------
+        Vyžiadanie prekreslenia grafu. Je možné volať aj z iného vlákna, graf bude prekreslený v najbližšom snímku.
+        """
+        if self.__canvas is not None:
+            self.__render_scheduler.mark_dirty(self)
+
+    def render(self):
+        if self.__axis is not None:
             self.redraw_graph()
-            self.__change_in_progress = False
+
+    def redraw_graph(self):
+        """
+        Popis
+        --------
+        Prekreslenie grafu. Artists sú vytvorené pri zmene dimenzie grafu, tu sú len aktualizované ich dáta. Celé plátno
+        je prekreslené len pri zmene rozsahu osí alebo popisov, inak sú v 2D na uložené pozadie nakreslené len body,
+        mriežka a texty.
+        """
+        self.invalidate_pick_index()
+        x_axe_cords, y_axe_cords, z_axe_cords = self.get_points_axis_cords()
+        self.set_point_color()
+        if len(x_axe_cords) == len(self.__points_colour):
+            self.update_points_artist(x_axe_cords, y_axe_cords, z_axe_cords)
+            self.update_label_artists(x_axe_cords, y_axe_cords, z_axe_cords)
         else:
-            self.__ani.event_source.stop()
+            self.update_points_artist([], [], [])
+            self.update_label_artists([], [], [])
+        self.update_polygon_artist()
+        if self.__hovered_point >= len(x_axe_cords):
+            self.__hovered_point = -1
+
+        full_redraw = self.update_axis_texts()
+        if not self.__locked_view or self.__fit_view:
+            full_redraw = self.fit_view_to_data(x_axe_cords, y_axe_cords, z_axe_cords) or full_redraw
+            self.__fit_view = False
+
+        if self.__draw_3D or self.__background is None or full_redraw:
+            self.__canvas.draw()
+        else:
+            self.blit_artists()
 
-    def update_graph(self):
-        self.__changed = True
-        if not self.__change_in_progress:
-            if self.__ani is not None:
-                self.__ani.event_source.start()
+    def get_points_axis_cords(self):
+        """
+        Popis
+        --------
+        Súradnice bodov pre jednotlivé osi grafu. Chýbajúce súradnice sú nahradené nulami.
 
+        :return: trojica polí (x, y, z)
+        """
+        number_of_cords = len(self.__cords)
+        x_axe_cords = np.asarray(self.__cords[0], dtype=float)
+        y_axe_cords = np.asarray(self.__cords[1], dtype=float) if number_of_cords >= 2 else np.zeros_like(x_axe_cords)
+        z_axe_cords = np.asarray(self.__cords[2], dtype=float) if number_of_cords >= 3 else np.zeros_like(x_axe_cords)
+        return x_axe_cords, y_axe_cords, z_axe_cords
 
-    def redraw_graph(self):
-        if self.__locked_view:
-            tmpX = self.__axis.get_xlim()
-            tmpY = self.__axis.get_ylim()
-            if self.__number_of_dim == 3:
-                tmpZ = self.__axis.get_zlim()
-        self.__axis.clear()
+    def create_artists(self):
+        """
+        Popis
+        --------
+        Vytvorenie artists pre novo vytvorené osi. V 2D sú artists animované, nie sú súčasťou uloženého pozadia.
+        """
         self.__axis.grid()
+        if self.__draw_3D:
+            self.__polygon_artist = plt3d.art3d.Line3DCollection([], colors='black', linewidths=1, alpha=0.3)
+            self.__axis.add_collection3d(self.__polygon_artist)
+            self.__points_artist = self.__axis.scatter([], [], [])
+        else:
+            self.__polygon_artist = LineCollection([], colors='black', linewidths=1, alpha=0.5, animated=True)
+            self.__axis.add_collection(self.__polygon_artist, autolim=False)
+            self.__points_artist = self.__axis.scatter([], [], animated=True)
+        self.__highlight_artist = self.__axis.annotate('', (0, 0), xytext=(10, 10), textcoords='offset points',
+                                                       bbox=dict(boxstyle='round', fc='white', alpha=0.9),
+                                                       arrowprops=dict(arrowstyle='->'), animated=True,
+                                                       visible=False)
+        self.__hovered_point = -1
+        self.__artists_background = None
+        self.__label_artists = []
+        self.__drawn_axis_texts = None
+        self.__background = None
+        self.__fit_view = True
+
+    def update_points_artist(self, x_axe_cords, y_axe_cords, z_axe_cords):
+        if self.__draw_3D:
+            self.__points_artist._offsets3d = (x_axe_cords, y_axe_cords, z_axe_cords)
+        else:
+            self.__points_artist.set_offsets(np.column_stack([x_axe_cords, y_axe_cords]))
+        if len(x_axe_cords) > 0:
+            self.__points_artist.set_facecolor(self.__points_colour)
 
-        number_of_cords = len(self.__cords)
+    def update_label_artists(self, x_axe_cords, y_axe_cords, z_axe_cords):
+        """
+        Popis
+        --------
+        Aktualizácia textov s labels označených bodov. Existujúce texty sú presunuté, chýbajúce vytvorené a nadbytočné
+        odstránené.
+        """
+        active_points_label = self.__active_points_label if len(x_axe_cords) > 0 else []
+        for i, (point, label) in enumerate(active_points_label):
+            if i < len(self.__label_artists):
+                label_artist = self.__label_artists[i]
+                label_artist.set_text(label)
+                if self.__draw_3D:
+                    label_artist.set_position((x_axe_cords[point], y_axe_cords[point]))
+                    label_artist.set_3d_properties(z_axe_cords[point], None)
+                else:
+                    label_artist.xy = (x_axe_cords[point], y_axe_cords[point])
+            elif self.__draw_3D:
+                self.__label_artists.append(self.__axis.text(x_axe_cords[point], y_axe_cords[point],
+                                                             z_axe_cords[point], label))
+            else:
+                self.__label_artists.append(self.__axis.annotate(label, (x_axe_cords[point], y_axe_cords[point]),
+                                                                 animated=True))
+        for label_artist in self.__label_artists[len(active_points_label):]:
+            label_artist.remove()
+        del self.__label_artists[len(active_points_label):]
+
+    def update_polygon_artist(self):
+        """
+        Popis
+        --------
+        Nastavenie úsečiek kolekcie mriežky z poľa hrán v tvare (počet hrán, 2, počet súradníc). Chýbajúce súradnice
+        sú doplnené nulami.
+        """
+        polygon_segments = self.get_polygon_segments()
+        self.__polygon_artist.set_visible(polygon_segments is not None)
+        self.__polygon_artist.set_segments(polygon_segments if polygon_segments is not None else [])
+
+    def get_polygon_segments(self):
+        """
+        :return: hrany mriežky v tvare (počet hrán, 2, počet osí grafu) alebo None, ak mriežka nie je zobrazená
+        """
+        if not self.__draw_polygon or self.__line_cords_tuples is None or len(self.__line_cords_tuples) == 0:
+            return None
+        line_cords = np.asarray(self.__line_cords_tuples, dtype=float)
+        polygon_segments = np.zeros(line_cords.shape[:2] + (self.__number_of_dim,))
+        number_of_cords = min(self.__number_of_dim, line_cords.shape[2])
+        polygon_segments[:, :, :number_of_cords] = line_cords[:, :, :number_of_cords]
+        return polygon_segments
+
+    def update_axis_texts(self):
+        """
+        Popis
+        --------
+        Nastavenie názvu grafu a popisov osí, ak sa zmenili.
 
-        if self.__draw_polygon:
-            if self.__number_of_dim == 3:
-                for edge in self.__line_cords_tuples:
-                    xs = edge[0][0], edge[1][0]
-                    ys = edge[0][1], edge[1][1]
-                    zs = edge[0][2], edge[1][2]
-                    line = plt3d.art3d.Line3D(xs, ys, zs, color='black', linewidth=1, alpha=0.3)
-                    self.__axis.add_line(line)
-            if self.__number_of_dim == 2:
-                for edge in self.__line_cords_tuples:
-                    xs = edge[0][0], edge[1][0]
-                    if number_of_cords == 1:
-                        ys = 0, 0
-                    else:
-                        ys = edge[0][1], edge[1][1]
-
-                    self.__axis.plot(xs, ys, linestyle='-', color='black', linewidth=1, alpha=0.5)
-        x_axe_cords = self.__cords[0]
-        y_axe_cords = np.zeros_like(self.__cords[0])
-        z_axe_cords = np.zeros_like(self.__cords[0])
-        self.set_point_color()
+        :return: True, ak sa popisy zmenili a je potrebné prekresliť celé plátno
+        """
+        number_of_cords = len(self.__cords)
+        axis_texts = (self.__graph_title, tuple(self.__graph_labels), number_of_cords)
+        if axis_texts == self.__drawn_axis_texts:
+            return False
+        self.__drawn_axis_texts = axis_texts
         self.__axis.set_title(self.__graph_title)
         self.__axis.set_xlabel(self.__graph_labels[0])
-        if len(self.__cords[0]) == len(self.__points_colour):
-            if number_of_cords >= 2:
-                self.__axis.set_ylabel(self.__graph_labels[1])
-                y_axe_cords = self.__cords[1]
-                if number_of_cords > 2:
-                    z_axe_cords = self.__cords[2]
-                    if self.__draw_3D:
-                        self.__axis.set_zlabel(self.__graph_labels[2])
+        self.__axis.set_ylabel(self.__graph_labels[1] if number_of_cords >= 2 else '')
+        if self.__draw_3D:
+            self.__axis.set_zlabel(self.__graph_labels[2] if number_of_cords > 2 else '')
+        return True
 
-            if self.__draw_3D:
-                self.__axis.scatter(x_axe_cords, y_axe_cords, z_axe_cords, c=self.__points_colour)
-                for point in self.__active_points_label:
-                    self.__axis.text(x_axe_cords[point[0]], y_axe_cords[point[0]], z_axe_cords[point[0]], point[1])
-            else:
-                self.__axis.scatter(x_axe_cords, y_axe_cords, c=self.__points_colour)
-                for point in self.__active_points_label:
-                    self.__axis.annotate(point[1], (x_axe_cords[point[0]], y_axe_cords[point[0]]))
+    def fit_view_to_data(self, x_axe_cords, y_axe_cords, z_axe_cords):
+        """
+        Popis
+        --------
+        Nastavenie rozsahu osí podľa zobrazovaných bodov a mriežky. Osi nie sú vytvárané znova, preto rozsah nie je
+        nastavený automaticky.
+
+        :return: True, ak sa rozsah osí zmenil
+        """
+        axis_cords = [x_axe_cords, y_axe_cords, z_axe_cords][:self.__number_of_dim]
+        polygon_segments = self.get_polygon_segments()
+        if polygon_segments is not None:
+            for i in range(self.__number_of_dim):
+                axis_cords[i] = np.concatenate([axis_cords[i], polygon_segments[:, :, i].ravel()])
+        limits = []
+        for cords in axis_cords:
+            cords = np.asarray(cords, dtype=float)
+            cords = cords[np.isfinite(cords)]
+            if cords.size == 0:
+                limits.append((0.0, 1.0))
+                continue
+            low, high = cords.min(), cords.max()
+            margin = (high - low) * 0.05 if high > low else 0.5
+            limits.append((low - margin, high + margin))
+        if self.__draw_3D:
+            current_limits = [self.__axis.get_xlim3d(), self.__axis.get_ylim3d(), self.__axis.get_zlim3d()]
+        else:
+            current_limits = [self.__axis.get_xlim(), self.__axis.get_ylim()]
+        if all(np.allclose(limit, current) for limit, current in zip(limits, current_limits)):
+            return False
+        if self.__draw_3D:
+            self.__axis.set_xlim3d(limits[0])
+            self.__axis.set_ylim3d(limits[1])
+            self.__axis.set_zlim3d(limits[2])
+        else:
+            self.__axis.set_xlim(limits[0])
+            self.__axis.set_ylim(limits[1])
+        return True
+
+    def get_animated_artists(self):
+        return [self.__polygon_artist, self.__points_artist] + self.__label_artists
 
-        if self.__locked_view:
-            self.__axis.set_xlim(tmpX)
-            self.__axis.set_ylim(tmpY)
-            if self.__number_of_dim == 3:
-                self.__axis.set_zlim(tmpZ)
+    def on_draw(self, event):
+        """
+        Popis
+        --------
+        Po prekreslení celého plátna (zmena rozsahu, posun a priblíženie v toolbare, zmena veľkosti) je v 2D uložené
+        statické pozadie a sú na neho nakreslené animované artists. Pohľad sa mohol zmeniť, preto je zahodený KD strom
+        pre výber bodov. Nakoniec je nakreslený zvýraznený bod.
+        """
+        self.invalidate_pick_index()
+        if self.__axis is None or self.__points_artist is None:
+            self.__background = None
+            self.__artists_background = None
+            return
+        if self.__draw_3D:
+            self.__background = None
+        else:
+            self.__background = self.__canvas.copy_from_bbox(self.__figure.bbox)
+            for artist in self.get_animated_artists():
+                self.__axis.draw_artist(artist)
+        self.draw_highlight()
+
+    def blit_artists(self):
+        """
+        Popis
+        --------
+        Obnovenie uloženého pozadia a nakreslenie len animovaných artists.
+        """
+        self.__canvas.restore_region(self.__background)
+        for artist in self.get_animated_artists():
+            self.__axis.draw_artist(artist)
+        self.draw_highlight()
+        self.__canvas.blit(self.__figure.bbox)
+
+    def draw_highlight(self):
+        """
+        Popis
+        --------
+        Uloženie plátna s nakreslenými bodmi a nakreslenie zvýrazneného bodu navrch.
+        """
+        self.__artists_background = self.__canvas.copy_from_bbox(self.__figure.bbox)
+        self.update_highlight_artist()
+        self.__axis.draw_artist(self.__highlight_artist)
+
+    def blit_highlight(self):
+        """
+        Popis
+        --------
+        Prekreslenie len zvýrazneného bodu. Body, mriežka ani osi nie sú kreslené znova, obnovené je uložené plátno.
+        """
+        if self.__artists_background is None:
+            return
+        self.__canvas.restore_region(self.__artists_background)
+        self.update_highlight_artist()
+        self.__axis.draw_artist(self.__highlight_artist)
+        self.__canvas.blit(self.__figure.bbox)
+
+    def update_highlight_artist(self):
+        """
+        Popis
+        --------
+        Nastavenie textu a polohy zvýrazneného bodu. Text obsahuje label bodu a aktivácie neurónov vrstvy pre tento bod,
+        nie jeho súradnice po redukcii priestoru. Pri väčšom počte neurónov je vypísaných prvých TOOLTIP_MAX_NEURONS.
+        V 3D je poloha bodu premietnutá aktuálnym pohľadom.
+        """
+        point = self.__hovered_point
+        if point < 0 or point >= len(self.__cords[0]):
+            self.__highlight_artist.set_visible(False)
+            return
+        point_cords = [float(self.__cords[i][point]) for i in range(min(len(self.__cords), 3))]
+        text_lines = []
+        if len(self.__points_label) > point:
+            text_lines.append(str(self.__points_label[point]))
+        activations = self.__parent_controller.get_point_activations(point)
+        for neuron_label, value in activations[:TOOLTIP_MAX_NEURONS]:
+            text_lines.append('{}: {:.4g}'.format(neuron_label, value))
+        if len(activations) > TOOLTIP_MAX_NEURONS:
+            text_lines.append('... ({} more)'.format(len(activations) - TOOLTIP_MAX_NEURONS))
+        axis_cords = point_cords + [0.0] * (self.__number_of_dim - len(point_cords))
+        if self.__draw_3D:
+            x_2d, y_2d, _ = proj3d.proj_transform(*axis_cords, self.__axis.get_proj())
+            self.__highlight_artist.xy = (x_2d, y_2d)
+        else:
+            self.__highlight_artist.xy = tuple(axis_cords[:2])
+        self.__highlight_artist.set_text('\n'.join(text_lines))
+        self.__highlight_artist.set_visible(True)
 
     def set_graph_dimension(self, dimension: int):
         if dimension >= 3:
@@ -246,12 +670,12 @@ class PlotingFrame:
                 if not isinstance(item, tk.Label):
                     item.pack(side='left')
 
-        self.__changed = True
-        self.__ani.event_source.start()
+        self.create_artists()
+        self.update_graph()
 
     def clear(self):
         print('Cistime plott')
-        self.__ani.event_source.stop()
+        self.__render_scheduler.discard(self)
         self.__toolbar.destroy()
         self.__canvas.get_tk_widget().destroy()
         self.__figure.delaxes(self.__axis)
@@ -268,7 +692,6 @@ class PlotingFrame:
         self.__canvas = None
         self.__figure = None
         self.__axis = None
-        self.__ani = None
 
     def pack(self, *args, **kwargs):
         self.__plot_wrapper_frame.pack(*args, **kwargs)
@@ -414,7 +837,9 @@ class LayerWeightControllerFrame:
         slider = ModifiedClickableSlider(self.__scrollable_window.Frame, slider_name, self.remove_slider, from_=-1,
                                          to=1,
                                          resolution=0.01, digits=3,
-                                         text=slider_name, command=self.on_slider_change)
+                                         text=slider_name,
+                                         command=lambda value: self.on_slider_change(value, ('weight', start_neuron,
+                                                                                             end_neuron)))
         slider.set_variable(self.__weights_reference[start_neuron], end_neuron)
         slider.pack_propagate(0)
         slider.pack(fill='x', expand=True, padx=(0, 2), pady=0)
@@ -426,7 +851,8 @@ class LayerWeightControllerFrame:
         slider = ModifiedClickableSlider(self.__scrollable_window.Frame, slider_name, self.remove_slider, from_=-10,
                                          to=10,
                                          resolution=0.01, digits=3,
-                                         text=slider_name, command=self.on_slider_change)
+                                         text=slider_name,
+                                         command=lambda value: self.on_slider_change(value, ('bias', end_neuron)))
         slider.set_variable(self.__bias_reference, end_neuron)
         slider.pack(fill='x', expand=True, padx=(0, 2), pady=0)
         self.__active_slider_dict[slider_name] = slider
@@ -438,9 +864,10 @@ class LayerWeightControllerFrame:
         self.__add_slider_list.show_item(slider_id)
         self.addSlider_visibility_test()
 
-    def on_slider_change(self, value):
+    def on_slider_change(self, value, changed_parameter):
+        # Zmenený parameter je ('weight', začiatočný neurón, koncový neurón) alebo ('bias', koncový neurón).
         if not self.__disable_update:
-            self.__controller.controller_signal()
+            self.__controller.controller_signal(changed_parameter)
 
     def add_slider(self, slider_name: str):
         if slider_name not in self.__active_slider_dict.keys():
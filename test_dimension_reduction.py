@@ -0,0 +1,41 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('sklearn')
+
+from DimensionReductionComponents import DimensionReductionMethod, fit_reduction_method, get_method, stratified_sample, \
+    transform_reduction_method
+
+
+@pytest.mark.parametrize('number_of_classes', [3, 50, 500])
+def test_stratified_sample_keeps_budget(number_of_classes):
+    labels = np.random.default_rng(0).integers(0, number_of_classes, 1000)
+    selected = stratified_sample(labels, 100, random_state=0)
+    assert selected.size == 100
+    assert np.unique(selected).size == 100
+    if number_of_classes < 100:
+        assert np.unique(labels[selected]).size == number_of_classes
+
+
+def test_builtin_methods_dispatch_through_registry():
+    data = np.random.default_rng(1).standard_normal((40, 5))
+    _, identity = fit_reduction_method(data, 'No method', dict())
+    np.testing.assert_array_equal(identity, data.transpose())
+
+    parameters = {'solver': 'full', 'n_components': None, 'chunk_size': 16}
+    model, projection = fit_reduction_method(data, 'PCA', parameters)
+    assert projection.shape == (5, 40)
+    np.testing.assert_allclose(transform_reduction_method(data, 'PCA', model), projection)
+
+
+def test_methods_must_implement_fit():
+    with pytest.raises(TypeError):
+        DimensionReductionMethod('Custom')
+
+    pca = get_method('PCA')
+    pca_config = pca.create_config(5)
+    pca_config['chunk_size'] = 16
+    data = np.random.default_rng(2).standard_normal((40, 5))
+    model, projection = fit_reduction_method(data, pca.name, pca.get_fit_parameters(pca_config))
+    assert pca.accepts_model(model, data)
+    assert not pca.accepts_model(model, data[:, :4])
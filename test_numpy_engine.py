@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+keras = pytest.importorskip('tensorflow').keras
+
+from CalculationComponents import NUMPY_ACTIVATIONS, ActivationEngine, NumpyDenseLayer
+
+
+def create_dense_layer(activation, number_of_inputs=5, number_of_units=4):
+    """
+    Popis
+    --------
+    Keras vrstva Dense s náhodnými váhami a biasmi.
+    """
+    random_generator = np.random.default_rng(0)
+    layer = keras.layers.Dense(number_of_units, activation=activation)
+    layer.build((None, number_of_inputs))
+    weights = random_generator.standard_normal((number_of_inputs, number_of_units)).astype(np.float32)
+    biases = random_generator.standard_normal(number_of_units).astype(np.float32)
+    layer.set_weights([weights, biases])
+    return layer, weights, biases
+
+
+@pytest.mark.parametrize('activation_name', sorted(NUMPY_ACTIVATIONS))
+def test_numpy_dense_layer_matches_keras(activation_name):
+    layer, weights, biases = create_dense_layer(activation_name)
+    layer_input = np.random.default_rng(1).standard_normal((32, weights.shape[0])).astype(np.float32)
+    numpy_layer = NumpyDenseLayer(weights, biases, NUMPY_ACTIVATIONS[activation_name])
+    np.testing.assert_allclose(numpy_layer(layer_input), layer(layer_input).numpy(), rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.parametrize('activation_name', ['linear', 'relu'])
+def test_single_parameter_update_matches_full_recompute(activation_name):
+    model = keras.Sequential([keras.layers.Dense(4, activation=activation_name, input_shape=(3,)),
+                              keras.layers.Dense(2, activation='tanh')])
+    layer_parameters = [tuple(np.array(parameter) for parameter in layer.get_weights()) for layer in model.layers]
+    engine = ActivationEngine()
+    engine.initialize(model, layer_parameters)
+    engine.set_active_layers([1])
+    input_data = np.random.default_rng(2).standard_normal((64, 3)).astype(np.float32)
+    engine.set_input('input', input_data)
+    engine.get_activation('input', 1)
+
+    weights, biases = layer_parameters[0]
+    weights[1, 2] += 0.5
+    biases[3] -= 0.25
+    engine.weights_changed(0, {('weight', 1, 2), ('bias', 3)})
+
+    expected = NUMPY_ACTIVATIONS[activation_name](np.matmul(input_data, weights, dtype=np.float64) + biases)
+    np.testing.assert_allclose(engine.get_activation('input', 1), expected, rtol=1e-5, atol=1e-6)